@@ -2,36 +2,80 @@
 # Location: agent/
 # Description: LLM factory helpers based on ChatLiteLLM and Azure OpenAI
 
-"""LLM factory helpers based on ChatLiteLLM and Azure OpenAI."""
+"""LLM factory helpers based on ChatLiteLLM and Azure OpenAI.
+
+``litellm`` and ``langchain_litellm`` are heavy imports (provider SDKs,
+tokenizers, httpx), so they are deferred until the first LLM is built.
+Call :func:`preload_llm_imports` at process start to pay that cost on a
+background thread instead of inside the first request.
+"""
 
 from __future__ import annotations
 
-import litellm
-from langchain_litellm import ChatLiteLLM
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Type
 
 from src.config.settings import settings
 
-# Azure OpenAI may reject unsupported OpenAI-only params. This flag makes
-# LiteLLM strip anything the backend cannot understand automatically.
-litellm.drop_params = True
+if TYPE_CHECKING:
+    from langchain_litellm import ChatLiteLLM
+
+_import_lock = threading.Lock()
+_chat_model_cls: Optional[Type["ChatLiteLLM"]] = None
+
+
+def _configure_litellm(litellm) -> None:
+    """Apply process-wide LiteLLM settings; called once right after import."""
+
+    # Azure OpenAI may reject unsupported OpenAI-only params. This flag makes
+    # LiteLLM strip anything the backend cannot understand automatically.
+    litellm.drop_params = True
+
+
+def _load_chat_model_cls() -> Type["ChatLiteLLM"]:
+    """Import LiteLLM on first use and return the ChatLiteLLM class."""
 
+    global _chat_model_cls
+    if _chat_model_cls is None:
+        with _import_lock:
+            if _chat_model_cls is None:
+                import litellm
+                from langchain_litellm import ChatLiteLLM
 
-def create_llm() -> ChatLiteLLM:
+                _configure_litellm(litellm)
+                _chat_model_cls = ChatLiteLLM
+    return _chat_model_cls
+
+
+def preload_llm_imports() -> threading.Thread:
+    """Warm the LiteLLM imports on a daemon thread so the first request skips them."""
+
+    thread = threading.Thread(target=_load_chat_model_cls, name="litellm-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def create_llm(temperature: Optional[float] = None) -> "ChatLiteLLM":
     """Instantiate a configured ChatLiteLLM client."""
 
-    return ChatLiteLLM(
+    chat_model_cls = _load_chat_model_cls()
+    return chat_model_cls(
         model=settings.AZURE_MODEL,
-        temperature=settings.LLM_TEMPERATURE,
+        temperature=settings.LLM_TEMPERATURE if temperature is None else temperature,
         verbose=settings.LLM_VERBOSE,
     )
 
 
-def get_llm() -> ChatLiteLLM:
-    """Return a singleton LLM instance for reuse across requests."""
+@lru_cache(maxsize=1)
+def get_llm() -> "ChatLiteLLM":
+    """Return a singleton LLM instance for reuse across requests.
+
+    ``create_llm`` performs no network I/O, so the cached lookup is all the
+    synchronisation async callers need.
+    """
 
-    if not hasattr(get_llm, "_instance"):
-        get_llm._instance = create_llm()
-    return get_llm._instance  # type: ignore[attr-defined]
+    return create_llm()
 
 
-__all__ = ["get_llm", "create_llm"]
+__all__ = ["get_llm", "create_llm", "preload_llm_imports"]
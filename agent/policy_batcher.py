@@ -0,0 +1,210 @@
+# File: /agent/policy_batcher.py
+# Location: agent/
+# Description: Coalesces concurrent policy questions into batched RAG calls
+
+"""Coalesce concurrent policy questions into batched RAG calls.
+
+Questions submitted within a short window are grouped and answered through
+``PolicyQA.query_batch`` so the embedding request and the Milvus search are
+shared across the batch. Answers are also kept in a small exact-match LRU
+keyed on the normalised question, so repeated questions skip the pipeline
+entirely. The batcher owns a private event loop running on a
+daemon thread, which lets both async callers and sync LangChain tools (run in
+worker threads) submit questions without caring which loop they are on.
+At most ``settings.POLICY_MAX_CONCURRENCY`` batches run against the vector DB
+and LLM at once, so a burst of tool calls cannot trip backend rate limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
+
+from src.config.settings import settings
+from src.rag.retrieval.policy_qa import get_policy_qa
+
+MAX_WAIT_MS = 75
+BATCH_SIZE = 8
+EXACT_CACHE_SIZE = 512
+# Upper bound a caller waits for its answer (embedding + search + LLM)
+QUERY_TIMEOUT_S = 120.0
+
+
+def _normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+class PolicyQueryBatcher:
+    """Queue policy questions and answer them in small batches."""
+
+    __slots__ = (
+        "max_wait",
+        "batch_size",
+        "cache_size",
+        "_answers",
+        "_answers_lock",
+        "_loop",
+        "_queue",
+        "_semaphore",
+        "_tasks",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        max_wait_ms: int = MAX_WAIT_MS,
+        batch_size: int = BATCH_SIZE,
+        cache_size: int = EXACT_CACHE_SIZE,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.max_wait = max_wait_ms / 1000
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._answers: "OrderedDict[str, dict]" = OrderedDict()
+        self._answers_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.POLICY_MAX_CONCURRENCY))
+        self._tasks: set = set()
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop and worker on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    self._queue = asyncio.Queue()
+                    self._spawn(self._worker())
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=run, name="policy-batcher", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    def submit(self, question: str) -> Future:
+        """Queue a question and return a thread-safe future for its result dict."""
+        cached = self._cached(question)
+        if cached is not None:
+            future: Future = Future()
+            future.set_result(cached)
+            return future
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._enqueue(question), loop)
+
+    def _cached(self, question: str) -> Optional[dict]:
+        key = _normalize_question(question)
+        with self._answers_lock:
+            result = self._answers.get(key)
+            if result is not None:
+                self._answers.move_to_end(key)
+            return result
+
+    def _remember(self, question: str, result: dict) -> None:
+        """Keep successful answers in the exact-match LRU."""
+        if self.cache_size <= 0 or "error" in result:
+            return
+        key = _normalize_question(question)
+        with self._answers_lock:
+            self._answers[key] = result
+            self._answers.move_to_end(key)
+            while len(self._answers) > self.cache_size:
+                self._answers.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget cached answers (e.g. after new policy documents are ingested)."""
+        with self._answers_lock:
+            self._answers.clear()
+
+    async def aquery(self, question: str, timeout: Optional[float] = QUERY_TIMEOUT_S) -> dict:
+        """Answer a question from any event loop."""
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self.submit(question)), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Policy question not answered within {timeout:g}s") from None
+
+    def query(self, question: str, timeout: Optional[float] = QUERY_TIMEOUT_S) -> dict:
+        """Answer a question from synchronous code (blocks the calling thread up to *timeout*)."""
+        future = self.submit(question)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Policy question not answered within {timeout:g}s") from None
+
+    async def _enqueue(self, question: str) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((question, future))
+        return await future
+
+    async def _worker(self) -> None:
+        """Drain the queue into batches of up to ``batch_size`` questions."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Run each batch in its own task so the next window starts filling
+            # while this one waits on the embedding/vector/LLM round-trips.
+            self._spawn(self._run_batch(batch))
+
+    def _spawn(self, coro) -> None:
+        """Schedule *coro* on the batcher loop, keeping a strong task reference."""
+        task = asyncio.get_event_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        questions = [question for question, _ in batch]
+        error: Optional[Exception] = None
+        try:
+            async with self._semaphore:
+                results = await loop.run_in_executor(None, get_policy_qa().query_batch, questions)
+            # Answer every caller before caching, so a cache failure cannot strand one
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+            for question, result in zip(questions, results):
+                self._remember(question, result)
+        except Exception as e:
+            error = e
+        finally:
+            # Nothing may stay pending: a short result list or any failure above
+            # fails the remaining callers instead of leaving them waiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error or RuntimeError("Policy batch returned no answer for this question"))
+
+
+# Global batcher instance (lazy loaded)
+_batcher_instance: Optional[PolicyQueryBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_policy_batcher() -> PolicyQueryBatcher:
+    """Get or create the global policy question batcher."""
+    global _batcher_instance
+    if _batcher_instance is None:
+        with _batcher_lock:
+            if _batcher_instance is None:
+                _batcher_instance = PolicyQueryBatcher()
+    return _batcher_instance
+
+
+__all__ = ["PolicyQueryBatcher", "get_policy_batcher", "MAX_WAIT_MS", "BATCH_SIZE", "EXACT_CACHE_SIZE", "QUERY_TIMEOUT_S"]
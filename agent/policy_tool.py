@@ -6,13 +6,44 @@
 
 from __future__ import annotations
 
-from src.rag.retrieval.policy_qa import get_policy_qa
+import sys
 
+from agent.policy_batcher import get_policy_batcher
 
-def query_travel_policy(question: str) -> str:
+
+_DEFAULT_SOURCE_LABEL = sys.intern("Policy")
+
+
+def _format_policy_answer(result: dict) -> str:
+    """Format a PolicyQA result dictionary for tool output."""
+    answer = result.get("answer", "No answer generated")
+    sources = result.get("sources", [])
+
+    parts = [f"📋 Answer: {answer}\n"]
+
+    if sources:
+        # Resolve every field once up front; the f-string loop then only formats
+        rows = [
+            (i, source.get("metadata", _DEFAULT_SOURCE_LABEL), source.get("score", 0), source.get("text", "")[:100])
+            for i, source in enumerate(sources, 1)
+        ]
+        parts.append("📚 Policy Sources:")
+        parts.extend(
+            f"  {i}. [{metadata}] (Relevance: {score:.2%})\n     {preview}..."
+            for i, metadata, score, preview in rows
+        )
+
+    # Trailing "" keeps the final newline the += version produced
+    parts.append("")
+    return "\n".join(parts)
+
+
+async def query_travel_policy(question: str) -> str:
     """
     Query travel policy documents for policy-related questions.
 
+    Concurrent questions are coalesced into a single batched RAG call.
+
     Args:
         question: Question about travel policies
 
@@ -20,25 +51,18 @@ def query_travel_policy(question: str) -> str:
         Answer with relevant policy information
     """
     try:
-        qa_system = get_policy_qa()
-        result = qa_system.query(question)
-
-        # Format result for tool output
-        answer = result.get("answer", "No answer generated")
-        sources = result.get("sources", [])
+        result = await get_policy_batcher().aquery(question)
+        return _format_policy_answer(result)
 
-        formatted_output = f"📋 Answer: {answer}\n\n"
+    except Exception as e:
+        return f"❌ Error querying policy: {str(e)}"
 
-        if sources:
-            formatted_output += "📚 Policy Sources:\n"
-            for i, source in enumerate(sources, 1):
-                metadata = source.get("metadata", "Policy")
-                score = source.get("score", 0)
-                text_preview = source.get("text", "")[:100]
-                formatted_output += f"  {i}. [{metadata}] (Relevance: {score:.2%})\n"
-                formatted_output += f"     {text_preview}...\n"
 
-        return formatted_output
+def query_travel_policy_sync(question: str) -> str:
+    """Blocking variant of :func:`query_travel_policy` for sync tool paths."""
+    try:
+        result = get_policy_batcher().query(question)
+        return _format_policy_answer(result)
 
     except Exception as e:
         return f"❌ Error querying policy: {str(e)}"
@@ -48,8 +72,9 @@ def query_travel_policy(question: str) -> str:
 POLICY_RETRIEVAL_TOOL = {
     "name": "query_travel_policy",
     "description": "Query travel policy documents to answer policy-related questions. Use this for questions about entitlements, allowances, rules, and procedures.",
-    "function": query_travel_policy,
+    "function": query_travel_policy_sync,
+    "coroutine": query_travel_policy,
 }
 
 
-__all__ = ["query_travel_policy", "POLICY_RETRIEVAL_TOOL"]
+__all__ = ["query_travel_policy", "query_travel_policy_sync", "POLICY_RETRIEVAL_TOOL"]
@@ -10,10 +10,15 @@ agents and LLMs can rely on for consistent reasoning.
 
 from __future__ import annotations
 
+import importlib
+import re
+import sys
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, Final, List, Literal, NamedTuple, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer, SkipValidation, WithJsonSchema
+from pydantic_core import to_json as _core_to_json
 
 from models import CabinClass, TRFStatus, TravelType
 
@@ -67,9 +72,6 @@ class TRFStatusValues(str, Enum):
     COMPLETED = TRFStatus.COMPLETED.value
 
 
-
-
-
 class CabinClassValues(str, Enum):
     """String enum mirroring :class:`models.CabinClass`."""
 
@@ -79,6 +81,109 @@ class CabinClassValues(str, Enum):
     FIRST = CabinClass.FIRST.value
 
 
+# Value -> member maps built once so coercion is a single dict lookup.
+_TRF_STATUS_LOOKUP: Final[Dict[str, TRFStatusValues]] = {e.value: e for e in TRFStatusValues}
+_CABIN_CLASS_LOOKUP: Final[Dict[str, CabinClassValues]] = {e.value: e for e in CabinClassValues}
+
+
+def _enum_coercer(lookup: Dict[str, Any], error: str):
+    """Build a validator that maps a raw value (or mirrored enum) to its member."""
+
+    def coerce(value: Any) -> Any:
+        # Enum members (str-mixin ones included) hash by name, so a models.*
+        # member is looked up by its .value
+        result = lookup.get(getattr(value, "value", value))
+        if result is None:
+            raise ValueError(error)
+        return result
+
+    return coerce
+
+
+_to_trf_status = _enum_coercer(_TRF_STATUS_LOOKUP, ErrorCodes.INVALID_STATUS.value)
+_to_cabin_class = _enum_coercer(_CABIN_CLASS_LOOKUP, "invalid_cabin_class")
+
+TRFStatusField = Annotated[TRFStatusValues, BeforeValidator(_to_trf_status)]
+
+
+def _lower(value: Any) -> Any:
+    """Trim and case-fold raw strings before enum/literal matching; leave other inputs alone."""
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+# Single approval-level type shared by every approval model, in workflow order.
+ApproverLevel = Literal["irm", "srm", "buh", "ssuh", "bgh", "ssgh", "cfo", "travel_desk"]
+_APPROVER_LEVELS: Final[Tuple[str, ...]] = tuple(sys.intern(level) for level in get_args(ApproverLevel))
+
+# Lowercasing lives on the type rather than in per-model field validators,
+# so the models themselves stay free of decorator-based validation.
+TravelTypeField = Annotated[TravelTypeValues, BeforeValidator(_lower)]
+# Validators run last-listed first: case-fold, then map onto the enum member
+CabinClassField = Annotated[CabinClassValues, BeforeValidator(_to_cabin_class), BeforeValidator(_lower)]
+ApproverLevelField = Annotated[ApproverLevel, BeforeValidator(_lower)]
+
+
+ISO_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+_ISO_DATE_MATCH = re.compile(ISO_DATE_PATTERN).match
+
+
+def _iso_date(value: str) -> str:
+    """Shared check for every ``YYYY-MM-DD`` field, backed by one precompiled regex."""
+    if not _ISO_DATE_MATCH(value):
+        raise ValueError(ErrorCodes.INVALID_DATE_FORMAT.value)
+    return value
+
+
+# Runs after str coercion so ``str_strip_whitespace`` still applies first.
+IsoDate = Annotated[
+    str,
+    AfterValidator(_iso_date),
+    WithJsonSchema({"type": "string", "pattern": ISO_DATE_PATTERN}),
+]
+
+
+def _to_date(value: Any) -> Any:
+    """Parse ISO strings with the C-level ``date.fromisoformat``; pass other inputs through."""
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip())
+        except ValueError:
+            raise ValueError(ErrorCodes.INVALID_DATE_FORMAT.value) from None
+    return value
+
+
+# Parsed straight to ``datetime.date`` so tools get a date object, not a string to re-parse.
+DepartureDate = Annotated[date, BeforeValidator(_to_date)]
+
+
+# Constraints that recur across tool inputs, declared once. They stay as core
+# constraints (not Python validators) so they run inside pydantic-core and
+# still show up as minimum/maximum/minLength in the tool JSON schema.
+PositiveAmount = Annotated[float, Field(gt=0)]
+StarRating = Annotated[int, Field(ge=1, le=5)]
+RejectionReason = Annotated[str, Field(min_length=10)]
+
+
+# Shared model configs: one instance per flavour instead of an equal literal per class.
+# Response payloads are built once by the tools and never mutated field by
+# field, so assignment-time validation stays off explicitly. They are only
+# populated by our own code, so unknown keys are ignored rather than checked;
+# ``extra="forbid"`` is reserved for the LLM-facing ``_INPUT`` config.
+_OUTPUT = ConfigDict(extra="ignore", validate_assignment=False)
+# Row models in result/listing payloads are never mutated after construction,
+# so they are frozen, and instances handed to a parent are reused as-is.
+_OUTPUT_FROZEN = ConfigDict(extra="ignore", frozen=True, revalidate_instances="never")
+_ALLOW = ConfigDict(extra="allow")
+# Tool envelopes build their core schema on first use, so a process that never
+# calls a given tool never pays for its output schema.
+_TOOL_OUTPUT = ConfigDict(extra="allow", defer_build=True)
+# Frozen rows that also keep per-queue extras (e.g. earlier approval flags)
+_ALLOW_FROZEN = ConfigDict(extra="allow", frozen=True, revalidate_instances="never")
+# Defaults are trusted constants (e.g. CabinClassValues.ECONOMY); keep them
+# out of the validation pass explicitly so no subclass re-coerces them.
+_INPUT = ConfigDict(extra="forbid", populate_by_name=True, str_strip_whitespace=True, validate_default=False)
+
+
 # ============================================================================
 # BASE MODELS
 # ============================================================================
@@ -87,13 +192,13 @@ class CabinClassValues(str, Enum):
 class BaseToolInput(BaseModel):
     """Common configuration shared by tool input schemas."""
 
-    model_config = ConfigDict(extra="forbid", populate_by_name=True, str_strip_whitespace=True)
+    model_config = _INPUT
 
 
 class BaseToolOutput(BaseModel):
     """Common envelope returned by every tool."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _TOOL_OUTPUT
 
     success: bool = Field(..., description="True when the tool completed successfully.")
     message: str = Field(..., description="Human-readable summary of the outcome.")
@@ -109,11 +214,148 @@ class BaseToolOutput(BaseModel):
         None,
         description="Optional remediation tips an agent can present to the user.",
     )
-    data: Optional[Dict[str, Any]] = Field(
+    data: SkipValidation[Optional[Dict[str, Any]]] = Field(
         None,
         description="Structured payload for programmatic consumption.",
     )
 
+    @classmethod
+    def build_trusted(cls: Type[_ModelT], **data: Any) -> _ModelT:
+        """Build an envelope from trusted internal data without re-validating it.
+
+        Tool builders assemble their payloads from database rows and deterministic
+        code, so the full validation pass is pure overhead. Nested dicts are turned
+        into their declared sub-models via ``model_construct``; schemas that carry
+        validators still go through ``model_validate``.
+        """
+        return construct_trusted(cls, data)
+
+    @classmethod
+    def failure_json(
+        cls,
+        message: str,
+        error: Optional[ErrorCodes] = None,
+        error_details: Optional[str] = None,
+    ) -> str:
+        """Serialize a failure envelope without building a model.
+
+        Emits exactly what ``cls(success=False, ...).to_json()`` would for these
+        fields; every argument is internal, so there is nothing to validate.
+        """
+        payload: Dict[str, Any] = {"success": False, "message": message}
+        if error is not None:
+            payload["error"] = error
+        if error_details is not None:
+            payload["error_details"] = error_details
+        return _core_to_json(payload).decode()
+
+    @classmethod
+    def success_json(cls, message: str, data: Dict[str, Any]) -> str:
+        """Serialize a success envelope straight from a flat, trusted payload dict.
+
+        For hot read paths whose ``data`` is already in wire shape (plain
+        values, nested dicts instead of NamedTuples). ``None`` entries of
+        ``data`` are dropped as ``to_json`` would; nested values are written
+        as given.
+        """
+        payload = {key: value for key, value in data.items() if value is not None}
+        return _core_to_json({"success": True, "message": message, "data": payload}).decode()
+
+    def to_json(self) -> str:
+        """Serialize the tool response for the LLM/tool channel.
+
+        ``None`` fields are dropped: most payload fields are optional, and
+        sending them as ``null`` only costs serialization time and tokens.
+        Calls the compiled serializer directly rather than going through
+        ``model_dump_json``'s keyword plumbing; re-encoding a ``model_dump``
+        with orjson measured ~45% slower than this path.
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True).decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to UTF-8 JSON bytes via the compiled pydantic-core serializer.
+
+        Skips both the intermediate ``model_dump`` dict and the bytes->str decode
+        that ``model_dump_json`` performs, for callers that write to sockets/files.
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+
+# ============================================================================
+# TRUSTED CONSTRUCTION HELPERS
+# ============================================================================
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# model class -> (has_validators, {field_name: (nested_model, container)})
+# where container is None for a bare model, or ``list``/``dict`` for collections.
+_TRUSTED_PLANS: Dict[type, Tuple[bool, Dict[str, Tuple[Type[BaseModel], Optional[type]]]]] = {}
+
+
+def _nested_model(annotation: Any) -> Optional[Tuple[Type[BaseModel], Optional[type]]]:
+    """Return ``(model, container)`` when *annotation* wraps a BaseModel."""
+    origin = get_origin(annotation)
+    if origin is None:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation, None
+        return None
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if origin in (list, dict) and args:
+        inner = _nested_model(args[-1])
+        return (inner[0], origin) if inner and inner[1] is None else None
+    if origin is Union and len(args) == 1:
+        return _nested_model(args[0])
+    return None
+
+
+def _trusted_plan(model_cls: Type[BaseModel]) -> Tuple[bool, Dict[str, Tuple[Type[BaseModel], Optional[type]]]]:
+    """Walk ``model_fields`` once per class and cache the nested-model layout."""
+    plan = _TRUSTED_PLANS.get(model_cls)
+    if plan is None:
+        decorators = model_cls.__pydantic_decorators__
+        has_validators = bool(
+            decorators.field_validators or decorators.model_validators or decorators.validators
+        )
+        nested = {}
+        for name, field in model_cls.model_fields.items():
+            target = _nested_model(field.annotation)
+            if target is not None:
+                nested[name] = target
+        plan = _TRUSTED_PLANS[model_cls] = (has_validators, nested)
+    return plan
+
+
+def construct_trusted(model_cls: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """Recursively ``model_construct`` *model_cls* from trusted *data*.
+
+    Only use this for payloads produced by our own code; anything coming from
+    the LLM or the user must keep going through ``model_validate``.
+    """
+    has_validators, nested = _trusted_plan(model_cls)
+    if has_validators:
+        # Straight to the compiled validator; skips the model_validate wrapper
+        return model_cls.__pydantic_validator__.validate_python(data)
+    if nested:
+        data = dict(data)
+        for name, (sub_cls, container) in nested.items():
+            value = data.get(name)
+            if value is None:
+                continue
+            if container is list:
+                data[name] = [
+                    construct_trusted(sub_cls, item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            elif container is dict:
+                data[name] = {
+                    key: construct_trusted(sub_cls, item) if isinstance(item, dict) else item
+                    for key, item in value.items()
+                }
+            elif isinstance(value, dict):
+                data[name] = construct_trusted(sub_cls, value)
+    return model_cls.model_construct(**data)
+
 
 # ============================================================================
 # FLIGHT SEARCH SCHEMAS
@@ -123,12 +365,11 @@ class BaseToolOutput(BaseModel):
 class FlightSearchInput(BaseToolInput):
     origin_city: str = Field(..., description="City name or airport city for departure.")
     destination_city: str = Field(..., description="City name or airport city for arrival.")
-    departure_date: str = Field(
+    departure_date: IsoDate = Field(
         ...,
         description="Departure date in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    cabin_class: Optional[CabinClassValues] = Field(
+    cabin_class: Optional[CabinClassField] = Field(
         CabinClassValues.ECONOMY,
         description="Preferred cabin class; defaults to economy if omitted.",
     )
@@ -141,7 +382,7 @@ class FlightSearchInput(BaseToolInput):
 
 
 class FlightInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     flight_id: int = Field(..., description="Internal identifier of the flight inventory row.")
     flight_number: str = Field(..., description="Airline flight number (e.g., AI101).")
@@ -165,7 +406,7 @@ class FlightInfo(BaseModel):
 
 
 class FlightSearchParams(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     origin: str = Field(..., description="Origin city searched.")
     destination: str = Field(..., description="Destination city searched.")
@@ -174,7 +415,7 @@ class FlightSearchParams(BaseModel):
 
 
 class FlightSearchData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     flights: List[FlightInfo] = Field(..., description="List of matching flight options.")
     search_params: FlightSearchParams = Field(
@@ -196,25 +437,21 @@ class FlightSearchOutput(BaseToolOutput):
 
 class HotelSearchInput(BaseToolInput):
     city: str = Field(..., description="City where accommodation is needed.")
-    check_in_date: str = Field(
+    check_in_date: IsoDate = Field(
         ...,
         description="Check-in date in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    check_out_date: str = Field(
+    check_out_date: IsoDate = Field(
         ...,
         description="Check-out date in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
     room_type: Optional[str] = Field(
         None,
         description="Optional room category filter such as 'Executive Suite'.",
     )
-    min_rating: Optional[int] = Field(
+    min_rating: Optional[StarRating] = Field(
         None,
         description="Minimum hotel star rating (1-5).",
-        ge=1,
-        le=5,
     )
     limit: int = Field(
         10,
@@ -225,7 +462,7 @@ class HotelSearchInput(BaseToolInput):
 
 
 class RoomTypeInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     room_type: str = Field(..., description="Room category name (e.g., Deluxe King).")
     occupancy: int = Field(..., description="Maximum number of guests allowed in the room.")
@@ -235,7 +472,7 @@ class RoomTypeInfo(BaseModel):
 
 
 class HotelInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     hotel_id: int = Field(..., description="Internal identifier for the hotel record.")
     hotel_name: str = Field(..., description="Hotel property name.")
@@ -255,11 +492,22 @@ class HotelInfo(BaseModel):
     number_of_nights: int = Field(..., description="Total number of nights between check-in and check-out.")
 
 
+class HotelSearchParams(BaseModel):
+    model_config = _OUTPUT
+
+    city: str = Field(..., description="City that was searched.")
+    check_in: str = Field(..., description="Check-in date used for the search.")
+    check_out: str = Field(..., description="Check-out date used for the search.")
+    nights: int = Field(..., description="Number of nights between check-in and check-out.")
+    room_type: Optional[str] = Field(None, description="Room type filter, if any.")
+    min_rating: Optional[int] = Field(None, description="Minimum star rating filter, if any.")
+
+
 class HotelSearchData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     hotels: List[HotelInfo] = Field(..., description="List of hotels that meet the criteria.")
-    search_params: Dict[str, Any] = Field(
+    search_params: HotelSearchParams = Field(
         ..., description="Echo of the search inputs including city and number of nights."
     )
 
@@ -277,7 +525,7 @@ class HotelSearchOutput(BaseToolOutput):
 
 
 class TravelPlanEmployee(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     employee_id: str = Field(..., description="Unique employee identifier tied to the plan.")
     name: str = Field(..., description="Full name of the traveling employee.")
@@ -290,17 +538,15 @@ class TravelPlanInput(BaseToolInput):
     role: str = Field(..., description="Employee role or seniority information.")
     origin_city: str = Field(..., description="City of departure for the journey.")
     destination_city: str = Field(..., description="City where the trip ends or meetings occur.")
-    departure_date: str = Field(
+    departure_date: IsoDate = Field(
         ...,
         description="Departure date in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    return_date: Optional[str] = Field(
+    return_date: Optional[IsoDate] = Field(
         None,
         description="Optional return date in ISO format if a round trip is needed.",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    cabin_class: Optional[CabinClassValues] = Field(
+    cabin_class: Optional[CabinClassField] = Field(
         CabinClassValues.ECONOMY,
         description="Preferred cabin class for flights; defaults to economy.",
     )
@@ -308,25 +554,21 @@ class TravelPlanInput(BaseToolInput):
         None,
         description="City used for hotel search; defaults to destination city when omitted.",
     )
-    check_in_date: Optional[str] = Field(
+    check_in_date: Optional[IsoDate] = Field(
         None,
         description="Check-in date override in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    check_out_date: Optional[str] = Field(
+    check_out_date: Optional[IsoDate] = Field(
         None,
         description="Check-out date override in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
     room_type: Optional[str] = Field(
         None,
         description="Optional room category preference such as 'Suite' or 'Executive'.",
     )
-    min_rating: Optional[int] = Field(
+    min_rating: Optional[StarRating] = Field(
         None,
         description="Minimum acceptable hotel rating (1-5).",
-        ge=1,
-        le=5,
     )
     flight_limit: int = Field(
         5,
@@ -343,7 +585,7 @@ class TravelPlanInput(BaseToolInput):
 
 
 class TravelPlanData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     employee: TravelPlanEmployee = Field(..., description="Employee context echoed back to the agent.")
     flights: Optional[FlightSearchData] = Field(
@@ -376,24 +618,21 @@ class TRFDraftInput(BaseToolInput):
     employee_id: str = Field(..., description="Unique employee identifier initiating the request.")
     employee_name: str = Field(..., description="Full name of the employee travelling.")
     employee_email: str = Field(..., description="Official email address of the employee.")
-    travel_type: TravelTypeValues = Field(..., description="Whether the trip is domestic or international.")
+    travel_type: TravelTypeField = Field(..., description="Whether the trip is domestic or international.")
     purpose: str = Field(..., description="Business purpose or objective of the trip.")
     origin_city: str = Field(..., description="Departure city for the trip.")
     destination_city: str = Field(..., description="Arrival city for the trip.")
-    departure_date: str = Field(
+    departure_date: DepartureDate = Field(
         ...,
         description="Planned departure date in ISO format (YYYY-MM-DD).",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    return_date: Optional[str] = Field(
+    return_date: Optional[DepartureDate] = Field(
         None,
         description="Optional return date in ISO format if applicable.",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    estimated_cost: Optional[float] = Field(
+    estimated_cost: Optional[PositiveAmount] = Field(
         None,
         description="Estimated end-to-end travel cost in local currency.",
-        gt=0,
     )
     employee_phone: Optional[str] = Field(None, description="Contact number of the employee.")
     employee_department: Optional[str] = Field(None, description="Department initiating the request.")
@@ -404,23 +643,16 @@ class TRFDraftInput(BaseToolInput):
     srm_name: Optional[str] = Field(None, description="Second reporting manager name if applicable.")
     srm_email: Optional[str] = Field(None, description="Second reporting manager email address.")
 
-    @field_validator("travel_type", mode="before")
-    @classmethod
-    def normalize_travel_type(cls, value: Any) -> Any:
-        if isinstance(value, str):
-            return value.lower()
-        return value
-
 
 class TRFDraftData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     trf_number: str = Field(..., description="Temporary draft TRF number assigned.")
-    status: TRFStatusValues = Field(..., description="Current workflow state of the TRF.")
+    status: TRFStatusField = Field(..., description="Current workflow state of the TRF.")
     employee_name: str = Field(..., description="Name of the employee for quick reference.")
     travel: str = Field(..., description="Formatted origin to destination string.")
     departure: str = Field(..., description="Scheduled departure date string.")
-    next_steps: List[str] = Field(..., description="Suggested follow-up actions for the user.")
+    next_steps: Tuple[str, ...] = Field(..., description="Suggested follow-up actions for the user.")
 
 
 class TRFDraftOutput(BaseToolOutput):
@@ -430,18 +662,41 @@ class TRFDraftOutput(BaseToolOutput):
     )
 
 
+class TRFDraftBulkInput(BaseToolInput):
+    drafts: List[TRFDraftInput] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Draft TRFs to create together, e.g. one per leg of a multi-leg trip.",
+    )
+
+
+class TRFDraftBulkData(BaseModel):
+    model_config = _OUTPUT
+
+    total: int = Field(..., description="Number of drafts created.")
+    drafts: List[TRFDraftData] = Field(..., description="Created drafts, in request order.")
+
+
+class TRFDraftBulkOutput(BaseToolOutput):
+    data: Optional[TRFDraftBulkData] = Field(
+        None,
+        description="Details of every draft TRF created when successful.",
+    )
+
+
 class TRFSubmitInput(BaseToolInput):
     trf_number: str = Field(..., description="Draft TRF number that needs to be submitted.")
 
 
 class TRFSubmitData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     trf_number: str = Field(..., description="Final TRF number after submission.")
     previous_number: str = Field(..., description="Original draft TRF identifier before submission.")
-    status: TRFStatusValues = Field(..., description="New workflow status after submission.")
+    status: TRFStatusField = Field(..., description="New workflow status after submission.")
     submitted_at: str = Field(..., description="Timestamp when the draft was submitted.")
-    next_steps: List[str] = Field(..., description="Guidance on tracking the submitted TRF.")
+    next_steps: Tuple[str, ...] = Field(..., description="Guidance on tracking the submitted TRF.")
 
 
 class TRFSubmitOutput(BaseToolOutput):
@@ -456,7 +711,7 @@ class TRFListInput(BaseToolInput):
 
 
 class TRFDraftSummary(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     trf_number: str = Field(..., description="Draft TRF identifier.")
     travel: str = Field(..., description="Origin to destination summary.")
@@ -468,7 +723,7 @@ class TRFDraftSummary(BaseModel):
 
 
 class TRFListData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     employee_id: str = Field(..., description="Employee ID whose drafts are summarized.")
     total: int = Field(..., description="Total number of draft TRFs found.")
@@ -484,34 +739,93 @@ class TRFListOutput(BaseToolOutput):
 
 class TRFStatusInput(BaseToolInput):
     trf_number: str = Field(..., description="TRF number whose status is required.")
+    detail: bool = Field(
+        False,
+        description="Include every confirmed hotel and flight per booking; otherwise only booking totals.",
+    )
 
 
-class ApprovalInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+class ApprovalInfo(NamedTuple):
+    """One step of a TRF's approval chain.
 
-    role: str = Field(..., description="Approver role or designation (SRM/BUH/etc.).")
-    status: str = Field(..., description="Approval decision such as APPROVED or REJECTED.")
-    at: Optional[str] = Field(None, description="Timestamp of the approval action.")
-    comments: Optional[str] = Field(None, description="Comments supplied by the approver.")
+    A plain tuple rather than a model: a TRF carries up to eight of these and
+    they are only ever built from database columns, never from LLM input.
+    """
+
+    role: str  # Approver role or designation (SRM/BUH/etc.)
+    status: str  # Approval decision such as APPROVED or REJECTED
+    at: Optional[datetime] = None  # Timestamp of the approval action
+    comments: Optional[str] = None  # Comments supplied by the approver
+
+
+# pydantic emits NamedTuples as JSON arrays; keep approvals as objects on the wire.
+ApprovalList = Annotated[
+    List[ApprovalInfo],
+    PlainSerializer(lambda approvals: [approval._asdict() for approval in approvals]),
+]
+ApprovalMap = Annotated[
+    Dict[ApproverLevel, ApprovalInfo],
+    PlainSerializer(lambda approvals: {level: approval._asdict() for level, approval in approvals.items()}),
+]
+
+
+class ConfirmedHotelRecord(BaseModel):
+    model_config = _OUTPUT_FROZEN
+
+    confirmation_number: str = Field(..., description="Hotel booking confirmation number.")
+    hotel_name: Optional[str] = Field(None, description="Name of the booked hotel.")
+    check_in: str = Field(..., description="Check-in date (YYYY-MM-DD).")
+    check_out: str = Field(..., description="Check-out date (YYYY-MM-DD).")
+    final_cost: Optional[float] = Field(None, description="Final cost of the hotel stay.")
+
+
+class ConfirmedFlightRecord(BaseModel):
+    model_config = _OUTPUT_FROZEN
+
+    pnr: str = Field(..., description="Flight booking PNR.")
+    flight_number: Optional[str] = Field(None, description="Booked flight number.")
+    cabin_class: Optional[str] = Field(None, description="Cabin class of the booking.")
+    departure_date: Optional[str] = Field(None, description="Flight departure date (YYYY-MM-DD).")
+    origin_city: Optional[str] = Field(None, description="Flight origin city.")
+    destination_city: Optional[str] = Field(None, description="Flight destination city.")
+    final_fare: Optional[float] = Field(None, description="Final fare paid for the flight.")
+
+
+class TravelBookingRecord(BaseModel):
+    model_config = _OUTPUT_FROZEN
+
+    booking_number: str = Field(..., description="Travel booking reference number.")
+    status: str = Field(..., description="Booking status (pending, confirmed, ...).")
+    total_cost: Optional[float] = Field(None, description="Total cost across all bookings.")
+    total_hotel_cost: Optional[float] = Field(None, description="Total hotel cost.")
+    total_flight_cost: Optional[float] = Field(None, description="Total flight cost.")
+    confirmed_hotels: List[ConfirmedHotelRecord] = Field(
+        default_factory=list, description="Confirmed hotel bookings."
+    )
+    confirmed_flights: List[ConfirmedFlightRecord] = Field(
+        default_factory=list, description="Confirmed flight bookings."
+    )
+    booked_at: Optional[str] = Field(None, description="When the booking was made (YYYY-MM-DD HH:MM:SS).")
+    confirmed_at: Optional[str] = Field(None, description="When the booking was confirmed (YYYY-MM-DD HH:MM:SS).")
 
 
 class TRFStatusData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     trf_number: str = Field(..., description="TRF identifier being looked up.")
     status: str = Field(..., description="Current workflow state of the TRF.")
     employee: str = Field(..., description="Employee name associated with the TRF.")
     travel: str = Field(..., description="Formatted travel route summary.")
-    departure: str = Field(..., description="Scheduled departure date in ISO format.")
-    approvals: List[ApprovalInfo] = Field(
+    departure: date = Field(..., description="Scheduled departure date in ISO format.")
+    approvals: ApprovalList = Field(
         default_factory=list,
         description="Approval history with timestamps and comments.",
     )
     rejection_reason: Optional[str] = Field(
         None, description="Reason for rejection if the TRF was rejected."
     )
-    created: str = Field(..., description="TRF creation date in ISO format.")
-    travel_bookings: List[Dict[str, Any]] = Field(
+    created: date = Field(..., description="TRF creation date in ISO format.")
+    travel_bookings: List[TravelBookingRecord] = Field(
         default_factory=list,
         description="Confirmed travel booking records with hotel/flight confirmations."
     )
@@ -530,10 +844,17 @@ class EmployeeTRFListInput(BaseToolInput):
         None,
         description="Optional status filter such as 'pending', 'approved', or a specific state.",
     )
+    limit: int = Field(
+        25,
+        description="Max number of TRFs to return, newest first (default 25, max 100)",
+        ge=1,
+        le=100
+    )
+    offset: int = Field(0, description="Number of TRFs to skip, for paging through history.", ge=0)
 
 
 class EmployeeTRFSummary(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
 
     trf_number: str = Field(..., description="TRF identifier.")
     status: str = Field(..., description="Current status string for the TRF.")
@@ -544,11 +865,13 @@ class EmployeeTRFSummary(BaseModel):
 
 
 class EmployeeTRFListData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     employee_id: str = Field(..., description="Employee ID tied to the TRF history.")
     total: int = Field(..., description="Total TRFs that match the supplied filter.")
     filter: str = Field(..., description="Filter applied to the TRF list (e.g., pending or all).")
+    offset: int = Field(0, description="Number of matching TRFs skipped before this page.")
+    limit: int = Field(25, description="Page size used for this listing.")
     trfs: List[EmployeeTRFSummary] = Field(..., description="List of TRF summaries for the employee.")
 
 
@@ -564,66 +887,11 @@ class TRFApprovalContextInput(BaseToolInput):
     trf_number: str = Field(..., description="TRF number to retrieve approval context for.")
 
 
-class TRFApprovalContextInfo(BaseModel):
-    """Context needed before approving - helps LLM determine the right approval level."""
-    model_config = ConfigDict(extra="forbid")
-    
-    trf_number: str = Field(..., description="TRF identifier.")
-    current_status: str = Field(..., description="Current TRF status (e.g., PENDING_IRM).")
-    next_approval_level: str = Field(
-        ..., 
-        description="The approval level that should approve next (irm, srm, buh, ssuh, bgh, ssgh, cfo, or travel_desk). Use this to fill the approver_level in approve_trf()."
-    )
-    employee_name: str = Field(..., description="Employee requesting travel.")
-    employee_id: str = Field(..., description="Employee ID.")
-    travel_type: Optional[str] = Field(None, description="Travel type (domestic or international).")
-    origin_city: str = Field(..., description="Travel origin city.")
-    destination_city: str = Field(..., description="Travel destination city.")
-    departure_date: str = Field(..., description="Travel departure date (YYYY-MM-DD).")
-    return_date: Optional[str] = Field(None, description="Travel return date if applicable.")
-    purpose: str = Field(..., description="Purpose of travel.")
-    estimated_cost: Optional[float] = Field(None, description="Estimated travel cost.")
-    
-    # Approval chain so far
-    irm_approved: str = Field("No", description="IRM approval status (Yes/No).")
-    irm_approved_at: Optional[str] = Field(None, description="When IRM approved.")
-    irm_comments: Optional[str] = Field(None, description="IRM comments.")
-    
-    srm_approved: str = Field("No", description="SRM approval status (Yes/No).")
-    srm_approved_at: Optional[str] = Field(None, description="When SRM approved.")
-    
-    buh_approved: str = Field("No", description="BUH approval status (Yes/No).")
-    buh_approved_at: Optional[str] = Field(None, description="When BUH approved.")
-    
-    ssuh_approved: str = Field("No", description="SSUH approval status (Yes/No).")
-    ssuh_approved_at: Optional[str] = Field(None, description="When SSUH approved.")
-    
-    bgh_approved: str = Field("No", description="BGH approval status (Yes/No).")
-    bgh_approved_at: Optional[str] = Field(None, description="When BGH approved.")
-    
-    ssgh_approved: str = Field("No", description="SSGH approval status (Yes/No).")
-    ssgh_approved_at: Optional[str] = Field(None, description="When SSGH approved.")
-    
-    cfo_approved: str = Field("No", description="CFO approval status (Yes/No).")
-    cfo_approved_at: Optional[str] = Field(None, description="When CFO approved.")
-    
-    travel_desk_approved: str = Field("No", description="Travel Desk approval status (Yes/No).")
-
-
-class TRFApprovalContextOutput(BaseToolOutput):
-    """Response with TRF context and auto-detected approval level."""
-    data: Optional[TRFApprovalContextInfo] = Field(
-        None,
-        description="TRF details with next approval level for the agent to use.",
-    )
-
-
 class TRFApprovalInput(BaseToolInput):
     trf_number: str = Field(..., description="TRF number awaiting approval.")
-    approver_level: str = Field(
+    approver_level: ApproverLevelField = Field(
         ...,
         description="Approval level performing the action (irm, srm, buh, ssuh, bgh, ssgh, cfo, travel_desk). Get this from get_trf_approval_details() first for context awareness.",
-        min_length=3,
     )
     comments: Optional[str] = Field(None, description="Optional comments supporting the approval.")
     require_cfo: bool = Field(
@@ -631,18 +899,13 @@ class TRFApprovalInput(BaseToolInput):
         description="Set to true when BGH approval should route to CFO before completion.",
     )
 
-    @field_validator("approver_level")
-    @classmethod
-    def normalize_level(cls, value: str) -> str:
-        return value.lower()
-
 
 class TRFApprovalData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     trf_number: str = Field(..., description="TRF identifier that was approved.")
     new_status: str = Field(..., description="Status after the approval action completed.")
-    approved_at: str = Field(..., description="Timestamp when the approval was recorded.")
+    approved_at: str = Field(..., description="Timestamp when the approval was recorded (UTC).")
     
     # Application context for awareness
     travel_type: Optional[str] = Field(None, description="Travel type (domestic or international) - helps ensure policy compliance.")
@@ -661,27 +924,53 @@ class TRFApprovalOutput(BaseToolOutput):
     )
 
 
+class TRFBulkApprovalInput(BaseToolInput):
+    trf_numbers: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=25,
+        description="TRF numbers to approve together; all must be pending at the same approval level.",
+    )
+    approver_level: ApproverLevelField = Field(
+        ...,
+        description="Approval level performing the action (irm, srm, buh, ssuh, bgh, ssgh, cfo, travel_desk).",
+    )
+    comments: Optional[str] = Field(None, description="Optional comments recorded on every approved TRF.")
+
+
+class TRFBulkApprovalData(BaseModel):
+    model_config = _OUTPUT
+
+    new_status: str = Field(..., description="Status the approved TRFs moved to.")
+    approved_at: str = Field(..., description="Timestamp when the approvals were recorded (UTC).")
+    approved: List[str] = Field(default_factory=list, description="TRF numbers that were approved.")
+    skipped: List[str] = Field(
+        default_factory=list,
+        description="TRF numbers not found or not pending at this level; check them with get_trf_approval_details.",
+    )
+
+
+class TRFBulkApprovalOutput(BaseToolOutput):
+    data: Optional[TRFBulkApprovalData] = Field(
+        None,
+        description="Which TRFs the bulk approval moved on and which it skipped.",
+    )
+
+
 class TRFRejectionInput(BaseToolInput):
     trf_number: str = Field(..., description="TRF identifier being rejected.")
-    approver_level: str = Field(
+    approver_level: ApproverLevelField = Field(
         ...,
         description="Approval hierarchy level issuing the rejection.",
-        min_length=3,
     )
-    rejection_reason: str = Field(
+    rejection_reason: RejectionReason = Field(
         ...,
         description="Detailed reason (>=10 characters) explaining the rejection.",
-        min_length=10,
     )
 
-    @field_validator("approver_level")
-    @classmethod
-    def normalize_rejection_level(cls, value: str) -> str:
-        return value.lower()
-
 
 class TRFRejectionData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
 
     trf_number: str = Field(..., description="TRF identifier that was rejected.")
     status: str = Field(..., description="Current status which should now be REJECTED.")
@@ -709,7 +998,7 @@ class TRFRejectionOutput(BaseToolOutput):
 class PendingApplicationInfo(BaseModel):
     """Information about a single pending TRF application."""
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = _ALLOW_FROZEN
     
     trf_number: str = Field(..., description="TRF identifier.")
     employee_name: str = Field(..., description="Name of employee who submitted the TRF.")
@@ -725,11 +1014,11 @@ class PendingApplicationInfo(BaseModel):
 class PendingApplicationsData(BaseModel):
     """Container for pending applications list."""
     
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
     
     role: str = Field(..., description="Approver role viewing their queue.")
     total_pending: int = Field(..., description="Total count of pending applications.")
-    applications: List[Dict[str, Any]] = Field(..., description="List of pending applications.")
+    applications: List[PendingApplicationInfo] = Field(..., description="List of pending applications.")
     message: str = Field(..., description="Summary message about pending applications.")
 
 
@@ -742,38 +1031,23 @@ class PendingApplicationsOutput(BaseToolOutput):
     )
 
 
-class TravelDeskApplicationInfo(BaseModel):
-    """Detailed application info for Travel Desk with complete approval chain."""
+class AllPendingApplicationsData(BaseModel):
+    """Every approver queue, keyed by role."""
     
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
     
-    trf_number: str = Field(..., description="Travel Requisition Form number.")
-    employee_name: str = Field(..., description="Employee requesting travel.")
-    employee_id: str = Field(..., description="Employee ID.")
-    employee_email: Optional[str] = Field(None, description="Employee email for contact.")
-    travel: str = Field(..., description="Travel route (origin to destination).")
-    travel_type: Optional[str] = Field(None, description="Type of travel (domestic/international).")
-    departure_date: str = Field(..., description="Departure date (YYYY-MM-DD).")
-    return_date: Optional[str] = Field(None, description="Return date (YYYY-MM-DD).")
-    estimated_cost: Optional[float] = Field(None, description="Estimated travel cost.")
-    purpose: str = Field(..., description="Purpose of travel.")
-    current_status: str = Field(..., description="Workflow status stored on the TRF record.")
-    readiness_state: str = Field(
-        ...,
-        description="Reason this TRF needs Travel Desk action (pending_travel_desk, legacy_cfo_approved, processing)."
-    )
-    all_approvals_complete: str = Field("Yes", description="Confirmation all approvals done.")
-    cfo_approved: str = Field("Yes", description="CFO approval status.")
-    cfo_comments: Optional[str] = Field(None, description="CFO's approval comments.")
-    irm_approved: Optional[str] = Field(None, description="IRM approval status.")
-    srm_approved: Optional[str] = Field(None, description="SRM approval status.")
-    buh_approved: Optional[str] = Field(None, description="BUH approval status.")
-    ssuh_approved: Optional[str] = Field(None, description="SSUH approval status.")
-    bgh_approved: Optional[str] = Field(None, description="BGH approval status.")
-    ssgh_approved: Optional[str] = Field(None, description="SSGH approval status.")
-    created: str = Field(..., description="Created date and time.")
-    days_pending: int = Field(..., description="Days since TRF was created.")
+    total_pending: int = Field(..., description="Pending applications across all approver queues.")
+    queues: Dict[str, PendingApplicationsData] = Field(..., description="Queue per approver role (IRM ... CFO).")
+    message: str = Field(..., description="Summary message about pending applications.")
+
 
+class AllPendingApplicationsOutput(BaseToolOutput):
+    """Output for the all-roles pending applications dashboard."""
+    
+    data: Optional[AllPendingApplicationsData] = Field(
+        None,
+        description="Pending applications for every approver role.",
+    )
 
 
 # ============================================================================
@@ -790,116 +1064,9 @@ class TrackAllApplicationsInput(BaseToolInput):
     pass  # No additional parameters needed; inherits from BaseToolInput
 
 
-class TrackAllApplicationsInfo(BaseModel):
-    """Detailed information about each TRF application (excluding drafts)."""
-    
-    model_config = ConfigDict(extra="allow")
-    
-    trf_number: str = Field(..., description="Travel Requisition Form number.")
-    employee_id: str = Field(..., description="Employee ID.")
-    employee_name: str = Field(..., description="Employee requesting travel.")
-    employee_email: Optional[str] = Field(None, description="Employee email for contact.")
-    employee_designation: Optional[str] = Field(None, description="Employee designation/role.")
-    employee_department: Optional[str] = Field(None, description="Employee department.")
-    
-    # Travel Details
-    travel: str = Field(..., description="Travel route (origin to destination).")
-    travel_type: Optional[str] = Field(None, description="Type of travel (domestic/international).")
-    departure_date: str = Field(..., description="Departure date (YYYY-MM-DD).")
-    return_date: Optional[str] = Field(None, description="Return date (YYYY-MM-DD).")
-    estimated_cost: Optional[float] = Field(None, description="Estimated travel cost.")
-    purpose: str = Field(..., description="Purpose of travel.")
-    
-    # Current Status
-    status: str = Field(..., description="Current workflow status.")
-    
-    # Approval Chain Status
-    irm_approved: str = Field(..., description="IRM approval status (Yes/No).")
-    irm_approved_at: Optional[str] = Field(None, description="When IRM approved (YYYY-MM-DD HH:MM).")
-    irm_comments: Optional[str] = Field(None, description="IRM approval comments.")
-    
-    srm_approved: str = Field(..., description="SRM approval status (Yes/No).")
-    srm_approved_at: Optional[str] = Field(None, description="When SRM approved.")
-    srm_comments: Optional[str] = Field(None, description="SRM approval comments.")
-    
-    buh_approved: str = Field(..., description="BUH approval status (Yes/No).")
-    buh_approved_at: Optional[str] = Field(None, description="When BUH approved.")
-    buh_comments: Optional[str] = Field(None, description="BUH approval comments.")
-    
-    ssuh_approved: str = Field(..., description="SSUH approval status (Yes/No).")
-    ssuh_approved_at: Optional[str] = Field(None, description="When SSUH approved.")
-    ssuh_comments: Optional[str] = Field(None, description="SSUH approval comments.")
-    
-    bgh_approved: str = Field(..., description="BGH approval status (Yes/No).")
-    bgh_approved_at: Optional[str] = Field(None, description="When BGH approved.")
-    bgh_comments: Optional[str] = Field(None, description="BGH approval comments.")
-    
-    ssgh_approved: str = Field(..., description="SSGH approval status (Yes/No).")
-    ssgh_approved_at: Optional[str] = Field(None, description="When SSGH approved.")
-    ssgh_comments: Optional[str] = Field(None, description="SSGH approval comments.")
-    
-    cfo_approved: str = Field(..., description="CFO approval status (Yes/No).")
-    cfo_approved_at: Optional[str] = Field(None, description="When CFO approved.")
-    cfo_comments: Optional[str] = Field(None, description="CFO approval comments.")
-    
-    travel_desk_approved: str = Field(..., description="Travel Desk approval status (Yes/No).")
-    travel_desk_approved_at: Optional[str] = Field(None, description="When Travel Desk approved.")
-    travel_desk_comments: Optional[str] = Field(None, description="Travel Desk approval comments.")
-    
-    # Metadata
-    created: str = Field(..., description="Created date and time (YYYY-MM-DD HH:MM).")
-    updated: str = Field(..., description="Last updated date and time (YYYY-MM-DD HH:MM).")
-    days_old: int = Field(..., description="Number of days since TRF was created.")
-    rejection_reason: Optional[str] = Field(None, description="Rejection reason if rejected.")
-    rejected_by: Optional[str] = Field(None, description="Role that rejected the TRF.")
-
-
-class TrackAllApplicationsData(BaseModel):
-    """Container for all applications (non-draft) with complete details."""
-    
-    model_config = ConfigDict(extra="forbid")
-    
-    total_applications: int = Field(..., description="Total count of non-draft applications.")
-    draft_count: int = Field(..., description="Count of draft applications (for reference).")
-    
-    # Grouped by status
-    status_breakdown: Dict[str, int] = Field(
-        ...,
-        description="Count of applications by current status."
-    )
-    
-    # Approval chain completeness
-    fully_approved: int = Field(..., description="Applications with all approvals completed.")
-    pending_approval: int = Field(..., description="Applications waiting for some approval.")
-    rejected_applications: int = Field(..., description="Applications that were rejected.")
-    completed_applications: int = Field(..., description="Completed/processed applications.")
-    
-    applications: List[TrackAllApplicationsInfo] = Field(
-        ...,
-        description="Detailed information for each application."
-    )
-    
-    summary_message: str = Field(
-        ...,
-        description="Human-readable summary of all applications."
-    )
-
-
-class TrackAllApplicationsOutput(BaseToolOutput):
-    """Output for tracking all applications (excluding drafts)."""
-    
-    data: Optional[TrackAllApplicationsData] = Field(
-        None,
-        description="Complete information about all non-draft TRF applications.",
-    )
-
-
-
-
-
 class ApprovedTRFSummary(BaseModel):
     """Summary of approved TRF ready for Travel Desk booking."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
     
     trf_number: str = Field(..., description="TRF identifier")
     employee_id: str = Field(..., description="Employee ID")
@@ -925,7 +1092,7 @@ class GetApprovedTRFsInput(BaseToolInput):
 
 
 class ApprovedTRFsData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
     
     total_approved: int = Field(..., description="Total number of approved TRFs ready for booking")
     trfs: List[ApprovedTRFSummary] = Field(..., description="List of approved TRFs")
@@ -964,14 +1131,13 @@ class SearchFlightsInput(BaseToolInput):
         description="Arrival city name",
         examples=["Bengaluru", "Mumbai", "Delhi"]
     )
-    departure_date: str = Field(
+    departure_date: IsoDate = Field(
         ...,
         description="Departure date in ISO 8601 format (YYYY-MM-DD)",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         examples=["2025-12-10"]
     )
-    cabin_class: Optional[str] = Field(
-        "economy", 
+    cabin_class: Optional[CabinClassField] = Field(
+        CabinClassValues.ECONOMY, 
         description="Preferred cabin class: economy, premium_economy, business, first",
         examples=["economy", "business"]
     )
@@ -1009,7 +1175,7 @@ class ConfirmFlightBookingInput(BaseToolInput):
 
 
 class BookedFlightInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
     
     flight_id: int
     flight_number: str
@@ -1028,7 +1194,7 @@ class BookedFlightInfo(BaseModel):
 
 
 class BookFlightData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
     
     trf_number: str
     employee_name: str
@@ -1056,7 +1222,7 @@ class BookFlightData(BaseModel):
 
 class ConfirmFlightBookingOutput(BaseToolOutput):
     """Confirmation of flight booking with PNR and cost details."""
-    data: Optional[Dict[str, Any]] = Field(
+    data: SkipValidation[Optional[Dict[str, Any]]] = Field(
         None,
         description="Booking confirmation including PNR, flight details, and cost breakdown"
     )
@@ -1098,23 +1264,19 @@ class SearchHotelsInput(BaseToolInput):
         description="City where accommodation is needed (e.g., Bengaluru, Mumbai)",
         examples=["Bengaluru", "Mumbai", "Delhi"]
     )
-    check_in_date: str = Field(
+    check_in_date: IsoDate = Field(
         ...,
         description="Check-in date in ISO 8601 format (YYYY-MM-DD)",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         examples=["2025-12-10"]
     )
-    check_out_date: str = Field(
+    check_out_date: IsoDate = Field(
         ...,
         description="Check-out date in ISO 8601 format (YYYY-MM-DD), must be after check-in",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         examples=["2025-12-15"]
     )
-    min_rating: Optional[int] = Field(
+    min_rating: Optional[StarRating] = Field(
         3, 
         description="Minimum hotel star rating filter (1-5 stars, default 3-star and above)",
-        ge=1,
-        le=5,
         examples=[3, 4, 5]
     )
     max_results: int = Field(
@@ -1141,16 +1303,14 @@ class ConfirmHotelBookingInput(BaseToolInput):
         description="Hotel ID from search_hotels results (required)",
         examples=[9, 10, 11]
     )
-    check_in_date: str = Field(
+    check_in_date: IsoDate = Field(
         ...,
         description="Check-in date (YYYY-MM-DD, must match search dates)",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         examples=["2025-12-10"]
     )
-    check_out_date: str = Field(
+    check_out_date: IsoDate = Field(
         ...,
         description="Check-out date (YYYY-MM-DD, must match search dates)",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         examples=["2025-12-15"]
     )
     number_of_guests: int = Field(
@@ -1168,7 +1328,7 @@ class ConfirmHotelBookingInput(BaseToolInput):
 
 
 class BookedHotelInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT_FROZEN
     
     hotel_id: int
     hotel_name: str
@@ -1186,7 +1346,7 @@ class BookedHotelInfo(BaseModel):
 
 
 class BookHotelData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
     
     trf_number: str
     employee_name: str
@@ -1213,7 +1373,7 @@ class BookHotelData(BaseModel):
 
 class ConfirmHotelBookingOutput(BaseToolOutput):
     """Confirmation of hotel booking with confirmation number and cost details."""
-    data: Optional[Dict[str, Any]] = Field(
+    data: SkipValidation[Optional[Dict[str, Any]]] = Field(
         None,
         description="Booking confirmation including confirmation number, room details, and cost breakdown"
     )
@@ -1241,7 +1401,7 @@ class BookHotelOutput(BaseToolOutput):
 
 class TravelBookingSummary(BaseModel):
     """Complete travel booking summary."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
     
     trf_number: str
     employee_name: str
@@ -1259,17 +1419,17 @@ class CompleteTravelPlanInput(BaseToolInput):
     """Input for complete travel planning and booking."""
     trf_number: str = Field(..., description="TRF number to plan travel for")
     include_hotels: bool = Field(True, description="Whether to include hotel booking")
-    cabin_class: Optional[str] = Field("economy", description="Preferred cabin class")
+    cabin_class: Optional[CabinClassField] = Field(CabinClassValues.ECONOMY, description="Preferred cabin class")
 
 
 class CompleteTravelPlanData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
     
     booking_summary: TravelBookingSummary
     flights: Optional[List[BookedFlightInfo]]
     hotels: Optional[List[BookedHotelInfo]]
     total_cost: float
-    next_steps: List[str]
+    next_steps: Tuple[str, ...]
 
 
 class CompleteTravelPlanOutput(BaseToolOutput):
@@ -1284,10 +1444,10 @@ class MarkTRFCompletedInput(BaseToolInput):
     comments: Optional[str] = Field(None, description="Final closing comments regarding the booking.")
 
 class MarkTRFCompletedData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _OUTPUT
     trf_number: str = Field(..., description="The TRF number marked as completed.")
     status: str = Field(..., description="Final status (COMPLETED).")
-    completed_at: str = Field(..., description="Timestamp of completion.")
+    completed_at: str = Field(..., description="Timestamp of completion (UTC).")
     final_notes: Optional[str] = Field(None, description="Closing notes.")
 
 class MarkTRFCompletedOutput(BaseToolOutput):
@@ -1303,7 +1463,7 @@ class SearchAlternateFlightsInput(BaseToolInput):
     destination_city: str = Field(..., description="Arrival City")
     start_date: str = Field(..., description="Start of date range (YYYY-MM-DD)")
     end_date: str = Field(..., description="End of date range (YYYY-MM-DD)")
-    cabin_class: Optional[str] = Field("economy", description="Cabin class preference")
+    cabin_class: Optional[CabinClassField] = Field(CabinClassValues.ECONOMY, description="Cabin class preference")
 
 class FlightAvailability(BaseModel):
     date: str
@@ -1329,7 +1489,7 @@ class SearchAlternateHotelsInput(BaseToolInput):
     start_date: str = Field(..., description="Start of check-in range (YYYY-MM-DD)")
     end_date: str = Field(..., description="End of check-in range (YYYY-MM-DD)")
     duration_nights: int = Field(1, description="Length of stay required")
-    min_rating: int = Field(3, description="Minimum star rating")
+    min_rating: StarRating = Field(3, description="Minimum star rating")
 
 class HotelAvailability(BaseModel):
     date: str
@@ -1346,3 +1506,32 @@ class SearchAlternateHotelsData(BaseModel):
 
 class SearchAlternateHotelsOutput(BaseToolOutput):
     data: Optional[SearchAlternateHotelsData]
+
+
+# ============================================================================
+# LAZY APPROVAL-CHAIN MODELS
+# ============================================================================
+
+# Output models only the approval-context and track-all tools need live in
+# agent.schema_approval_chain and are built on first access (PEP 562), so a
+# cold import of this module does not pay for their core schemas.
+_LAZY_MODELS: Final[Dict[str, str]] = {
+    name: "agent.schema_approval_chain"
+    for name in (
+        "TRFApprovalContextInfo",
+        "TRFApprovalContextOutput",
+        "TravelDeskApplicationInfo",
+        "TrackAllApplicationsInfo",
+        "TrackAllApplicationsData",
+        "TrackAllApplicationsOutput",
+    )
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,175 @@
+# File: /agent/schema_approval_chain.py
+# Location: agent/
+# Description: Lazily loaded approval-chain output schemas for the approval-context and track-all tools
+
+"""Approval-chain output schemas, loaded on first use.
+
+``agent.schema`` re-exports these names through a module ``__getattr__`` so
+they (and their pydantic core schemas) are only built when one of the
+approval-context or track-all tools first needs them.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from agent.schema import (
+    _ALLOW,
+    _OUTPUT,
+    ApprovalMap,
+    ApproverLevel,
+    BaseToolOutput,
+)
+
+
+# Shared "Yes" sentinel for the flat approval-flag defaults
+_YES = sys.intern("Yes")
+
+
+class TRFApprovalContextInfo(BaseModel):
+    """Context needed before approving - helps LLM determine the right approval level."""
+    model_config = _OUTPUT
+    
+    trf_number: str = Field(..., description="TRF identifier.")
+    current_status: str = Field(..., description="Current TRF status (e.g., PENDING_IRM).")
+    next_approval_level: ApproverLevel = Field(
+        ..., 
+        description="The approval level that should approve next (irm, srm, buh, ssuh, bgh, ssgh, cfo, or travel_desk). Use this to fill the approver_level in approve_trf()."
+    )
+    employee_name: str = Field(..., description="Employee requesting travel.")
+    employee_id: str = Field(..., description="Employee ID.")
+    travel_type: Optional[str] = Field(None, description="Travel type (domestic or international).")
+    origin_city: str = Field(..., description="Travel origin city.")
+    destination_city: str = Field(..., description="Travel destination city.")
+    departure_date: date = Field(..., description="Travel departure date (YYYY-MM-DD).")
+    return_date: Optional[date] = Field(None, description="Travel return date if applicable.")
+    purpose: str = Field(..., description="Purpose of travel.")
+    estimated_cost: Optional[float] = Field(None, description="Estimated travel cost.")
+    
+    # Approval chain so far (only levels that have approved appear)
+    approvals: ApprovalMap = Field(
+        default_factory=dict,
+        description="Approvals recorded so far, keyed by approver level (irm, srm, ..., travel_desk).",
+    )
+
+
+class TRFApprovalContextOutput(BaseToolOutput):
+    """Response with TRF context and auto-detected approval level."""
+    data: Optional[TRFApprovalContextInfo] = Field(
+        None,
+        description="TRF details with next approval level for the agent to use.",
+    )
+
+
+class TravelDeskApplicationInfo(BaseModel):
+    """Detailed application info for Travel Desk with complete approval chain."""
+    
+    model_config = _ALLOW
+    
+    trf_number: str = Field(..., description="Travel Requisition Form number.")
+    employee_name: str = Field(..., description="Employee requesting travel.")
+    employee_id: str = Field(..., description="Employee ID.")
+    employee_email: Optional[str] = Field(None, description="Employee email for contact.")
+    travel: str = Field(..., description="Travel route (origin to destination).")
+    travel_type: Optional[str] = Field(None, description="Type of travel (domestic/international).")
+    departure_date: date = Field(..., description="Departure date (YYYY-MM-DD).")
+    return_date: Optional[date] = Field(None, description="Return date (YYYY-MM-DD).")
+    estimated_cost: Optional[float] = Field(None, description="Estimated travel cost.")
+    purpose: str = Field(..., description="Purpose of travel.")
+    current_status: str = Field(..., description="Workflow status stored on the TRF record.")
+    readiness_state: str = Field(
+        ...,
+        description="Reason this TRF needs Travel Desk action (pending_travel_desk, legacy_cfo_approved, processing)."
+    )
+    all_approvals_complete: str = Field(_YES, description="Confirmation all approvals done.")
+    cfo_approved: str = Field(_YES, description="CFO approval status.")
+    cfo_comments: Optional[str] = Field(None, description="CFO's approval comments.")
+    irm_approved: Optional[str] = Field(None, description="IRM approval status.")
+    srm_approved: Optional[str] = Field(None, description="SRM approval status.")
+    buh_approved: Optional[str] = Field(None, description="BUH approval status.")
+    ssuh_approved: Optional[str] = Field(None, description="SSUH approval status.")
+    bgh_approved: Optional[str] = Field(None, description="BGH approval status.")
+    ssgh_approved: Optional[str] = Field(None, description="SSGH approval status.")
+    created: datetime = Field(..., description="Created date and time.")
+    days_pending: int = Field(..., description="Days since TRF was created.")
+
+
+class TrackAllApplicationsInfo(BaseModel):
+    """Detailed information about each TRF application (excluding drafts)."""
+    
+    model_config = _ALLOW
+    
+    trf_number: str = Field(..., description="Travel Requisition Form number.")
+    employee_id: str = Field(..., description="Employee ID.")
+    employee_name: str = Field(..., description="Employee requesting travel.")
+    employee_email: Optional[str] = Field(None, description="Employee email for contact.")
+    employee_designation: Optional[str] = Field(None, description="Employee designation/role.")
+    employee_department: Optional[str] = Field(None, description="Employee department.")
+    
+    # Travel Details
+    travel: str = Field(..., description="Travel route (origin to destination).")
+    travel_type: Optional[str] = Field(None, description="Type of travel (domestic/international).")
+    departure_date: date = Field(..., description="Departure date (YYYY-MM-DD).")
+    return_date: Optional[date] = Field(None, description="Return date (YYYY-MM-DD).")
+    estimated_cost: Optional[float] = Field(None, description="Estimated travel cost.")
+    purpose: str = Field(..., description="Purpose of travel.")
+    
+    # Current Status
+    status: str = Field(..., description="Current workflow status.")
+    
+    # Approval Chain Status (only levels that have approved appear)
+    approvals: ApprovalMap = Field(
+        default_factory=dict,
+        description="Approval history keyed by approver level, with ISO 8601 timestamps and comments.",
+    )
+    
+    # Metadata
+    created: datetime = Field(..., description="Created date and time (ISO 8601).")
+    updated: datetime = Field(..., description="Last updated date and time (ISO 8601).")
+    days_old: int = Field(..., description="Number of days since TRF was created.")
+    rejection_reason: Optional[str] = Field(None, description="Rejection reason if rejected.")
+    rejected_by: Optional[str] = Field(None, description="Role that rejected the TRF.")
+
+
+class TrackAllApplicationsData(BaseModel):
+    """Container for all applications (non-draft) with complete details."""
+    
+    model_config = _OUTPUT
+    
+    total_applications: int = Field(..., description="Total count of non-draft applications.")
+    draft_count: int = Field(..., description="Count of draft applications (for reference).")
+    
+    # Grouped by status
+    status_breakdown: Dict[str, int] = Field(
+        ...,
+        description="Count of applications by current status."
+    )
+    
+    # Approval chain completeness
+    fully_approved: int = Field(..., description="Applications with all approvals completed.")
+    pending_approval: int = Field(..., description="Applications waiting for some approval.")
+    rejected_applications: int = Field(..., description="Applications that were rejected.")
+    completed_applications: int = Field(..., description="Completed/processed applications.")
+    
+    applications: List[TrackAllApplicationsInfo] = Field(
+        ...,
+        description="Detailed information for each application."
+    )
+    
+    summary_message: str = Field(
+        ...,
+        description="Human-readable summary of all applications."
+    )
+
+
+class TrackAllApplicationsOutput(BaseToolOutput):
+    """Output for tracking all applications (excluding drafts)."""
+    
+    data: Optional[TrackAllApplicationsData] = Field(
+        None,
+        description="Complete information about all non-draft TRF applications.",
+    )
@@ -8,15 +8,26 @@ PostgreSQL NeonDB Version with Pydantic Models and LangChain Tools
 Uses schemas.py for type validation
 """
 
-from sqlalchemy import create_engine, and_, or_, func
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import Integer, create_engine, and_, bindparam, case, cast, literal_column, or_, event, func, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker, Session, defer, joinedload, load_only, raiseload, selectinload
+from sqlalchemy.pool import NullPool
 from models import *
 from agent.schema import *
-from src.rag.retrieval.policy_qa import get_policy_qa
-from datetime import datetime, date, timedelta
-from typing import Optional, List, Dict, Any
+from agent.policy_batcher import get_policy_batcher
+from src.config.settings import settings
+from datetime import datetime, date, timedelta, timezone
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple
+from pydantic import TypeAdapter
 from langchain_core.tools import tool
 import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 # Ensure values from .env land in os.environ for downstream libraries
@@ -26,15 +37,656 @@ import os
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 
+def _utcnow() -> datetime:
+    """Current time as naive UTC, the convention of the models' datetime.utcnow defaults.
+
+    Every timestamp a tool writes goes through this (see "Upgrading an
+    Existing Database" in TECHNICAL.md for rows written in local time).
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 # ============================================================================
 # DATABASE SESSION MANAGEMENT
 # ============================================================================
 
+# Engine and session factory are built once per process and shared by every
+# tool call, so connections come from the pool instead of a fresh TCP/TLS
+# handshake to NeonDB each time. Set DB_USE_NULLPOOL=1 where pooling would
+# fight an external pooler (e.g. short-lived serverless workers); otherwise
+# size the pool with DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_RECYCLE. The
+# compiled-statement cache is raised from its default of 500 to leave room for
+# every distinct tool statement plus its eager-load and filter variants.
+_ENGINE: Optional[Engine] = None
+_SessionLocal: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+
+
+def _session_factory() -> sessionmaker:
+    """Create the process-wide engine and session factory on first use."""
+    global _ENGINE, _SessionLocal
+    if _SessionLocal is None:
+        with _engine_lock:
+            if _SessionLocal is None:
+                if os.getenv("DB_USE_NULLPOOL", "").lower() in ("1", "true", "yes"):
+                    _ENGINE = create_engine(
+                        DATABASE_URL, echo=False, query_cache_size=1200, poolclass=NullPool
+                    )
+                else:
+                    _ENGINE = create_engine(
+                        DATABASE_URL,
+                        echo=False,
+                        query_cache_size=1200,
+                        pool_size=settings.DB_POOL_SIZE,
+                        max_overflow=settings.DB_MAX_OVERFLOW,
+                        pool_pre_ping=True,
+                        pool_recycle=settings.DB_POOL_RECYCLE,
+                    )
+                # Tools build their responses from attributes they just wrote,
+                # so skip the post-commit refresh round-trip
+                _SessionLocal = sessionmaker(bind=_ENGINE, expire_on_commit=False)
+    return _SessionLocal
+
+
+# TRF lookup by number, built once. Tools execute this same statement object, so
+# the compiled form is found in the engine cache instead of being re-derived
+# from a fresh Query each call.
+_TRF_BY_NUMBER = select(TravelRequisitionForm).where(
+    TravelRequisitionForm.trf_number == bindparam("trf_number")
+)
+
+
+def _get_trf(session: Session, trf_number: str, statement=_TRF_BY_NUMBER) -> Optional[TravelRequisitionForm]:
+    """Load a TRF by its number, or None when it does not exist.
+
+    ``statement`` may be a prebuilt variant of ``_TRF_BY_NUMBER`` carrying
+    loader options.
+    """
+    return session.execute(statement, {"trf_number": trf_number}).scalar_one_or_none()
+
+
 def get_session() -> Session:
     """Get database session"""
-    engine = create_engine(DATABASE_URL, echo=False)
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    return _session_factory()()
+
+
+@contextmanager
+def session_scope(existing: Optional[Session] = None) -> Iterator[Session]:
+    """
+    Provide a session for the duration of a tool call.
+
+    When ``existing`` is given (e.g. by an orchestrator chaining
+    create_trf_draft -> submit_trf -> get_trf_status through each tool's
+    ``.func``; LangChain's invoke drops ``_session``), the caller owns commit,
+    rollback and close, so the whole chain shares one transaction. Otherwise a
+    pooled session is opened and closed on exit. Write tools commit it with
+    ``_commit_tool`` inside their own try block, so a commit failure still
+    comes back as their failure JSON; anything left uncommitted is rolled
+    back on close.
+    """
+    if existing is not None:
+        yield existing
+        return
+
+    with get_session() as session:
+        session.info["tool_owned"] = True
+        yield session
+
+
+def _commit_tool(session: Session) -> None:
+    """Commit the tool's own session; on a caller's session only flush, leaving commit to the caller."""
+    if session.info.get("tool_owned"):
+        session.commit()
+    else:
+        session.flush()
+
+
+def _rollback_tool(session: Session) -> None:
+    """Roll back the tool's own session; a caller's session is left for the caller to roll back."""
+    if session.info.get("tool_owned"):
+        session.rollback()
+
+
+# ============================================================================
+# SEARCH RESULT ROWS
+# ============================================================================
+
+# Cabin class -> FlightInventory fare column, resolved once instead of per row.
+# CabinClassValues is a str enum, so members and raw strings both hit.
+_CABIN_PRICE_ATTR = {
+    CabinClassValues.ECONOMY: "economy_price",
+    CabinClassValues.PREMIUM_ECONOMY: "premium_economy_price",
+    CabinClassValues.BUSINESS: "business_price",
+    CabinClassValues.FIRST: "first_price",
+}
+
+
+def _flight_row(flight: FlightInventory, airline: Airline, cabin_class: str) -> Dict[str, Any]:
+    """Flatten a flight inventory row into a BookedFlightInfo-shaped dict.
+    
+    Rows stay plain dicts until the finished list is converted in one call
+    through ``_FLIGHTS_ADAPTER``.
+    """
+    price = getattr(flight, _CABIN_PRICE_ATTR.get(cabin_class, "economy_price")) or flight.economy_price
+    final_price = price * (1 - airline.corporate_discount / 100)
+    hours, minutes = divmod(flight.duration_minutes, 60)
+    return {
+        "flight_id": flight.id,
+        "flight_number": flight.flight_number,
+        "airline": airline.name,
+        "airline_code": airline.code,
+        "origin_city": flight.origin_city,
+        "destination_city": flight.destination_city,
+        "departure_date": str(flight.departure_date),
+        "arrival_date": str(flight.arrival_date),
+        "departure_time": flight.departure_time.isoformat(timespec="minutes"),
+        "arrival_time": flight.arrival_time.isoformat(timespec="minutes"),
+        "duration": f"{hours}h {minutes}m",
+        "price": round(final_price, 2),
+        "cabin_class": cabin_class,
+        "is_direct": flight.is_direct,
+    }
+
+
+def _hotel_row(hotel: Hotel, rooms: List[HotelRoomInventory], nights: int) -> Dict[str, Any]:
+    """Flatten a hotel and its available nightly inventory into a BookedHotelInfo-shaped dict."""
+    return {
+        "hotel_id": hotel.id,
+        "hotel_name": hotel.name,
+        "city": hotel.city,
+        "rating": hotel.rating,
+        "room_type": rooms[0].room_type,
+        "per_night_rate": round(rooms[0].discounted_price, 2),
+        "total_nights": nights,
+        "total_cost": round(sum(r.discounted_price for r in rooms), 2),
+        "amenities": hotel.amenities or [],
+        "inventory_ids": [r.id for r in rooms],
+    }
+
+
+# Whole result lists go through pydantic-core in a single compiled call, which
+# is several times cheaper than a Python model_construct per row
+_FLIGHTS_ADAPTER = TypeAdapter(List[BookedFlightInfo])
+_HOTELS_ADAPTER = TypeAdapter(List[BookedHotelInfo])
+
+
+def _iter_flight_rows(session: Session, flights: Iterable[FlightInventory], cabin_class: str) -> Iterator[Dict[str, Any]]:
+    """Yield flight rows one at a time, skipping inventory whose airline is missing."""
+    for flight in flights:
+        airline = session.query(Airline).get(flight.airline_id)
+        if airline:
+            yield _flight_row(flight, airline, cabin_class)
+
+
+def _iter_hotel_rows(session: Session, hotels: Iterable[Hotel], checkin: date, checkout: date) -> Iterator[Dict[str, Any]]:
+    """Yield hotel rows one at a time for hotels with available nights in the stay window."""
+    nights = (checkout - checkin).days
+    for hotel in hotels:
+        rooms = session.query(HotelRoomInventory).filter(
+            HotelRoomInventory.hotel_id == hotel.id,
+            HotelRoomInventory.date >= checkin,
+            HotelRoomInventory.date < checkout,
+            HotelRoomInventory.is_available == True
+        ).order_by(HotelRoomInventory.date.asc()).all()
+        if rooms:
+            yield _hotel_row(hotel, rooms, nights)
+
+
+# Independent searches inside one tool call fan out here, each on its own
+# pooled connection (a Session must not be shared across threads)
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="trf-search")
+
+
+def _plan_hotels(session: Session, city: str, checkin: date, checkout: date) -> List[Dict[str, Any]]:
+    """Top hotel options in *city* for the stay window."""
+    hotel_query = session.query(Hotel).filter(Hotel.city == city).limit(3)
+    return list(_iter_hotel_rows(session, hotel_query, checkin, checkout))
+
+
+def _plan_hotels_isolated(city: str, checkin: date, checkout: date) -> List[Dict[str, Any]]:
+    """Run :func:`_plan_hotels` on a session of its own, for use from ``_SEARCH_POOL``."""
+    with session_scope() as session:
+        return _plan_hotels(session, city, checkin, checkout)
+
+
+# ============================================================================
+# APPROVAL CHAIN
+# ============================================================================
+
+# (level, display role, approved-at column, comments column) in workflow order;
+# the built column names are interned so per-row getattr hits the fast path
+_APPROVAL_COLUMNS = tuple(
+    (level, role, sys.intern(f"{level}_approved_at"), sys.intern(f"{level}_comments"))
+    for level, role in (
+        ("irm", "IRM"),
+        ("srm", "SRM"),
+        ("buh", "BUH"),
+        ("ssuh", "SSUH"),
+        ("bgh", "BGH"),
+        ("ssgh", "SSGH"),
+        ("cfo", "CFO"),
+        ("travel_desk", "Travel Desk"),
+    )
+)
+# Level -> (approved-at column, comments column) for writing an approval
+_APPROVAL_FIELDS = {level: (at_attr, comments_attr) for level, _, at_attr, comments_attr in _APPROVAL_COLUMNS}
+
+
+def _approval_chain(trf: TravelRequisitionForm) -> Dict[str, ApprovalInfo]:
+    """Collect the levels that have approved *trf*, keyed by level in workflow order."""
+    return {
+        level: ApprovalInfo(role, "APPROVED", approved_at, getattr(trf, comments_attr))
+        for level, role, at_attr, comments_attr in _APPROVAL_COLUMNS
+        if (approved_at := getattr(trf, at_attr))
+    }
+
+
+def _approval_chain_wire(trf: TravelRequisitionForm) -> Dict[str, Dict[str, Any]]:
+    """:func:`_approval_chain` already in wire shape, for responses serialized without the schema."""
+    return {
+        level: {"role": role, "status": "APPROVED", "at": approved_at, "comments": getattr(trf, comments_attr)}
+        for level, role, at_attr, comments_attr in _APPROVAL_COLUMNS
+        if (approved_at := getattr(trf, at_attr))
+    }
+
+
+def _approval_rows(trf: TravelRequisitionForm) -> List[ApprovalInfo]:
+    """Approval history of *trf* in workflow order, without the per-level keys."""
+    return [
+        ApprovalInfo(role, "APPROVED", approved_at, getattr(trf, comments_attr))
+        for _, role, at_attr, comments_attr in _APPROVAL_COLUMNS
+        if (approved_at := getattr(trf, at_attr))
+    ]
+
+
+# Fixed status order, so per-row aggregation is a list-index increment
+_TRF_STATUSES = tuple(TRFStatus)
+_STATUS_INDEX = {status: index for index, status in enumerate(_TRF_STATUSES)}
+_STATUS_MAP = {status.name: status for status in _TRF_STATUSES}
+# Enum member -> wire string for every enum a response renders per row; a dict
+# hit is cheaper than the Enum.value descriptor and .get() folds the None case
+_ENUM_VALUES = {
+    member: member.value
+    for enum_cls in (TRFStatus, TravelType, BookingStatus, CabinClass)
+    for member in enum_cls
+}
+_TRAVEL_TYPE_MAP = {member.value: member for member in TravelType}
+_PENDING_STATUSES = (
+    TRFStatus.PENDING_IRM, TRFStatus.PENDING_SRM, TRFStatus.PENDING_BUH,
+    TRFStatus.PENDING_SSUH, TRFStatus.PENDING_BGH, TRFStatus.PENDING_SSGH,
+    TRFStatus.PENDING_CFO, TRFStatus.PENDING_TRAVEL_DESK,
+)
+# Built once; SQLAlchemy clauses are immutable and safe to share across queries
+_PENDING_FILTER = TravelRequisitionForm.status.in_(_PENDING_STATUSES)
+# "Pune to Delhi" route label, concatenated by the database so list queries
+# that project columns receive it prebuilt
+_TRAVEL_ROUTE = TravelRequisitionForm.origin_city + " to " + TravelRequisitionForm.destination_city
+# Approver level -> (status it acts on, status it moves the TRF to).
+# Travel Desk moves PENDING_TRAVEL_DESK -> APPROVED.
+_APPROVAL_TRANSITIONS = {
+    "irm": (TRFStatus.PENDING_IRM, TRFStatus.PENDING_SRM),
+    "srm": (TRFStatus.PENDING_SRM, TRFStatus.PENDING_BUH),
+    "buh": (TRFStatus.PENDING_BUH, TRFStatus.PENDING_SSUH),
+    "ssuh": (TRFStatus.PENDING_SSUH, TRFStatus.PENDING_BGH),
+    "bgh": (TRFStatus.PENDING_BGH, TRFStatus.PENDING_SSGH),
+    "ssgh": (TRFStatus.PENDING_SSGH, TRFStatus.PENDING_CFO),
+    "cfo": (TRFStatus.PENDING_CFO, TRFStatus.PENDING_TRAVEL_DESK),
+    "travel_desk": (TRFStatus.PENDING_TRAVEL_DESK, TRFStatus.APPROVED),
+}
+# Pending status -> the approver level that acts on it
+_STATUS_TO_LEVEL = {expected: level for level, (expected, _) in _APPROVAL_TRANSITIONS.items()}
+# TRF lookup that hydrates only what get_trf_approval_details renders, leaving
+# rejection and audit columns out of the row
+_TRF_APPROVAL_CONTEXT = _TRF_BY_NUMBER.options(
+    load_only(
+        TravelRequisitionForm.status,
+        TravelRequisitionForm.employee_name,
+        TravelRequisitionForm.employee_id,
+        TravelRequisitionForm.travel_type,
+        TravelRequisitionForm.origin_city,
+        TravelRequisitionForm.destination_city,
+        TravelRequisitionForm.departure_date,
+        TravelRequisitionForm.return_date,
+        TravelRequisitionForm.purpose,
+        TravelRequisitionForm.estimated_cost,
+        *(
+            getattr(TravelRequisitionForm, attr)
+            for _, _, at_attr, comments_attr in _APPROVAL_COLUMNS
+            for attr in (at_attr, comments_attr)
+        ),
+    )
+)
+# Columns approve/reject read back through RETURNING to build their response
+_TRF_DECISION_RETURNING = (
+    TravelRequisitionForm.employee_id,
+    TravelRequisitionForm.status,
+    TravelRequisitionForm.travel_type,
+    TravelRequisitionForm.employee_name,
+    TravelRequisitionForm.origin_city,
+    TravelRequisitionForm.destination_city,
+    TravelRequisitionForm.departure_date,
+    TravelRequisitionForm.purpose,
+    TravelRequisitionForm.estimated_cost,
+)
+_TRF_STATUS_BY_NUMBER = select(TravelRequisitionForm.status).where(
+    TravelRequisitionForm.trf_number == bindparam("trf_number")
+)
+
+
+# Eager-load the whole booking tree behind a TRF (bookings -> hotel rooms ->
+# hotel, bookings -> flights) in a fixed handful of queries rather than one
+# lazy load per booking, room and flight.
+_TRF_BOOKINGS_LOAD = (
+    selectinload(TravelRequisitionForm.travel_bookings)
+    .selectinload(TravelBooking.hotel_bookings)
+    .joinedload(HotelBooking.room)
+    .joinedload(HotelRoomInventory.hotel),
+    selectinload(TravelRequisitionForm.travel_bookings)
+    .selectinload(TravelBooking.flight_bookings)
+    .joinedload(FlightBooking.flight),
+)
+
+# Per-booking cost totals as correlated subqueries. Summing both children over
+# a double outer join would multiply each side by the other's row count.
+_BOOKING_HOTEL_TOTAL = (
+    select(func.coalesce(func.sum(HotelBooking.final_cost), 0.0))
+    .where(HotelBooking.travel_booking_id == TravelBooking.id)
+    .correlate(TravelBooking)
+    .scalar_subquery()
+)
+_BOOKING_FLIGHT_TOTAL = (
+    select(func.coalesce(func.sum(FlightBooking.final_fare), 0.0))
+    .where(FlightBooking.travel_booking_id == TravelBooking.id)
+    .correlate(TravelBooking)
+    .scalar_subquery()
+)
+
+
+def _booking_timestamp(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat(sep=" ", timespec="seconds") if value else None
+
+
+def _booking_summaries(session: Session, trf_id: int) -> List[TravelBookingRecord]:
+    """Booking status and totals for a TRF in one query, without child rows."""
+    rows = session.execute(
+        select(
+            TravelBooking.booking_number,
+            TravelBooking.status,
+            TravelBooking.booking_date,
+            TravelBooking.confirmation_date,
+            _BOOKING_HOTEL_TOTAL.label("hotel_total"),
+            _BOOKING_FLIGHT_TOTAL.label("flight_total"),
+        )
+        .where(TravelBooking.trf_id == trf_id)
+        .order_by(TravelBooking.id)
+    )
+    return [
+        TravelBookingRecord.model_construct(
+            booking_number=row.booking_number,
+            status=_ENUM_VALUES.get(row.status, BookingStatus.PENDING.value),
+            total_cost=row.hotel_total + row.flight_total,
+            total_hotel_cost=row.hotel_total,
+            total_flight_cost=row.flight_total,
+            confirmed_hotels=[],
+            confirmed_flights=[],
+            booked_at=_booking_timestamp(row.booking_date),
+            confirmed_at=_booking_timestamp(row.confirmation_date),
+        )
+        for row in rows
+    ]
+
+
+def _booking_details(trf: TravelRequisitionForm) -> List[TravelBookingRecord]:
+    """Full booking records, walking a tree loaded with ``_TRF_BOOKINGS_LOAD``."""
+    # Records are built straight from trusted ORM rows; build_trusted
+    # passes model instances through untouched
+    booking_summaries: List[TravelBookingRecord] = []
+    for booking in trf.travel_bookings:
+        hotel_details = []
+        for hotel_booking in booking.hotel_bookings:
+            room = hotel_booking.room
+            hotel_name = room.hotel.name if room and room.hotel else None
+            hotel_details.append(ConfirmedHotelRecord.model_construct(
+                confirmation_number=hotel_booking.confirmation_number,
+                hotel_name=hotel_name,
+                check_in=str(hotel_booking.check_in_date),
+                check_out=str(hotel_booking.check_out_date),
+                final_cost=hotel_booking.final_cost
+            ))
+
+        flight_details = []
+        for flight_booking in booking.flight_bookings:
+            flight = flight_booking.flight
+            flight_details.append(ConfirmedFlightRecord.model_construct(
+                pnr=flight_booking.pnr,
+                flight_number=flight.flight_number if flight else None,
+                cabin_class=_ENUM_VALUES.get(flight_booking.cabin_class),
+                departure_date=str(flight.departure_date) if flight else None,
+                origin_city=flight.origin_city if flight else None,
+                destination_city=flight.destination_city if flight else None,
+                final_fare=flight_booking.final_fare
+            ))
+        booking_summaries.append(TravelBookingRecord.model_construct(
+            booking_number=booking.booking_number,
+            status=_ENUM_VALUES.get(booking.status, BookingStatus.PENDING.value),
+            total_cost=booking.total_cost,
+            total_hotel_cost=booking.total_hotel_cost,
+            total_flight_cost=booking.total_flight_cost,
+            confirmed_hotels=hotel_details,
+            confirmed_flights=flight_details,
+            booked_at=_booking_timestamp(booking.booking_date),
+            confirmed_at=_booking_timestamp(booking.confirmation_date)
+        ))
+    return booking_summaries
+
+
+# ============================================================================
+# READ CACHE
+# ============================================================================
+
+# Agents re-check the same TRF between steps, so successful responses of the
+# read-only tools are kept briefly and served without touching Postgres.
+# Write tools mark what they changed on their session; the entries are
+# dropped once that transaction commits, so a reader never sees its own
+# write go missing. Calls on a caller-provided session bypass the cache.
+READ_CACHE_TTL = 15.0
+READ_CACHE_SIZE = 2048
+
+_read_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+
+def _read_cache_get(key: tuple) -> Optional[Any]:
+    with _read_cache_lock:
+        entry = _read_cache.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires < time.monotonic():
+            del _read_cache[key]
+            return None
+        _read_cache.move_to_end(key)
+        return result
+
+
+def _read_cache_put(key: tuple, result: Any) -> None:
+    with _read_cache_lock:
+        _read_cache[key] = (time.monotonic() + READ_CACHE_TTL, result)
+        _read_cache.move_to_end(key)
+        while len(_read_cache) > READ_CACHE_SIZE:
+            _read_cache.popitem(last=False)
+
+
+def _invalidate(trf_number: str) -> None:
+    """Forget the cached status and approval context of one TRF."""
+    with _read_cache_lock:
+        for detail in (False, True):
+            _read_cache.pop(("trf_status", trf_number, detail), None)
+        _read_cache.pop(("trf_approval", trf_number), None)
+
+
+def _invalidate_pending() -> None:
+    """Forget every cached approver queue (some TRF changed status)."""
+    with _read_cache_lock:
+        stale = [key for key in _read_cache if key[0] == "pending"]
+        for key in stale:
+            del _read_cache[key]
+
+
+def _invalidate_employee(employee_id: str) -> None:
+    """Forget every cached TRF list of one employee."""
+    with _read_cache_lock:
+        stale = [key for key in _read_cache if key[0] in ("drafts", "trfs") and key[1] == employee_id]
+        for key in stale:
+            del _read_cache[key]
+
+
+def _invalidate_inventory() -> None:
+    """Forget every cached flight/hotel search (availability has changed)."""
+    with _read_cache_lock:
+        stale = [key for key in _read_cache if key[0] in ("flights", "hotels")]
+        for key in stale:
+            del _read_cache[key]
+
+
+def _mark_inventory_stale(session: Session) -> None:
+    """Queue search-cache invalidation for when *session* commits a booking."""
+    session.info["stale_inventory"] = True
+
+
+def _mark_stale(session: Session, employee_id: str, *trf_numbers: str) -> None:
+    """Queue cache invalidation for when *session* commits."""
+    stale = session.info.setdefault("stale_reads", (set(), set()))
+    stale[0].add(employee_id)
+    stale[1].update(trf_numbers)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_stale_reads(session: Session) -> None:
+    # Releasing a savepoint is not the outer commit; wait for that
+    if session.in_nested_transaction():
+        return
+    employee_ids, trf_numbers = session.info.pop("stale_reads", ((), ()))
+    for employee_id in employee_ids:
+        _invalidate_employee(employee_id)
+    for trf_number in trf_numbers:
+        _invalidate(trf_number)
+    if trf_numbers:
+        _invalidate_pending()
+    if session.info.pop("stale_inventory", False):
+        _invalidate_inventory()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_reads(session: Session) -> None:
+    # A savepoint rolling back leaves the outer transaction (and the writes
+    # it already marked) pending
+    if session.in_nested_transaction():
+        return
+    session.info.pop("stale_reads", None)
+    session.info.pop("stale_inventory", None)
+
+
+# ============================================================================
+# SEARCH PREFETCH
+# ============================================================================
+
+# Search result rows share the read cache, keyed on the query parameters. An
+# approved TRF with no bookings is almost always followed by search_flights
+# and search_hotels, so get_trf_status warms both with the tools' default
+# parameters on _SEARCH_POOL while the agent is still reading the status.
+_DEFAULT_SEARCH_CABIN = CabinClassValues.ECONOMY
+_DEFAULT_SEARCH_RESULTS = 5
+_DEFAULT_HOTEL_MIN_RATING = 3
+
+
+def _flight_search_rows(
+    session: Session,
+    origin_city: str,
+    destination_city: str,
+    dep_date: date,
+    cabin_class: str,
+    max_results: int,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """Available flight rows for a route and day, served from the read cache when warm."""
+    key = ("flights", origin_city, destination_city, dep_date, cabin_class, max_results)
+    if use_cache and (rows := _read_cache_get(key)) is not None:
+        return rows
+    flight_query = session.query(FlightInventory).filter(
+        FlightInventory.origin_city == origin_city,
+        FlightInventory.destination_city == destination_city,
+        FlightInventory.departure_date == dep_date,
+        FlightInventory.is_available == True
+    ).limit(max_results)
+    rows = list(_iter_flight_rows(session, flight_query, cabin_class))
+    if use_cache:
+        _read_cache_put(key, rows)
+    return rows
+
+
+def _hotel_search_rows(
+    session: Session,
+    city: str,
+    checkin: date,
+    checkout: date,
+    min_rating: Optional[int],
+    max_results: int,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """Available hotel rows for a stay, served from the read cache when warm."""
+    key = ("hotels", city, checkin, checkout, min_rating, max_results)
+    if use_cache and (rows := _read_cache_get(key)) is not None:
+        return rows
+    query = session.query(Hotel).filter(Hotel.city == city)
+    if min_rating:
+        query = query.filter(Hotel.rating >= min_rating)
+    rows = list(_iter_hotel_rows(session, query.limit(max_results), checkin, checkout))
+    if use_cache:
+        _read_cache_put(key, rows)
+    return rows
+
+
+def _prefetch_searches(origin_city: str, destination_city: str, checkin: date, checkout: date) -> None:
+    """Warm the default flight and hotel searches for a TRF; failures are ignored."""
+    try:
+        with session_scope() as session:
+            _flight_search_rows(
+                session, origin_city, destination_city, checkin,
+                _DEFAULT_SEARCH_CABIN, _DEFAULT_SEARCH_RESULTS
+            )
+            _hotel_search_rows(
+                session, destination_city, checkin, checkout,
+                _DEFAULT_HOTEL_MIN_RATING, _DEFAULT_SEARCH_RESULTS
+            )
+    except Exception:
+        # Speculative only; the real search reports its own errors
+        pass
+
+
+# ============================================================================
+# RESPONSE GUIDANCE
+# ============================================================================
+
+# Canned next-step hints, built once and shared by every response of a kind
+_DRAFT_EDIT_STEP = "Edit: Update any details before submission"
+_SUBMIT_PENDING_STEP = "TRF is now pending IRM approval"
+_TRAVEL_PLAN_NEXT_STEPS = (
+    "Review the travel plan above",
+    "Confirm flights and hotels selection",
+    "Proceed with booking confirmation",
+)
+
+
+# ============================================================================
+# INPUT COERCION
+# ============================================================================
+
+def _as_date(value: Any) -> date:
+    """Accept a date already parsed by the args schema, or an ISO string from a direct call."""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
 
 
 # ============================================================================
@@ -50,8 +702,8 @@ def create_trf_draft(
     purpose: str,
     origin_city: str,
     destination_city: str,
-    departure_date: str,
-    return_date: Optional[str] = None,
+    departure_date: date,
+    return_date: Optional[date] = None,
     estimated_cost: Optional[float] = None,
     employee_phone: Optional[str] = None,
     employee_department: Optional[str] = None,
@@ -60,7 +712,8 @@ def create_trf_draft(
     irm_name: Optional[str] = None,
     irm_email: Optional[str] = None,
     srm_name: Optional[str] = None,
-    srm_email: Optional[str] = None
+    srm_email: Optional[str] = None,
+    _session: Optional[Session] = None
 ) -> str:
     """
     Create a draft TRF (Travel Requisition Form) that can be edited later.
@@ -74,89 +727,167 @@ def create_trf_draft(
     
     Example: "Create a draft travel request for my trip to New York"
     """
-    session = get_session()
-    
-    try:
+    with session_scope(_session) as session:
         try:
-            dep = datetime.strptime(departure_date, "%Y-%m-%d").date()
-            ret = datetime.strptime(return_date, "%Y-%m-%d").date() if return_date else None
-        except ValueError:
-            return TRFDraftOutput(
-                success=False,
-                message="Invalid date format. Please use YYYY-MM-DD.",
-                error=ErrorCodes.INVALID_DATE_FORMAT,
-                error_details="departure_date/return_date failed strict ISO parsing."
-            ).model_dump_json()
-        
-        if ret and ret <= dep:
+            try:
+                dep = _as_date(departure_date)
+                ret = _as_date(return_date) if return_date else None
+            except ValueError:
+                return TRFDraftOutput(
+                    success=False,
+                    message="Invalid date format. Please use YYYY-MM-DD.",
+                    error=ErrorCodes.INVALID_DATE_FORMAT,
+                    error_details="departure_date/return_date failed strict ISO parsing."
+                ).to_json()
+
+            if ret and ret <= dep:
+                return TRFDraftOutput(
+                    success=False,
+                    message="Return date must be after departure date",
+                    error=ErrorCodes.INVALID_DATE_RANGE,
+                    error_details="return_date must be greater than departure_date"
+                ).to_json()
+
+            seq_val = session.scalar(select(TRF_DRAFT_SEQ.next_value()))
+            trf_num = f"DRAFT-TRF{_utcnow().year}{seq_val:05d}"
+
+            trf = TravelRequisitionForm(
+                trf_number=trf_num,
+                employee_id=employee_id,
+                employee_name=employee_name,
+                employee_email=employee_email,
+                employee_phone=employee_phone,
+                employee_department=employee_department,
+                employee_designation=employee_designation,
+                employee_location=employee_location,
+                irm_name=irm_name,
+                irm_email=irm_email,
+                srm_name=srm_name,
+                srm_email=srm_email,
+                travel_type=_TRAVEL_TYPE_MAP.get(travel_type.lower(), TravelType.INTERNATIONAL),
+                purpose=purpose,
+                origin_city=origin_city,
+                destination_city=destination_city,
+                departure_date=dep,
+                return_date=ret,
+                estimated_cost=estimated_cost,
+                status=TRFStatus.DRAFT
+            )
+
+            session.add(trf)
+            _mark_stale(session, employee_id, trf_num)
+            _commit_tool(session)
+
+            data = {
+                "trf_number": trf_num,
+                "status": TRFStatusValues.DRAFT,
+                "employee_name": employee_name,
+                "travel": f"{origin_city} to {destination_city}",
+                "departure": str(dep),
+                "next_steps": (
+                    _DRAFT_EDIT_STEP,
+                    f"Submit: Use submit_trf('{trf_num}') when ready",
+                    f"View: Use list_employee_drafts('{employee_id}') to see all drafts"
+                ),
+            }
+            return TRFDraftOutput.build_trusted(
+                success=True,
+                message=f"Draft TRF created successfully: {trf_num}",
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
             return TRFDraftOutput(
                 success=False,
-                message="Return date must be after departure date",
-                error=ErrorCodes.INVALID_DATE_RANGE,
-                error_details="return_date must be greater than departure_date"
-            ).model_dump_json()
-        
-        count = session.query(func.count(TravelRequisitionForm.id)).scalar()
-        trf_num = f"DRAFT-TRF{datetime.now().year}{count+1:05d}"
-        
-        trf = TravelRequisitionForm(
-            trf_number=trf_num,
-            employee_id=employee_id,
-            employee_name=employee_name,
-            employee_email=employee_email,
-            employee_phone=employee_phone,
-            employee_department=employee_department,
-            employee_designation=employee_designation,
-            employee_location=employee_location,
-            irm_name=irm_name,
-            irm_email=irm_email,
-            srm_name=srm_name,
-            srm_email=srm_email,
-            travel_type=TravelType.DOMESTIC if travel_type.lower() == "domestic" else TravelType.INTERNATIONAL,
-            purpose=purpose,
-            origin_city=origin_city,
-            destination_city=destination_city,
-            departure_date=dep,
-            return_date=ret,
-            estimated_cost=estimated_cost,
-            status=TRFStatus.DRAFT
-        )
-        
-        session.add(trf)
-        session.commit()
-        
-        data = TRFDraftData(
-            trf_number=trf_num,
-            status=TRFStatusValues.DRAFT,
-            employee_name=employee_name,
-            travel=f"{origin_city} to {destination_city}",
-            departure=departure_date,
-            next_steps=[
-                "Edit: Update any details before submission",
-                f"Submit: Use submit_trf('{trf_num}') when ready",
-                f"View: Use list_employee_drafts('{employee_id}') to see all drafts"
+                message=str(e),
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
+
+
+@tool(args_schema=TRFDraftBulkInput)
+def create_trf_drafts_bulk(drafts: List[TRFDraftInput], _session: Optional[Session] = None) -> str:
+    """
+    Create several draft TRFs in one go, e.g. one per leg of a multi-leg trip.
+    All drafts are saved together or none are.
+    
+    Use this tool when user wants to:
+    - Draft multiple travel requests at once
+    - Save every leg of a multi-city itinerary
+    
+    Example: "Create drafts for Mumbai to Delhi on 5 March and Delhi to Pune on 9 March"
+    """
+    with session_scope(_session) as session:
+        try:
+            drafts = [
+                draft if isinstance(draft, TRFDraftInput) else TRFDraftInput.model_validate(draft)
+                for draft in drafts
             ]
-        )
-        return TRFDraftOutput(
-            success=True,
-            message=f"Draft TRF created successfully: {trf_num}",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        session.rollback()
-        return TRFDraftOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+            for index, draft in enumerate(drafts, start=1):
+                if draft.return_date and draft.return_date <= draft.departure_date:
+                    return TRFDraftBulkOutput(
+                        success=False,
+                        message=f"Draft {index}: return date must be after departure date",
+                        error=ErrorCodes.INVALID_DATE_RANGE,
+                        error_details="return_date must be greater than departure_date"
+                    ).to_json()
+
+            # One round trip for the whole block of draft numbers
+            seq_vals = session.scalars(
+                select(TRF_DRAFT_SEQ.next_value()).select_from(func.generate_series(1, len(drafts)))
+            ).all()
+            year = _utcnow().year
+
+            trfs = []
+            for draft, seq_val in zip(drafts, seq_vals):
+                values = draft.model_dump()
+                values["travel_type"] = _TRAVEL_TYPE_MAP.get(values["travel_type"], TravelType.INTERNATIONAL)
+                trfs.append(TravelRequisitionForm(
+                    trf_number=f"DRAFT-TRF{year}{seq_val:05d}",
+                    status=TRFStatus.DRAFT,
+                    **values
+                ))
+
+            # Flushed as one batched INSERT
+            session.add_all(trfs)
+            session.flush()
+            for trf in trfs:
+                _mark_stale(session, trf.employee_id, trf.trf_number)
+            _commit_tool(session)
+
+            created = [
+                {
+                    "trf_number": trf.trf_number,
+                    "status": TRFStatusValues.DRAFT,
+                    "employee_name": trf.employee_name,
+                    "travel": f"{trf.origin_city} to {trf.destination_city}",
+                    "departure": str(trf.departure_date),
+                    "next_steps": (
+                        _DRAFT_EDIT_STEP,
+                        f"Submit: Use submit_trf('{trf.trf_number}') when ready",
+                    ),
+                }
+                for trf in trfs
+            ]
+            return TRFDraftBulkOutput.build_trusted(
+                success=True,
+                message=f"Created {len(created)} draft TRF(s): " + ", ".join(d["trf_number"] for d in created),
+                data={"total": len(created), "drafts": created}
+            ).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
+            return TRFDraftBulkOutput(
+                success=False,
+                message=str(e),
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 @tool(args_schema=TRFSubmitInput)
-def submit_trf(trf_number: str) -> str:
+def submit_trf(trf_number: str, _session: Optional[Session] = None) -> str:
     """
     Submit a draft TRF for approval. Changes status from DRAFT to PENDING_IRM.
     Once submitted, TRF enters the approval workflow starting with IRM.
@@ -168,62 +899,60 @@ def submit_trf(trf_number: str) -> str:
     
     Example: "Submit my draft TRF for approval"
     """
-    session = get_session()
-    
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        
-        if not trf:
-            return TRFSubmitOutput(
-                success=False,
-                message=f"TRF {trf_number} not found",
-                error=ErrorCodes.TRF_NOT_FOUND,
-                error_details="No draft TRF matched the provided number."
-            ).model_dump_json()
-        
-        if trf.status != TRFStatus.DRAFT:
+    with session_scope(_session) as session:
+        try:
+            trf = _get_trf(session, trf_number)
+
+            if not trf:
+                return TRFSubmitOutput(
+                    success=False,
+                    message=f"TRF {trf_number} not found",
+                    error=ErrorCodes.TRF_NOT_FOUND,
+                    error_details="No draft TRF matched the provided number."
+                ).to_json()
+
+            if trf.status != TRFStatus.DRAFT:
+                return TRFSubmitOutput(
+                    success=False,
+                    message=f"Cannot submit, current status: {trf.status.value}",
+                    error=ErrorCodes.INVALID_STATUS,
+                    error_details=f"Expected DRAFT but found {trf.status.value}."
+                ).to_json()
+
+            new_num = trf_number.replace("DRAFT-", "")
+            trf.trf_number = new_num
+            trf.status = TRFStatus.PENDING_IRM
+            _mark_stale(session, trf.employee_id, trf_number, new_num)
+            _commit_tool(session)
+
+            data = {
+                "trf_number": new_num,
+                "previous_number": trf_number,
+                "status": TRFStatusValues.PENDING_IRM,
+                "submitted_at": _utcnow().isoformat(sep=" ", timespec="seconds"),
+                "next_steps": (
+                    _SUBMIT_PENDING_STEP,
+                    f"Track status: get_trf_status('{new_num}')"
+                ),
+            }
+            return TRFSubmitOutput.build_trusted(
+                success=True,
+                message=f"TRF submitted successfully: {new_num}",
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
             return TRFSubmitOutput(
                 success=False,
-                message=f"Cannot submit, current status: {trf.status.value}",
-                error=ErrorCodes.INVALID_STATUS,
-                error_details=f"Expected DRAFT but found {trf.status.value}."
-            ).model_dump_json()
-        
-        new_num = trf_number.replace("DRAFT-", "")
-        trf.trf_number = new_num
-        trf.status = TRFStatus.PENDING_IRM
-        session.commit()
-        
-        data = TRFSubmitData(
-            trf_number=new_num,
-            previous_number=trf_number,
-            status=TRFStatusValues.PENDING_IRM,
-            submitted_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            next_steps=[
-                "TRF is now pending IRM approval",
-                f"Track status: get_trf_status('{new_num}')"
-            ]
-        )
-        return TRFSubmitOutput(
-            success=True,
-            message=f"TRF submitted successfully: {new_num}",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        session.rollback()
-        return TRFSubmitOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+                message=str(e),
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 @tool(args_schema=TRFListInput)
-def list_employee_drafts(employee_id: str) -> str:
+def list_employee_drafts(employee_id: str, _session: Optional[Session] = None) -> str:
     """
     List all draft TRFs for an employee.
     Shows TRFs that are saved but not yet submitted.
@@ -235,49 +964,64 @@ def list_employee_drafts(employee_id: str) -> str:
     
     Example: "Show me my draft travel requests"
     """
-    session = get_session()
-    
-    try:
-        drafts = session.query(TravelRequisitionForm).filter_by(
-            employee_id=employee_id,
-            status=TRFStatus.DRAFT
-        ).order_by(TravelRequisitionForm.updated_at.desc()).all()
-        
-        draft_list = [
-            TRFDraftSummary(
-                trf_number=d.trf_number,
-                travel=f"{d.origin_city} to {d.destination_city}",
-                departure=str(d.departure_date),
-                return_date=str(d.return_date) if d.return_date else None,
-                purpose=d.purpose[:100],
-                created=d.created_at.strftime("%Y-%m-%d"),
-                last_updated=d.updated_at.strftime("%Y-%m-%d")
-            )
-            for d in drafts
-        ]
-        data = TRFListData(employee_id=employee_id, total=len(draft_list), drafts=draft_list)
-        return TRFListOutput(
-            success=True,
-            message=f"Found {len(drafts)} draft(s)",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return TRFListOutput(
-            success=False,
-            message="Unable to fetch draft TRFs",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    cache_key = ("drafts", employee_id)
+    if _session is None and (cached := _read_cache_get(cache_key)) is not None:
+        return cached
+
+    with session_scope(_session) as session:
+        try:
+            # Only the summary columns; purpose is trimmed server-side
+            drafts = session.query(
+                TravelRequisitionForm.trf_number,
+                _TRAVEL_ROUTE.label("travel"),
+                TravelRequisitionForm.departure_date,
+                TravelRequisitionForm.return_date,
+                func.substr(TravelRequisitionForm.purpose, 1, 100).label("purpose"),
+                TravelRequisitionForm.created_at,
+                TravelRequisitionForm.updated_at,
+            ).filter(
+                TravelRequisitionForm.employee_id == employee_id,
+                TravelRequisitionForm.status == TRFStatus.DRAFT
+            ).order_by(TravelRequisitionForm.updated_at.desc()).all()
+
+            draft_list = [
+                {
+                    "trf_number": d.trf_number,
+                    "travel": d.travel,
+                    "departure": str(d.departure_date),
+                    "return_date": str(d.return_date) if d.return_date else None,
+                    "purpose": d.purpose,
+                    "created": d.created_at.date().isoformat(),
+                    "last_updated": d.updated_at.date().isoformat(),
+                }
+                for d in drafts
+            ]
+            data = {"employee_id": employee_id, "total": len(draft_list), "drafts": draft_list}
+            result = TRFListOutput.build_trusted(
+                success=True,
+                message=f"Found {len(drafts)} draft(s)",
+                data=data
+            ).to_json()
+            if _session is None:
+                _read_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return TRFListOutput(
+                success=False,
+                message="Unable to fetch draft TRFs",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 @tool(args_schema=TRFStatusInput)
-def get_trf_status(trf_number: str) -> str:
+def get_trf_status(trf_number: str, detail: bool = False, _session: Optional[Session] = None) -> str:
     """
     Get detailed status of a TRF including complete approval history.
     Shows who approved, when, and any comments.
+    Booking costs are summarised per booking; pass detail=True to also list
+    each confirmed hotel and flight.
     
     Use this tool when user wants to:
     - Check TRF status
@@ -287,106 +1031,72 @@ def get_trf_status(trf_number: str) -> str:
     
     Example: "What's the status of my TRF?"
     """
-    session = get_session()
-    
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        
-        if not trf:
+    cache_key = ("trf_status", trf_number, detail)
+    if _session is None and (cached := _read_cache_get(cache_key)) is not None:
+        return cached
+
+    with session_scope(_session) as session:
+        try:
+            query = session.query(TravelRequisitionForm)
+            if detail:
+                query = query.options(*_TRF_BOOKINGS_LOAD)
+            trf = query.filter_by(trf_number=trf_number).first()
+
+            if not trf:
+                return TRFStatusOutput(
+                    success=False,
+                    message=f"TRF {trf_number} not found",
+                    error=ErrorCodes.TRF_NOT_FOUND,
+                    error_details="No TRF matched the provided identifier."
+                ).to_json()
+
+            approvals = _approval_rows(trf)
+            if detail:
+                booking_summaries = _booking_details(trf)
+            else:
+                booking_summaries = _booking_summaries(session, trf.id)
+
+            if _session is None and trf.status == TRFStatus.APPROVED and not booking_summaries:
+                _SEARCH_POOL.submit(
+                    _prefetch_searches,
+                    trf.origin_city,
+                    trf.destination_city,
+                    trf.departure_date,
+                    trf.return_date or (trf.departure_date + timedelta(days=1)),
+                )
+
+            data = {
+                "trf_number": trf_number,
+                "status": trf.status.value,
+                "employee": trf.employee_name,
+                "travel": f"{trf.origin_city} to {trf.destination_city}",
+                "departure": trf.departure_date,
+                "approvals": approvals,
+                "rejection_reason": trf.rejection_reason,
+                "created": trf.created_at.date(),
+                "travel_bookings": booking_summaries,
+            }
+
+            result = TRFStatusOutput.build_trusted(
+                success=True,
+                message="TRF status retrieved",
+                data=data
+            ).to_json()
+            if _session is None:
+                _read_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
             return TRFStatusOutput(
                 success=False,
-                message=f"TRF {trf_number} not found",
-                error=ErrorCodes.TRF_NOT_FOUND,
-                error_details="No TRF matched the provided identifier."
-            ).model_dump_json()
-        
-        approvals: List[ApprovalInfo] = []
-        if trf.irm_approved_at:
-            approvals.append(ApprovalInfo(role="IRM", status="APPROVED", at=str(trf.irm_approved_at), comments=trf.irm_comments))
-        if trf.srm_approved_at:
-            approvals.append(ApprovalInfo(role="SRM", status="APPROVED", at=str(trf.srm_approved_at), comments=trf.srm_comments))
-        if trf.buh_approved_at:
-            approvals.append(ApprovalInfo(role="BUH", status="APPROVED", at=str(trf.buh_approved_at), comments=trf.buh_comments))
-        if trf.ssuh_approved_at:
-            approvals.append(ApprovalInfo(role="SSUH", status="APPROVED", at=str(trf.ssuh_approved_at), comments=trf.ssuh_comments))
-        if trf.bgh_approved_at:
-            approvals.append(ApprovalInfo(role="BGH", status="APPROVED", at=str(trf.bgh_approved_at), comments=trf.bgh_comments))
-        if trf.ssgh_approved_at:
-            approvals.append(ApprovalInfo(role="SSGH", status="APPROVED", at=str(trf.ssgh_approved_at), comments=trf.ssgh_comments))
-        if trf.cfo_approved_at:
-            approvals.append(ApprovalInfo(role="CFO", status="APPROVED", at=str(trf.cfo_approved_at), comments=trf.cfo_comments))
-        if trf.travel_desk_approved_at:
-            approvals.append(ApprovalInfo(role="Travel Desk", status="APPROVED", at=str(trf.travel_desk_approved_at), comments=trf.travel_desk_comments))
-        
-        booking_summaries: List[Dict[str, Any]] = []
-        for booking in trf.travel_bookings:
-            hotel_details = []
-            for hotel_booking in booking.hotel_bookings:
-                room = hotel_booking.room
-                hotel_name = room.hotel.name if room and room.hotel else None
-                hotel_details.append({
-                    "confirmation_number": hotel_booking.confirmation_number,
-                    "hotel_name": hotel_name,
-                    "check_in": str(hotel_booking.check_in_date),
-                    "check_out": str(hotel_booking.check_out_date),
-                    "final_cost": hotel_booking.final_cost
-                })
-
-            flight_details = []
-            for flight_booking in booking.flight_bookings:
-                flight = flight_booking.flight
-                flight_details.append({
-                    "pnr": flight_booking.pnr,
-                    "flight_number": flight.flight_number if flight else None,
-                    "cabin_class": flight_booking.cabin_class.value if flight_booking.cabin_class else None,
-                    "departure_date": str(flight.departure_date) if flight else None,
-                    "origin_city": flight.origin_city if flight else None,
-                    "destination_city": flight.destination_city if flight else None,
-                    "final_fare": flight_booking.final_fare
-                })
-            booking_summaries.append({
-                "booking_number": booking.booking_number,
-                "status": booking.status.value if booking.status else BookingStatus.PENDING.value,
-                "total_cost": booking.total_cost,
-                "total_hotel_cost": booking.total_hotel_cost,
-                "total_flight_cost": booking.total_flight_cost,
-                "confirmed_hotels": hotel_details,
-                "confirmed_flights": flight_details,
-                "booked_at": booking.booking_date.strftime("%Y-%m-%d %H:%M:%S") if booking.booking_date else None,
-                "confirmed_at": booking.confirmation_date.strftime("%Y-%m-%d %H:%M:%S") if booking.confirmation_date else None
-            })
-        
-        data = TRFStatusData(
-            trf_number=trf_number,
-            status=trf.status.value,
-            employee=trf.employee_name,
-            travel=f"{trf.origin_city} to {trf.destination_city}",
-            departure=str(trf.departure_date),
-            approvals=approvals,
-            rejection_reason=trf.rejection_reason,
-            created=trf.created_at.strftime("%Y-%m-%d"),
-            travel_bookings=booking_summaries
-        )
-        
-        return TRFStatusOutput(
-            success=True,
-            message="TRF status retrieved",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return TRFStatusOutput(
-            success=False,
-            message="Unable to fetch TRF status",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+                message="Unable to fetch TRF status",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 @tool(args_schema=EmployeeTRFListInput)
-def list_employee_trfs(employee_id: str, status_filter: Optional[str] = None) -> str:
+def list_employee_trfs(employee_id: str, status_filter: Optional[str] = None, limit: int = 25, offset: int = 0, _session: Optional[Session] = None) -> str:
     """
     List all TRFs for an employee with optional status filter.
     Shows complete travel history.
@@ -398,59 +1108,80 @@ def list_employee_trfs(employee_id: str, status_filter: Optional[str] = None) ->
     
     Example: "Show me all my pending travel requests"
     """
-    session = get_session()
-    
-    try:
-        query = session.query(TravelRequisitionForm).filter_by(employee_id=employee_id)
-        
-        if status_filter:
-            if status_filter.lower() == "pending":
-                query = query.filter(TravelRequisitionForm.status.in_([
-                    TRFStatus.PENDING_IRM, TRFStatus.PENDING_SRM, TRFStatus.PENDING_BUH,
-                    TRFStatus.PENDING_SSUH, TRFStatus.PENDING_BGH, TRFStatus.PENDING_SSGH,
-                    TRFStatus.PENDING_CFO, TRFStatus.PENDING_TRAVEL_DESK
-                ]))
-            elif status_filter.lower() != "all":
-                try:
-                    query = query.filter(TravelRequisitionForm.status == TRFStatus[status_filter.upper()])
-                except KeyError:
-                    pass
-        
-        trfs = query.order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            EmployeeTRFSummary(
-                trf_number=t.trf_number,
-                status=t.status.value,
-                travel=f"{t.origin_city} to {t.destination_city}",
-                departure=str(t.departure_date),
-                purpose=t.purpose[:80],
-                created=t.created_at.strftime("%Y-%m-%d")
+    cache_key = ("trfs", employee_id, status_filter, limit, offset)
+    if _session is None and (cached := _read_cache_get(cache_key)) is not None:
+        return cached
+
+    with session_scope(_session) as session:
+        try:
+            query = session.query(
+                TravelRequisitionForm.trf_number,
+                TravelRequisitionForm.status,
+                _TRAVEL_ROUTE.label("travel"),
+                TravelRequisitionForm.departure_date,
+                func.substr(TravelRequisitionForm.purpose, 1, 80).label("purpose"),
+                TravelRequisitionForm.created_at,
+                # Full match count rides along on every row of the page
+                func.count().over().label("total_count"),
+            ).filter(TravelRequisitionForm.employee_id == employee_id)
+
+            if status_filter:
+                status_key = status_filter.upper()
+                if status_key == "PENDING":
+                    query = query.filter(_PENDING_FILTER)
+                elif status_key in _STATUS_MAP:
+                    query = query.filter(TravelRequisitionForm.status == _STATUS_MAP[status_key])
+
+            trfs = (
+                query.order_by(TravelRequisitionForm.created_at.desc())
+                .limit(limit)
+                .offset(offset)
+                .all()
             )
-            for t in trfs
-        ]
-        data = EmployeeTRFListData(
-            employee_id=employee_id,
-            total=len(trf_list),
-            filter=status_filter or "all",
-            trfs=trf_list
-        )
-        
-        return EmployeeTRFListOutput(
-            success=True,
-            message=f"Found {len(trfs)} TRF(s)",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return EmployeeTRFListOutput(
-            success=False,
-            message="Unable to fetch TRF list",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+            if trfs:
+                total = trfs[0].total_count
+            elif offset:
+                # Paged past the end, so no row carried the window count
+                total = query.with_entities(func.count()).scalar()
+            else:
+                total = 0
+
+            trf_list = [
+                {
+                    "trf_number": t.trf_number,
+                    "status": _ENUM_VALUES[t.status],
+                    "travel": t.travel,
+                    "departure": str(t.departure_date),
+                    "purpose": t.purpose,
+                    "created": t.created_at.date().isoformat(),
+                }
+                for t in trfs
+            ]
+            data = {
+                "employee_id": employee_id,
+                "total": total,
+                "filter": status_filter or "all",
+                "offset": offset,
+                "limit": limit,
+                "trfs": trf_list,
+            }
+
+            result = EmployeeTRFListOutput.build_trusted(
+                success=True,
+                message=f"Found {total} TRF(s), showing {len(trf_list)}",
+                data=data
+            ).to_json()
+            if _session is None:
+                _read_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return EmployeeTRFListOutput(
+                success=False,
+                message="Unable to fetch TRF list",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 # ============================================================================
@@ -458,7 +1189,7 @@ def list_employee_trfs(employee_id: str, status_filter: Optional[str] = None) ->
 # ============================================================================
 
 @tool(args_schema=TRFApprovalContextInput)
-def get_trf_approval_details(trf_number: str) -> str:
+def get_trf_approval_details(trf_number: str, _session: Optional[Session] = None) -> str:
     """
     Retrieve TRF details with context to determine the next approval level automatically.
     This tool should be called BEFORE approve_trf() so the LLM is contextually aware
@@ -483,87 +1214,65 @@ def get_trf_approval_details(trf_number: str) -> str:
     
     This ensures the LLM is always contextually aware before taking approval actions.
     """
-    session = get_session()
-    
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        
-        if not trf:
-            return TRFApprovalContextOutput(
-                success=False,
-                message=f"TRF {trf_number} not found",
-                error=ErrorCodes.TRF_NOT_FOUND,
-                error_details="No TRF matched the provided identifier."
-            ).model_dump_json()
-        
-        # Determine next approval level based on current status
-        status_to_level = {
-            TRFStatus.PENDING_IRM: "irm",
-            TRFStatus.PENDING_SRM: "srm",
-            TRFStatus.PENDING_BUH: "buh",
-            TRFStatus.PENDING_SSUH: "ssuh",
-            TRFStatus.PENDING_BGH: "bgh",
-            TRFStatus.PENDING_SSGH: "ssgh",
-            TRFStatus.PENDING_CFO: "cfo",
-            TRFStatus.PENDING_TRAVEL_DESK: "travel_desk",
-        }
-        
-        next_level = status_to_level.get(trf.status, None)
-        
-        if not next_level:
-            return TRFApprovalContextOutput(
-                success=False,
-                message=f"TRF is in {trf.status.value} status - cannot be approved",
-                error=ErrorCodes.INVALID_STATUS,
-                error_details=f"Only TRFs in PENDING status can be approved. Current: {trf.status.value}"
-            ).model_dump_json()
-        
-        data = TRFApprovalContextInfo(
-            trf_number=trf_number,
-            current_status=trf.status.value,
-            next_approval_level=next_level,
-            employee_name=trf.employee_name,
-            employee_id=trf.employee_id,
-            travel_type=trf.travel_type.value if trf.travel_type else None,
-            origin_city=trf.origin_city,
-            destination_city=trf.destination_city,
-            departure_date=str(trf.departure_date) if trf.departure_date else None,
-            return_date=str(trf.return_date) if trf.return_date else None,
-            purpose=trf.purpose,
-            estimated_cost=trf.estimated_cost,
-            irm_approved="Yes" if trf.irm_approved_at else "No",
-            irm_approved_at=trf.irm_approved_at.strftime("%Y-%m-%d %H:%M") if trf.irm_approved_at else None,
-            irm_comments=trf.irm_comments,
-            srm_approved="Yes" if trf.srm_approved_at else "No",
-            srm_approved_at=trf.srm_approved_at.strftime("%Y-%m-%d %H:%M") if trf.srm_approved_at else None,
-            buh_approved="Yes" if trf.buh_approved_at else "No",
-            buh_approved_at=trf.buh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.buh_approved_at else None,
-            ssuh_approved="Yes" if trf.ssuh_approved_at else "No",
-            ssuh_approved_at=trf.ssuh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.ssuh_approved_at else None,
-            bgh_approved="Yes" if trf.bgh_approved_at else "No",
-            bgh_approved_at=trf.bgh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.bgh_approved_at else None,
-            ssgh_approved="Yes" if trf.ssgh_approved_at else "No",
-            ssgh_approved_at=trf.ssgh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.ssgh_approved_at else None,
-            cfo_approved="Yes" if trf.cfo_approved_at else "No",
-            cfo_approved_at=trf.cfo_approved_at.strftime("%Y-%m-%d %H:%M") if trf.cfo_approved_at else None,
-            travel_desk_approved="Yes" if trf.travel_desk_approved_at else "No"
-        )
-        
-        return TRFApprovalContextOutput(
-            success=True,
-            message=f"TRF {trf_number} is pending {next_level.upper()} approval",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return TRFApprovalContextOutput(
-            success=False,
-            message="Unable to fetch TRF approval details",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    # Lazily built approval-chain schema (see agent.schema.__getattr__)
+    from agent.schema import TRFApprovalContextOutput
+
+    cache_key = ("trf_approval", trf_number)
+    if _session is None and (cached := _read_cache_get(cache_key)) is not None:
+        return cached
+
+    with session_scope(_session) as session:
+        try:
+            trf = _get_trf(session, trf_number, _TRF_APPROVAL_CONTEXT)
+
+            if not trf:
+                return TRFApprovalContextOutput.failure_json(
+                    message=f"TRF {trf_number} not found",
+                    error=ErrorCodes.TRF_NOT_FOUND,
+                    error_details="No TRF matched the provided identifier."
+                )
+
+            # Determine next approval level based on current status
+            next_level = _STATUS_TO_LEVEL.get(trf.status)
+
+            if not next_level:
+                return TRFApprovalContextOutput.failure_json(
+                    message=f"TRF is in {trf.status.value} status - cannot be approved",
+                    error=ErrorCodes.INVALID_STATUS,
+                    error_details=f"Only TRFs in PENDING status can be approved. Current: {trf.status.value}"
+                )
+
+            data = dict(
+                trf_number=trf_number,
+                current_status=trf.status,
+                next_approval_level=next_level,
+                employee_name=trf.employee_name,
+                employee_id=trf.employee_id,
+                travel_type=_ENUM_VALUES.get(trf.travel_type),
+                origin_city=trf.origin_city,
+                destination_city=trf.destination_city,
+                departure_date=trf.departure_date,
+                return_date=trf.return_date,
+                purpose=trf.purpose,
+                estimated_cost=trf.estimated_cost,
+                approvals=_approval_chain_wire(trf)
+            )
+
+            # Trusted ORM values already in the TRFApprovalContextInfo wire
+            # shape, so serialize them directly instead of building the models
+            result = TRFApprovalContextOutput.success_json(
+                f"TRF {trf_number} is pending {next_level.upper()} approval", data
+            )
+            if _session is None:
+                _read_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return TRFApprovalContextOutput.failure_json(
+                message="Unable to fetch TRF approval details",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            )
 
 
 @tool(args_schema=TRFApprovalInput)
@@ -571,7 +1280,8 @@ def approve_trf(
     trf_number: str,
     approver_level: str,
     comments: Optional[str] = None,
-    require_cfo: bool = False
+    require_cfo: bool = False,
+    _session: Optional[Session] = None
 ) -> str:
     """
     Approve a TRF at the specified approval level.
@@ -579,145 +1289,443 @@ def approve_trf(
     For Travel Desk: This acknowledges the request and moves it to 'APPROVED' status.
     It confirms you are working on it. It does NOT mark it as completed.
     """
-    session = get_session()
+    level = approver_level.lower()
+    if level not in _APPROVAL_TRANSITIONS:
+        return TRFApprovalOutput.failure_json(message=f"Invalid level: {level}", error=ErrorCodes.INVALID_LEVEL)
+    expected, next_status = _APPROVAL_TRANSITIONS[level]
+    at_attr, comments_attr = _APPROVAL_FIELDS[level]
+
+    with session_scope(_session) as session:
+        try:
+            now = _utcnow()
+            by_number = TravelRequisitionForm.trf_number == trf_number
+
+            # Check-and-advance in one statement: the status guard sits in the
+            # WHERE clause, so two approvers racing on the same level cannot
+            # both move the TRF on.
+            trf = session.execute(
+                update(TravelRequisitionForm)
+                .where(by_number, TravelRequisitionForm.status == expected)
+                .values({
+                    "status": next_status,
+                    at_attr: now,
+                    comments_attr: comments,
+                })
+                .returning(*_TRF_DECISION_RETURNING)
+            ).first()
+
+            if trf is None:
+                # Idempotency: If Travel Desk already approved it, just update comments
+                if level == "travel_desk":
+                    trf = session.execute(
+                        update(TravelRequisitionForm)
+                        .where(by_number, TravelRequisitionForm.status == TRFStatus.APPROVED)
+                        .values(travel_desk_comments=comments, travel_desk_approved_at=now)
+                        .returning(TravelRequisitionForm.employee_id)
+                    ).first()
+                    if trf is not None:
+                        _mark_stale(session, trf.employee_id, trf_number)
+                        _commit_tool(session)
+                        return TRFApprovalOutput.build_trusted(
+                            success=True, 
+                            message="TRF is already Approved/In-Progress. Updated comments.",
+                            data=dict(
+                                trf_number=trf_number,
+                                new_status=TRFStatus.APPROVED,
+                                approved_at=now.isoformat(sep=" ", timespec="seconds"),
+                            )
+                        ).to_json()
+
+                current = session.execute(_TRF_STATUS_BY_NUMBER, {"trf_number": trf_number}).scalar_one_or_none()
+                if current is None:
+                    return TRFApprovalOutput.failure_json(message="TRF not found", error=ErrorCodes.TRF_NOT_FOUND)
+                return TRFApprovalOutput.failure_json(
+                    message=f"Wrong status: {current.value}, expected: {expected.value}",
+                    error=ErrorCodes.INVALID_SEQUENCE
+                )
+
+            _mark_stale(session, trf.employee_id, trf_number)
+            _commit_tool(session)
+
+            msg = "TRF Approved. Status is now APPROVED. You may proceed with bookings." if level == "travel_desk" else f"TRF approved by {level.upper()}"
+
+            data = dict(
+                trf_number=trf_number,
+                new_status=trf.status,
+                approved_at=now.isoformat(sep=" ", timespec="seconds"),
+                travel_type=_ENUM_VALUES.get(trf.travel_type),
+                employee_name=trf.employee_name,
+                origin_city=trf.origin_city,
+                destination_city=trf.destination_city,
+                departure_date=str(trf.departure_date),
+                purpose=trf.purpose,
+                estimated_cost=trf.estimated_cost
+            )
+
+            return TRFApprovalOutput.build_trusted(success=True, message=msg, data=data).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
+            return TRFApprovalOutput.failure_json(message=str(e), error=ErrorCodes.SYSTEM_ERROR)
+
+@tool(args_schema=TRFBulkApprovalInput)
+def bulk_approve_trf(
+    trf_numbers: List[str],
+    approver_level: str,
+    comments: Optional[str] = None,
+    _session: Optional[Session] = None
+) -> str:
+    """
+    Approve several TRFs at the same approval level in one step.
+    TRFs that are not pending at that level are skipped, not failed.
     
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf:
-            return TRFApprovalOutput(success=False, message="TRF not found", error=ErrorCodes.TRF_NOT_FOUND).model_dump_json()
-        
-        level = approver_level.lower()
-        now = datetime.now()
-        
-        # WORKFLOW UPDATE: Travel Desk moves PENDING -> APPROVED
-        status_map = {
-            "irm": (TRFStatus.PENDING_IRM, TRFStatus.PENDING_SRM),
-            "srm": (TRFStatus.PENDING_SRM, TRFStatus.PENDING_BUH),
-            "buh": (TRFStatus.PENDING_BUH, TRFStatus.PENDING_SSUH),
-            "ssuh": (TRFStatus.PENDING_SSUH, TRFStatus.PENDING_BGH),
-            "bgh": (TRFStatus.PENDING_BGH, TRFStatus.PENDING_SSGH),
-            "ssgh": (TRFStatus.PENDING_SSGH, TRFStatus.PENDING_CFO),
-            "cfo": (TRFStatus.PENDING_CFO, TRFStatus.PENDING_TRAVEL_DESK),
-            "travel_desk": (TRFStatus.PENDING_TRAVEL_DESK, TRFStatus.APPROVED) 
-        }
-        
-        if level not in status_map:
-            return TRFApprovalOutput(success=False, message=f"Invalid level: {level}", error=ErrorCodes.INVALID_LEVEL).model_dump_json()
-        
-        expected, next_status = status_map[level]
-        
-        # Idempotency: If Travel Desk already approved it, just update comments
-        if level == "travel_desk" and trf.status == TRFStatus.APPROVED:
-            trf.travel_desk_comments = comments
-            trf.travel_desk_approved_at = now
-            session.commit()
-            return TRFApprovalOutput(
-                success=True, 
-                message="TRF is already Approved/In-Progress. Updated comments.",
-                data=TRFApprovalData(
-                    trf_number=trf_number, new_status=trf.status.value, approved_at=str(now)
+    Use this tool when user wants to:
+    - Approve multiple TRFs from their queue at once
+    
+    Example: "Approve TRF202500002, TRF202500003 and TRF202500007"
+    """
+    level = approver_level.lower()
+    if level not in _APPROVAL_TRANSITIONS:
+        return TRFBulkApprovalOutput.failure_json(message=f"Invalid level: {level}", error=ErrorCodes.INVALID_LEVEL)
+    expected, next_status = _APPROVAL_TRANSITIONS[level]
+    at_attr, comments_attr = _APPROVAL_FIELDS[level]
+    requested = list(dict.fromkeys(trf_numbers))
+
+    with session_scope(_session) as session:
+        try:
+            now = _utcnow()
+            rows = session.execute(
+                update(TravelRequisitionForm)
+                .where(
+                    TravelRequisitionForm.trf_number.in_(requested),
+                    TravelRequisitionForm.status == expected,
                 )
-            ).model_dump_json()
+                .values({
+                    "status": next_status,
+                    at_attr: now,
+                    comments_attr: comments,
+                })
+                .returning(TravelRequisitionForm.trf_number, TravelRequisitionForm.employee_id)
+            ).all()
 
-        if trf.status != expected:
-            return TRFApprovalOutput(
-                success=False,
-                message=f"Wrong status: {trf.status.value}, expected: {expected.value}",
-                error=ErrorCodes.INVALID_SEQUENCE
-            ).model_dump_json()
-        
-        # Set Approval Fields
-        if level == "travel_desk":
-            trf.travel_desk_approved_at = now
-            trf.travel_desk_comments = comments
-        else:
-            setattr(trf, f"{level}_approved_at", now)
-            setattr(trf, f"{level}_comments", comments)
-        
-        trf.status = next_status
-        session.commit()
-        
-        msg = "TRF Approved. Status is now APPROVED. You may proceed with bookings." if level == "travel_desk" else f"TRF approved by {level.upper()}"
-
-        data = TRFApprovalData(
-            trf_number=trf_number,
-            new_status=trf.status.value,
-            approved_at=now.strftime("%Y-%m-%d %H:%M:%S"),
-            travel_type=trf.travel_type.value if trf.travel_type else None,
-            employee_name=trf.employee_name,
-            origin_city=trf.origin_city,
-            destination_city=trf.destination_city,
-            departure_date=str(trf.departure_date),
-            purpose=trf.purpose,
-            estimated_cost=trf.estimated_cost
-        )
-        
-        return TRFApprovalOutput(success=True, message=msg, data=data).model_dump_json()
-        
-    except Exception as e:
-        session.rollback()
-        return TRFApprovalOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
+            for row in rows:
+                _mark_stale(session, row.employee_id, row.trf_number)
+            _commit_tool(session)
+            approved_numbers = {row.trf_number for row in rows}
+
+            data = dict(
+                new_status=next_status,
+                approved_at=now.isoformat(sep=" ", timespec="seconds"),
+                approved=[number for number in requested if number in approved_numbers],
+                skipped=[number for number in requested if number not in approved_numbers],
+            )
+            return TRFBulkApprovalOutput.build_trusted(
+                success=bool(rows),
+                message=f"Approved {len(rows)} of {len(requested)} TRF(s) at {level.upper()}",
+                error=None if rows else ErrorCodes.INVALID_SEQUENCE,
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
+            return TRFBulkApprovalOutput.failure_json(message=str(e), error=ErrorCodes.SYSTEM_ERROR)
 
 # In database_utils.py
 
 @tool(args_schema=TRFRejectionInput)
-def reject_trf(trf_number: str, approver_level: str, rejection_reason: str) -> str:
+def reject_trf(trf_number: str, approver_level: str, rejection_reason: str, _session: Optional[Session] = None) -> str:
     """
     Reject a TRF at specified approval level.
     Travel Desk can use this if bookings are unavailable or too expensive.
     """
-    session = get_session()
-    
-    try:
-        if len(rejection_reason) < 10:
-            return TRFRejectionOutput(success=False, message="Reason too short (min 10 chars)", error=ErrorCodes.INVALID_REASON).model_dump_json()
-        
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf:
-            return TRFRejectionOutput(success=False, message="TRF not found", error=ErrorCodes.TRF_NOT_FOUND).model_dump_json()
-        
-        # --- IMPROVEMENT: Allow Rejection from Pending Travel Desk ---
-        # Ensure we don't reject already completed ones, but allow PENDING_TRAVEL_DESK
-        if trf.status == TRFStatus.COMPLETED:
-             return TRFRejectionOutput(success=False, message="Cannot reject a COMPLETED TRF", error=ErrorCodes.INVALID_STATUS).model_dump_json()
-        # -------------------------------------------------------------
-
-        trf.status = TRFStatus.REJECTED
-        trf.rejection_reason = f"[{approver_level.upper()}] {rejection_reason}"
-        trf.rejected_by = approver_level.lower()
-        session.commit()
-        
-        data = TRFRejectionData(
-            trf_number=trf_number,
-            status=TRFStatusValues.REJECTED,
-            reason=rejection_reason,
-            travel_type=trf.travel_type.value if trf.travel_type else None,
-            employee_name=trf.employee_name,
-            origin_city=trf.origin_city,
-            destination_city=trf.destination_city,
-            departure_date=str(trf.departure_date) if trf.departure_date else None
-        )
-        
-        return TRFRejectionOutput(success=True, message=f"TRF rejected by {approver_level}.", data=data).model_dump_json()
-        
-    except Exception as e:
-        session.rollback()
-        return TRFRejectionOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
-
+    # Pure input checks first, so a bad call never touches the database
+    level = approver_level.lower()
+    if level not in _APPROVAL_TRANSITIONS:
+        return TRFRejectionOutput.failure_json(message=f"Invalid level: {level}", error=ErrorCodes.INVALID_LEVEL)
+    if len(rejection_reason) < 10:
+        return TRFRejectionOutput.failure_json(message="Reason too short (min 10 chars)", error=ErrorCodes.INVALID_REASON)
+
+    with session_scope(_session) as session:
+        try:
+            # --- IMPROVEMENT: Allow Rejection from Pending Travel Desk ---
+            # Ensure we don't reject already completed ones, but allow PENDING_TRAVEL_DESK.
+            # The guard rides in the UPDATE so a concurrent completion cannot slip in between.
+            trf = session.execute(
+                update(TravelRequisitionForm)
+                .where(
+                    TravelRequisitionForm.trf_number == trf_number,
+                    TravelRequisitionForm.status != TRFStatus.COMPLETED,
+                )
+                .values(
+                    status=TRFStatus.REJECTED,
+                    rejection_reason=f"[{approver_level.upper()}] {rejection_reason}",
+                    rejected_by=level,
+                )
+                .returning(*_TRF_DECISION_RETURNING)
+            ).first()
+            if trf is None:
+                if session.execute(_TRF_STATUS_BY_NUMBER, {"trf_number": trf_number}).scalar_one_or_none() is None:
+                    return TRFRejectionOutput.failure_json(message="TRF not found", error=ErrorCodes.TRF_NOT_FOUND)
+                return TRFRejectionOutput.failure_json(message="Cannot reject a COMPLETED TRF", error=ErrorCodes.INVALID_STATUS)
+            # -------------------------------------------------------------
+
+            _mark_stale(session, trf.employee_id, trf_number)
+            _commit_tool(session)
+
+            data = dict(
+                trf_number=trf_number,
+                status=TRFStatusValues.REJECTED,
+                reason=rejection_reason,
+                travel_type=_ENUM_VALUES.get(trf.travel_type),
+                employee_name=trf.employee_name,
+                origin_city=trf.origin_city,
+                destination_city=trf.destination_city,
+                departure_date=str(trf.departure_date) if trf.departure_date else None
+            )
 
+            return TRFRejectionOutput.build_trusted(success=True, message=f"TRF rejected by {approver_level}.", data=data).to_json()
 
+        except Exception as e:
+            _rollback_tool(session)
+            return TRFRejectionOutput.failure_json(message=str(e), error=ErrorCodes.SYSTEM_ERROR)
 
 
 # ============================================================================
 # LANGCHAIN TOOLS - ROLE-SPECIFIC PENDING APPLICATIONS
 # ============================================================================
 
+def _yes_no(column: Any) -> Any:
+    return case((column.is_not(None), "Yes"), else_="No")
+
+
+def _or_no_comments(column: Any) -> Any:
+    return func.coalesce(func.nullif(column, ""), "No comments")
+
+
+# Approver queue per role: the status it reviews and the extra
+# (label, TRF column, SQL formatter) fields it shows about the previous level(s).
+# Extra fields are rendered after "days_pending".
+_PENDING_QUEUES: Dict[str, Tuple[TRFStatus, Tuple[Tuple[str, str, Callable[[Any], Any]], ...]]] = {
+    "IRM": (TRFStatus.PENDING_IRM, ()),
+    "SRM": (TRFStatus.PENDING_SRM, (
+        ("irm_approved", "irm_approved_at", _yes_no),
+        ("irm_comments", "irm_comments", _or_no_comments),
+    )),
+    "BUH": (TRFStatus.PENDING_BUH, (
+        ("irm_approved", "irm_approved_at", _yes_no),
+        ("srm_approved", "srm_approved_at", _yes_no),
+    )),
+    "SSUH": (TRFStatus.PENDING_SSUH, (
+        ("buh_approved", "buh_approved_at", _yes_no),
+        ("buh_comments", "buh_comments", _or_no_comments),
+    )),
+    "BGH": (TRFStatus.PENDING_BGH, (
+        ("ssuh_approved", "ssuh_approved_at", _yes_no),
+    )),
+    "SSGH": (TRFStatus.PENDING_SSGH, (
+        ("bgh_approved", "bgh_approved_at", _yes_no),
+        ("bgh_comments", "bgh_comments", _or_no_comments),
+    )),
+    "CFO": (TRFStatus.PENDING_CFO, (
+        ("ssgh_approved", "ssgh_approved_at", _yes_no),
+        ("ssgh_comments", "ssgh_comments", _or_no_comments),
+    )),
+}
+
+
+def _pending_application_json(extra_fields: Iterable[Tuple[str, str, Callable[[Any], Any]]]) -> Any:
+    """One queue entry as a JSON object, rendered entirely by Postgres.
+
+    json_build_object (not jsonb) keeps the key order below; json_strip_nulls
+    drops a missing estimated_cost as the old to_json path did.
+    """
+    trf = TravelRequisitionForm
+    fields = [
+        ("trf_number", trf.trf_number),
+        ("employee_name", trf.employee_name),
+        ("employee_id", trf.employee_id),
+        ("travel", _TRAVEL_ROUTE),
+        ("departure_date", func.to_char(trf.departure_date, "YYYY-MM-DD")),
+        ("estimated_cost", trf.estimated_cost),
+        ("purpose", func.substr(trf.purpose, 1, 100)),
+    ]
+    fields.append(("created", func.to_char(trf.created_at, "YYYY-MM-DD HH24:MI")))
+    # created_at is naive UTC; whole days elapsed, as timedelta.days gave
+    fields.append((
+        "days_pending",
+        cast(func.date_part("day", func.timezone("UTC", func.now()) - trf.created_at), Integer),
+    ))
+    fields.extend((label, formatter(getattr(trf, attr))) for label, attr, formatter in extra_fields)
+    return func.json_strip_nulls(
+        func.json_build_object(*(arg for label, expr in fields for arg in (literal_column(f"'{label}'"), expr)))
+    )
+
+
+# One prebuilt aggregate per role: Postgres returns the whole queue as a single
+# JSON array (newest first), so no per-row Python objects are built.
+_PENDING_QUERIES = {
+    role: select(
+        func.json_agg(
+            aggregate_order_by(
+                _pending_application_json(extra_fields),
+                TravelRequisitionForm.created_at.desc(),
+            )
+        )
+    ).where(TravelRequisitionForm.status == status)
+    for role, (status, extra_fields) in _PENDING_QUEUES.items()
+}
+
+
+# Every approver queue in one statement, one aggregated row per status. The
+# CASE picks each status's entry shape (its role's extra fields).
+_PENDING_ROLE_BY_STATUS = {status: role for role, (status, _) in _PENDING_QUEUES.items()}
+_ALL_PENDING_QUERY = (
+    select(
+        TravelRequisitionForm.status,
+        func.json_agg(
+            aggregate_order_by(
+                case(
+                    *(
+                        (TravelRequisitionForm.status == status, _pending_application_json(extra_fields))
+                        for status, extra_fields in _PENDING_QUEUES.values()
+                    )
+                ),
+                TravelRequisitionForm.created_at.desc(),
+            )
+        ),
+    )
+    .where(TravelRequisitionForm.status.in_(_PENDING_ROLE_BY_STATUS))
+    .group_by(TravelRequisitionForm.status)
+)
+
+
+# List tools that read scalar TRF columns only. With DB_RAISELOAD set (dev/test),
+# a stray relationship access there fails loudly instead of issuing one query
+# per row. Off by default: tools chained on one _session reuse those objects.
+_SCALAR_ONLY = (raiseload("*", sql_only=True),) if settings.DB_RAISELOAD else ()
+
+# Rows hydrated per batch when streaming the tracking view
+_TRACK_ALL_BATCH = 200
+
+
+# Travel Desk queues, built once like the role queues above. A prebuilt
+# select() memoizes its compiled-cache key, so repeat calls skip both query
+# construction and cache-key generation (cheaper than a lambda_stmt, which
+# re-analyses its closure per call). The tracking view defers purpose and
+# fetches only its 150-character preview.
+_TRACK_ALL_QUERY = (
+    select(TravelRequisitionForm, func.substr(TravelRequisitionForm.purpose, 1, 150))
+    .options(defer(TravelRequisitionForm.purpose), *_SCALAR_ONLY)
+    .where(TravelRequisitionForm.status != TRFStatus.DRAFT)
+    .order_by(TravelRequisitionForm.created_at.desc())
+)
+_TRAVEL_DESK_QUEUE = (
+    select(TravelRequisitionForm)
+    # Booking counts for the status label, in one extra query per call
+    .options(selectinload(TravelRequisitionForm.travel_bookings))
+    .where(TravelRequisitionForm.status.in_((TRFStatus.PENDING_TRAVEL_DESK, TRFStatus.APPROVED)))
+    .order_by(
+        # Sort by status (Pending first) then date
+        TravelRequisitionForm.status.desc(),
+        TravelRequisitionForm.created_at.asc(),
+    )
+    .limit(bindparam("limit"))
+)
+
+
+def _pending_queue_data(role: str, applications: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return dict(
+        role=role,
+        total_pending=len(applications),
+        applications=applications,
+        message=f"Found {len(applications)} pending application(s) awaiting your approval"
+    )
+
+
+def _pending_queue_json(role: str, applications: List[Dict[str, Any]]) -> str:
+    return PendingApplicationsOutput.success_json(
+        f"Found {len(applications)} pending application(s) for {role}",
+        _pending_queue_data(role, applications),
+    )
+
+
+def _get_pending_for_role(role: str, _session: Optional[Session] = None) -> str:
+    """Shared body of the get_pending_<role>_applications tools."""
+    cache_key = ("pending", role)
+    if _session is None and (cached := _read_cache_get(cache_key)) is not None:
+        return cached
+
+    with session_scope(_session) as session:
+        try:
+            applications = session.execute(_PENDING_QUERIES[role]).scalar() or []
+
+            result = _pending_queue_json(role, applications)
+            if _session is None:
+                _read_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return PendingApplicationsOutput.failure_json(
+                message=str(e),
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e),
+            )
+
+
 @tool(args_schema=BaseToolInput)
-def get_pending_irm_applications() -> str:
+def get_all_pending_applications(_session: Optional[Session] = None) -> str:
+    """
+    Get the pending approval queues of every approver role (IRM to CFO) at once.
+    Returns each role's queue in the same shape as get_pending_<role>_applications.
+    
+    Use this tool when:
+    - An overview of all approval queues is needed
+    - Checking where TRFs are waiting in the approval chain
+    
+    Example: "Show me everything pending approval"
+    """
+    cache_key = ("pending", "ALL")
+    if _session is None and (cached := _read_cache_get(cache_key)) is not None:
+        return cached
+
+    with session_scope(_session) as session:
+        try:
+            by_role = {
+                _PENDING_ROLE_BY_STATUS[status]: applications
+                for status, applications in session.execute(_ALL_PENDING_QUERY)
+            }
+
+            queues = {}
+            for role in _PENDING_QUEUES:
+                applications = by_role.get(role, [])
+                queues[role] = _pending_queue_data(role, applications)
+                # One query answers every per-role tool too; seed their entries
+                if _session is None:
+                    _read_cache_put(("pending", role), _pending_queue_json(role, applications))
+
+            total = sum(len(applications) for applications in by_role.values())
+            result = AllPendingApplicationsOutput.success_json(
+                f"Found {total} pending application(s) across {len(queues)} approver queues",
+                dict(
+                    total_pending=total,
+                    queues=queues,
+                    message=", ".join(f"{role}: {queue['total_pending']}" for role, queue in queues.items()),
+                ),
+            )
+            if _session is None:
+                _read_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
+            return AllPendingApplicationsOutput.failure_json(
+                message=str(e),
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e),
+            )
+
+
+@tool(args_schema=BaseToolInput)
+def get_pending_irm_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending IRM approval.
     Shows TRFs that have been submitted but not yet approved by IRM.
@@ -729,54 +1737,11 @@ def get_pending_irm_applications() -> str:
     
     Example: "Show me my pending applications"
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_IRM
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="IRM",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for IRM",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("IRM", _session)
 
 
 @tool(args_schema=BaseToolInput)
-def get_pending_srm_applications() -> str:
+def get_pending_srm_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending SRM approval (after IRM approval).
     Shows TRFs that have been approved by IRM but need SRM review.
@@ -788,316 +1753,47 @@ def get_pending_srm_applications() -> str:
     
     Example: "Show me my pending applications"
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_SRM
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "irm_approved": "Yes" if t.irm_approved_at else "No",
-                "irm_comments": t.irm_comments or "No comments",
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="SRM",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for SRM",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("SRM", _session)
 
 
 @tool(args_schema=BaseToolInput)
-def get_pending_buh_applications() -> str:
+def get_pending_buh_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending BUH approval (after IRM and SRM approval).
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_BUH
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "irm_approved": "Yes" if t.irm_approved_at else "No",
-                "srm_approved": "Yes" if t.srm_approved_at else "No",
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="BUH",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for BUH",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("BUH", _session)
 
 
 @tool(args_schema=BaseToolInput)
-def get_pending_ssuh_applications() -> str:
+def get_pending_ssuh_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending SSUH approval (after BUH approval).
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_SSUH
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "buh_approved": "Yes" if t.buh_approved_at else "No",
-                "buh_comments": t.buh_comments or "No comments",
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="SSUH",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for SSUH",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("SSUH", _session)
 
 
 @tool(args_schema=BaseToolInput)
-def get_pending_bgh_applications() -> str:
+def get_pending_bgh_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending BGH approval (after SSUH approval).
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_BGH
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "ssuh_approved": "Yes" if t.ssuh_approved_at else "No",
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="BGH",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for BGH",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("BGH", _session)
 
 
 @tool(args_schema=BaseToolInput)
-def get_pending_ssgh_applications() -> str:
+def get_pending_ssgh_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending SSGH approval (after BGH approval).
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_SSGH
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "bgh_approved": "Yes" if t.bgh_approved_at else "No",
-                "bgh_comments": t.bgh_comments or "No comments",
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="SSGH",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for SSGH",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("SSGH", _session)
 
 
 @tool(args_schema=BaseToolInput)
-def get_pending_cfo_applications() -> str:
+def get_pending_cfo_applications(_session: Optional[Session] = None) -> str:
     """
     Get all TRFs pending CFO approval (after all lower-level approvals).
     """
-    session = get_session()
-    
-    try:
-        trfs = session.query(TravelRequisitionForm).filter_by(
-            status=TRFStatus.PENDING_CFO
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        trf_list = [
-            {
-                "trf_number": t.trf_number,
-                "employee_name": t.employee_name,
-                "employee_id": t.employee_id,
-                "travel": f"{t.origin_city} to {t.destination_city}",
-                "departure_date": str(t.departure_date),
-                "estimated_cost": t.estimated_cost,
-                "purpose": t.purpose[:100],
-                "ssgh_approved": "Yes" if t.ssgh_approved_at else "No",
-                "ssgh_comments": t.ssgh_comments or "No comments",
-                "created": t.created_at.strftime("%Y-%m-%d %H:%M"),
-                "days_pending": (datetime.now() - t.created_at).days
-            }
-            for t in trfs
-        ]
-        
-        data = PendingApplicationsData(
-            role="CFO",
-            total_pending=len(trf_list),
-            applications=trf_list,
-            message=f"Found {len(trf_list)} pending application(s) awaiting your approval"
-        )
-        
-        return PendingApplicationsOutput(
-            success=True,
-            message=f"Found {len(trf_list)} pending application(s) for CFO",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return PendingApplicationsOutput(
-            success=False,
-            message=str(e),
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+    return _get_pending_for_role("CFO", _session)
 
 
 # ============================================================================
@@ -1105,7 +1801,7 @@ def get_pending_cfo_applications() -> str:
 # ============================================================================
 
 @tool(args_schema=TrackAllApplicationsInput)
-def track_all_applications() -> str:
+def track_all_applications(_session: Optional[Session] = None) -> str:
     """
     Track all TRF applications (excluding drafts) for Travel Desk oversight.
     Shows complete information about every submitted application including
@@ -1129,239 +1825,197 @@ def track_all_applications() -> str:
     
     Example: "Show me all travel applications being tracked in the system"
     """
-    session = get_session()
-    
-    try:
-        # Get all non-draft TRFs, excluding drafts
-        trfs = session.query(TravelRequisitionForm).filter(
-            TravelRequisitionForm.status != TRFStatus.DRAFT
-        ).order_by(TravelRequisitionForm.created_at.desc()).all()
-        
-        if not trfs:
-            data = TrackAllApplicationsData(
-                total_applications=0,
-                draft_count=0,
-                status_breakdown={},
-                fully_approved=0,
-                pending_approval=0,
-                rejected_applications=0,
-                completed_applications=0,
-                applications=[],
-                summary_message="No applications found. All TRFs are in draft status."
+    # Lazily built approval-chain schema (see agent.schema.__getattr__)
+    from agent.schema import TrackAllApplicationsOutput
+
+    with session_scope(_session) as session:
+        try:
+            # Per-status counts in a fixed list; categories are derived once afterwards
+            status_counts = [0] * len(_TRF_STATUSES)
+
+            applications_list = []
+            now = _utcnow()
+
+            # Stream all non-draft TRFs in batches: each batch of ORM rows is
+            # released once turned into dicts, instead of holding every hydrated
+            # TRF alongside the output list.
+            for trf, purpose in session.execute(_TRACK_ALL_QUERY.execution_options(yield_per=_TRACK_ALL_BATCH)):
+                status_counts[_STATUS_INDEX[trf.status]] += 1
+
+                # Build detailed application info
+                app_info = dict(
+                    trf_number=trf.trf_number,
+                    employee_id=trf.employee_id,
+                    employee_name=trf.employee_name,
+                    employee_email=trf.employee_email,
+                    employee_designation=trf.employee_designation or "N/A",
+                    employee_department=trf.employee_department or "N/A",
+                    travel=f"{trf.origin_city} to {trf.destination_city}",
+                    travel_type=_ENUM_VALUES.get(trf.travel_type, "N/A"),
+                    departure_date=trf.departure_date,
+                    return_date=trf.return_date,
+                    estimated_cost=trf.estimated_cost,
+                    purpose=purpose,
+                    status=_ENUM_VALUES[trf.status],
+
+                    approvals=_approval_chain(trf),
+
+                    # Metadata
+                    created=trf.created_at,
+                    updated=trf.updated_at,
+                    days_old=(now - trf.created_at).days,
+                    rejection_reason=trf.rejection_reason,
+                    rejected_by=trf.rejected_by
+                )
+                applications_list.append(app_info)
+
+            if not applications_list:
+                data = dict(
+                    total_applications=0,
+                    draft_count=0,
+                    status_breakdown={},
+                    fully_approved=0,
+                    pending_approval=0,
+                    rejected_applications=0,
+                    completed_applications=0,
+                    applications=[],
+                    summary_message="No applications found. All TRFs are in draft status."
+                )
+                return TrackAllApplicationsOutput.build_trusted(
+                    success=True,
+                    message="No active applications to track",
+                    data=data
+                ).to_json()
+            total = len(applications_list)
+
+            # Build status breakdown and categorize by approval completion
+            status_breakdown = {
+                _ENUM_VALUES[status]: count
+                for status, count in zip(_TRF_STATUSES, status_counts)
+                if count
+            }
+            rejected_applications_count = status_counts[_STATUS_INDEX[TRFStatus.REJECTED]]
+            completed_applications_count = (
+                status_counts[_STATUS_INDEX[TRFStatus.COMPLETED]]
+                + status_counts[_STATUS_INDEX[TRFStatus.PROCESSING]]
             )
-            return TrackAllApplicationsOutput(
+            fully_approved_count = status_counts[_STATUS_INDEX[TRFStatus.APPROVED]]
+            pending_approval_count = (
+                total - rejected_applications_count - completed_applications_count - fully_approved_count
+            )
+
+            # Get draft count for reference
+            draft_count = session.query(func.count(TravelRequisitionForm.id)).filter_by(
+                status=TRFStatus.DRAFT
+            ).scalar()
+
+            # Build summary message
+            summary_msg = f"Tracking {total} application(s): "
+            summary_msg += f"{fully_approved_count} fully approved, "
+            summary_msg += f"{pending_approval_count} pending approval, "
+            summary_msg += f"{rejected_applications_count} rejected, "
+            summary_msg += f"{completed_applications_count} completed."
+
+            data = dict(
+                total_applications=total,
+                draft_count=draft_count,
+                status_breakdown=status_breakdown,
+                fully_approved=fully_approved_count,
+                pending_approval=pending_approval_count,
+                rejected_applications=rejected_applications_count,
+                completed_applications=completed_applications_count,
+                applications=applications_list,
+                summary_message=summary_msg
+            )
+
+            return TrackAllApplicationsOutput.build_trusted(
                 success=True,
-                message="No active applications to track",
+                message=f"Retrieved {total} application(s) for tracking",
                 data=data
-            ).model_dump_json()
-        
-        # Categorize applications
-        status_breakdown = {}
-        fully_approved_count = 0
-        pending_approval_count = 0
-        rejected_applications_count = 0
-        completed_applications_count = 0
-        
-        applications_list = []
-        
-        for trf in trfs:
-            # Build status breakdown
-            status_val = trf.status.value
-            status_breakdown[status_val] = status_breakdown.get(status_val, 0) + 1
-            
-            # Categorize by approval completion
-            if trf.status == TRFStatus.REJECTED:
-                rejected_applications_count += 1
-            elif trf.status == TRFStatus.COMPLETED:
-                completed_applications_count += 1
-            elif trf.status == TRFStatus.APPROVED:
-                fully_approved_count += 1
-            elif trf.status == TRFStatus.PROCESSING:
-                completed_applications_count += 1
-            else:
-                pending_approval_count += 1
-            
-            # Build detailed application info
-            app_info = TrackAllApplicationsInfo(
-                trf_number=trf.trf_number,
-                employee_id=trf.employee_id,
-                employee_name=trf.employee_name,
-                employee_email=trf.employee_email,
-                employee_designation=trf.employee_designation or "N/A",
-                employee_department=trf.employee_department or "N/A",
-                travel=f"{trf.origin_city} to {trf.destination_city}",
-                travel_type=trf.travel_type.value if trf.travel_type else "N/A",
-                departure_date=str(trf.departure_date),
-                return_date=str(trf.return_date) if trf.return_date else None,
-                estimated_cost=trf.estimated_cost,
-                purpose=trf.purpose[:150],
-                status=trf.status.value,
-                
-                # IRM Approval
-                irm_approved="Yes" if trf.irm_approved_at else "No",
-                irm_approved_at=trf.irm_approved_at.strftime("%Y-%m-%d %H:%M") if trf.irm_approved_at else None,
-                irm_comments=trf.irm_comments,
-                
-                # SRM Approval
-                srm_approved="Yes" if trf.srm_approved_at else "No",
-                srm_approved_at=trf.srm_approved_at.strftime("%Y-%m-%d %H:%M") if trf.srm_approved_at else None,
-                srm_comments=trf.srm_comments,
-                
-                # BUH Approval
-                buh_approved="Yes" if trf.buh_approved_at else "No",
-                buh_approved_at=trf.buh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.buh_approved_at else None,
-                buh_comments=trf.buh_comments,
-                
-                # SSUH Approval
-                ssuh_approved="Yes" if trf.ssuh_approved_at else "No",
-                ssuh_approved_at=trf.ssuh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.ssuh_approved_at else None,
-                ssuh_comments=trf.ssuh_comments,
-                
-                # BGH Approval
-                bgh_approved="Yes" if trf.bgh_approved_at else "No",
-                bgh_approved_at=trf.bgh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.bgh_approved_at else None,
-                bgh_comments=trf.bgh_comments,
-                
-                # SSGH Approval
-                ssgh_approved="Yes" if trf.ssgh_approved_at else "No",
-                ssgh_approved_at=trf.ssgh_approved_at.strftime("%Y-%m-%d %H:%M") if trf.ssgh_approved_at else None,
-                ssgh_comments=trf.ssgh_comments,
-                
-                # CFO Approval
-                cfo_approved="Yes" if trf.cfo_approved_at else "No",
-                cfo_approved_at=trf.cfo_approved_at.strftime("%Y-%m-%d %H:%M") if trf.cfo_approved_at else None,
-                cfo_comments=trf.cfo_comments,
-                
-                # Travel Desk Approval
-                travel_desk_approved="Yes" if trf.travel_desk_approved_at else "No",
-                travel_desk_approved_at=trf.travel_desk_approved_at.strftime("%Y-%m-%d %H:%M") if trf.travel_desk_approved_at else None,
-                travel_desk_comments=trf.travel_desk_comments,
-                
-                # Metadata
-                created=trf.created_at.strftime("%Y-%m-%d %H:%M"),
-                updated=trf.updated_at.strftime("%Y-%m-%d %H:%M"),
-                days_old=(datetime.now() - trf.created_at).days,
-                rejection_reason=trf.rejection_reason,
-                rejected_by=trf.rejected_by
-            )
-            applications_list.append(app_info)
-        
-        # Get draft count for reference
-        draft_count = session.query(func.count(TravelRequisitionForm.id)).filter_by(
-            status=TRFStatus.DRAFT
-        ).scalar()
-        
-        # Build summary message
-        total = len(trfs)
-        summary_msg = f"Tracking {total} application(s): "
-        summary_msg += f"{fully_approved_count} fully approved, "
-        summary_msg += f"{pending_approval_count} pending approval, "
-        summary_msg += f"{rejected_applications_count} rejected, "
-        summary_msg += f"{completed_applications_count} completed."
-        
-        data = TrackAllApplicationsData(
-            total_applications=len(trfs),
-            draft_count=draft_count,
-            status_breakdown=status_breakdown,
-            fully_approved=fully_approved_count,
-            pending_approval=pending_approval_count,
-            rejected_applications=rejected_applications_count,
-            completed_applications=completed_applications_count,
-            applications=applications_list,
-            summary_message=summary_msg
-        )
-        
-        return TrackAllApplicationsOutput(
-            success=True,
-            message=f"Retrieved {len(trfs)} application(s) for tracking",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return TrackAllApplicationsOutput(
-            success=False,
-            message="Unable to track applications",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+            ).to_json()
+
+        except Exception as e:
+            return TrackAllApplicationsOutput(
+                success=False,
+                message="Unable to track applications",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 # In database_utils.py
 
 @tool(args_schema=MarkTRFCompletedInput)
-def mark_trf_completed(trf_number: str, comments: Optional[str] = None) -> str:
+def mark_trf_completed(trf_number: str, comments: Optional[str] = None, _session: Optional[Session] = None) -> str:
     """
     Mark a TRF as fully COMPLETED. 
     Use this tool AFTER all flights and hotels have been booked.
     """
-    session = get_session()
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        
-        if not trf:
-            return MarkTRFCompletedOutput(success=False, message="TRF not found", error=ErrorCodes.TRF_NOT_FOUND).model_dump_json()
-            
-        if trf.status != TRFStatus.APPROVED:
-            return MarkTRFCompletedOutput(
-                success=False, 
-                message=f"TRF must be APPROVED to complete. Current: {trf.status.value}", 
-                error=ErrorCodes.INVALID_STATUS
-            ).model_dump_json()
-
-        # --- IMPROVEMENT: Validation Check ---
-        # Check if any bookings exist before closing
-        has_bookings = False
-        if trf.travel_bookings:
-            for booking in trf.travel_bookings:
-                if booking.status == BookingStatus.CONFIRMED:
-                    has_bookings = True
-                    break
-        
-        # If you want to enforce strict booking rules:
-        if not has_bookings:
-             # Determine if this is just a policy check request or actual travel
-             # For now, return a warning requiring explicit comment override
-             if not comments or "force" not in comments.lower():
-                 return MarkTRFCompletedOutput(
-                     success=False,
-                     message="⚠️ Warning: No confirmed bookings found. If this is intentional (e.g. own arrangement), add 'force' to comments.",
-                     error=ErrorCodes.INVALID_SEQUENCE
-                 ).model_dump_json()
-        # -------------------------------------
-            
-        now = datetime.now()
-        trf.status = TRFStatus.COMPLETED
-        trf.final_approved_at = now
-        
-        if comments:
-            existing = trf.travel_desk_comments or ""
-            trf.travel_desk_comments = f"{existing} | Completion Note: {comments}"
-            
-        session.commit()
-        
-        data = MarkTRFCompletedData(
-            trf_number=trf_number,
-            status=TRFStatus.COMPLETED.value,
-            completed_at=now.strftime("%Y-%m-%d %H:%M:%S"),
-            final_notes=comments
-        )
-        
-        return MarkTRFCompletedOutput(
-            success=True, 
-            message=f"✅ TRF {trf_number} marked as COMPLETED. Workflow finished.", 
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        session.rollback()
-        return MarkTRFCompletedOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
+    with session_scope(_session) as session:
+        try:
+            trf = _get_trf(session, trf_number)
+
+            if not trf:
+                return MarkTRFCompletedOutput(success=False, message="TRF not found", error=ErrorCodes.TRF_NOT_FOUND).to_json()
+
+            if trf.status != TRFStatus.APPROVED:
+                return MarkTRFCompletedOutput(
+                    success=False, 
+                    message=f"TRF must be APPROVED to complete. Current: {trf.status.value}", 
+                    error=ErrorCodes.INVALID_STATUS
+                ).to_json()
+
+            # --- IMPROVEMENT: Validation Check ---
+            # Check if any bookings exist before closing
+            has_bookings = False
+            if trf.travel_bookings:
+                for booking in trf.travel_bookings:
+                    if booking.status == BookingStatus.CONFIRMED:
+                        has_bookings = True
+                        break
+
+            # If you want to enforce strict booking rules:
+            if not has_bookings:
+                 # Determine if this is just a policy check request or actual travel
+                 # For now, return a warning requiring explicit comment override
+                 if not comments or "force" not in comments.lower():
+                     return MarkTRFCompletedOutput(
+                         success=False,
+                         message="⚠️ Warning: No confirmed bookings found. If this is intentional (e.g. own arrangement), add 'force' to comments.",
+                         error=ErrorCodes.INVALID_SEQUENCE
+                     ).to_json()
+            # -------------------------------------
+
+            now = _utcnow()
+            trf.status = TRFStatus.COMPLETED
+            trf.final_approved_at = now
+
+            if comments:
+                existing = trf.travel_desk_comments or ""
+                trf.travel_desk_comments = f"{existing} | Completion Note: {comments}"
+
+            _mark_stale(session, trf.employee_id, trf_number)
+            _commit_tool(session)
+
+            data = dict(
+                trf_number=trf_number,
+                status=TRFStatus.COMPLETED.value,
+                completed_at=now.isoformat(sep=" ", timespec="seconds"),
+                final_notes=comments
+            )
+
+            return MarkTRFCompletedOutput.build_trusted(
+                success=True, 
+                message=f"✅ TRF {trf_number} marked as COMPLETED. Workflow finished.", 
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
+            return MarkTRFCompletedOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).to_json()
 
 
 @tool(args_schema=GetApprovedTRFsInput)
-def get_approved_trfs(limit: int = 20) -> str:
+def get_approved_trfs(limit: int = 20, _session: Optional[Session] = None) -> str:
     """
     Get all approved TRFs ready for Travel Desk booking.
     Automatically fetches TRFs that have completed all approval levels.
@@ -1373,136 +2027,124 @@ def get_approved_trfs(limit: int = 20) -> str:
     
     Example: "Show me approved travel requests"
     """
-    session = get_session()
-    
-    try:
-        # Get TRFs that are fully approved and ready for Travel Desk
-        trfs = session.query(TravelRequisitionForm).filter(
-            TravelRequisitionForm.status == TRFStatus.APPROVED
-        ).order_by(TravelRequisitionForm.created_at.desc()).limit(limit).all()
-        
-        if not trfs:
-            return GetApprovedTRFsOutput(
-                success=True,
-                message="No approved TRFs ready for booking at this time.",
-                data=ApprovedTRFsData(
-                    total_approved=0,
-                    trfs=[],
-                    ready_for_booking=0
+    with session_scope(_session) as session:
+        try:
+            # Get TRFs that are fully approved and ready for Travel Desk
+            trfs = session.query(TravelRequisitionForm).options(*_SCALAR_ONLY).filter(
+                TravelRequisitionForm.status == TRFStatus.APPROVED
+            ).order_by(TravelRequisitionForm.created_at.desc()).limit(limit).all()
+
+            if not trfs:
+                return GetApprovedTRFsOutput.build_trusted(
+                    success=True,
+                    message="No approved TRFs ready for booking at this time.",
+                    data=dict(
+                        total_approved=0,
+                        trfs=[],
+                        ready_for_booking=0
+                    )
+                ).to_json()
+
+            trf_summaries = [
+                dict(
+                    trf_number=trf.trf_number,
+                    employee_id=trf.employee_id,
+                    employee_name=trf.employee_name,
+                    employee_email=trf.employee_email,
+                    origin_city=trf.origin_city,
+                    destination_city=trf.destination_city,
+                    departure_date=str(trf.departure_date),
+                    return_date=str(trf.return_date) if trf.return_date else None,
+                    purpose=trf.purpose,
+                    estimated_cost=trf.estimated_cost,
+                    travel_type=trf.travel_type.value if trf.travel_type else "domestic"
                 )
-            ).model_dump_json()
-        
-        trf_summaries = [
-            ApprovedTRFSummary(
-                trf_number=trf.trf_number,
-                employee_id=trf.employee_id,
-                employee_name=trf.employee_name,
-                employee_email=trf.employee_email,
-                origin_city=trf.origin_city,
-                destination_city=trf.destination_city,
-                departure_date=str(trf.departure_date),
-                return_date=str(trf.return_date) if trf.return_date else None,
-                purpose=trf.purpose,
-                estimated_cost=trf.estimated_cost,
-                travel_type=trf.travel_type.value if trf.travel_type else "domestic"
+                for trf in trfs
+            ]
+
+            data = dict(
+                total_approved=len(trf_summaries),
+                trfs=trf_summaries,
+                ready_for_booking=len(trf_summaries)
             )
-            for trf in trfs
-        ]
-        
-        data = ApprovedTRFsData(
-            total_approved=len(trf_summaries),
-            trfs=trf_summaries,
-            ready_for_booking=len(trf_summaries)
-        )
-        
-        return GetApprovedTRFsOutput(
-            success=True,
-            message=f"Found {len(trf_summaries)} approved TRF(s) ready for booking",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return GetApprovedTRFsOutput(
-            success=False,
-            message="Error fetching approved TRFs",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+
+            return GetApprovedTRFsOutput.build_trusted(
+                success=True,
+                message=f"Found {len(trf_summaries)} approved TRF(s) ready for booking",
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            return GetApprovedTRFsOutput(
+                success=False,
+                message="Error fetching approved TRFs",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 @tool(args_schema=GetApprovedTRFsInput)
-def get_approved_for_travel_desk(limit: int = 20) -> str:
+def get_approved_for_travel_desk(limit: int = 20, _session: Optional[Session] = None) -> str:
     """
     Get all TRFs requiring Travel Desk attention.
     Prioritizes 'PENDING_TRAVEL_DESK' (New) and 'APPROVED' (In Progress).
     """
-    session = get_session()
-    try:
-        statuses = [TRFStatus.PENDING_TRAVEL_DESK, TRFStatus.APPROVED]
-        
-        trfs = session.query(TravelRequisitionForm).filter(
-            TravelRequisitionForm.status.in_(statuses)
-        ).order_by(
-            # Sort by status (Pending first) then date
-            TravelRequisitionForm.status.desc(), 
-            TravelRequisitionForm.created_at.asc()
-        ).limit(limit).all()
-        
-        if not trfs:
-             return GetApprovedTRFsOutput(
-                success=True, message="No active requests found for Travel Desk.",
-                data=ApprovedTRFsData(total_approved=0, trfs=[], ready_for_booking=0)
-            ).model_dump_json()
-
-        trf_summaries = []
-        for trf in trfs:
-            # --- IMPROVEMENT: Status Clarity ---
-            status_label = ""
-            if trf.status == TRFStatus.PENDING_TRAVEL_DESK:
-                status_label = "🆕 NEW REQUEST - Needs Acceptance"
-            elif trf.status == TRFStatus.APPROVED:
-                # Check actual progress
-                booking_count = len(trf.travel_bookings) if trf.travel_bookings else 0
-                if booking_count == 0:
-                    status_label = "⏳ IN PROGRESS - Accepted, No Bookings Yet"
-                else:
-                    status_label = f"📝 IN PROGRESS - {booking_count} Booking(s) Made"
-            # -----------------------------------
+    with session_scope(_session) as session:
+        try:
+            trfs = session.execute(_TRAVEL_DESK_QUEUE, {"limit": limit}).scalars().all()
+
+            if not trfs:
+                 return GetApprovedTRFsOutput.build_trusted(
+                    success=True, message="No active requests found for Travel Desk.",
+                    data=dict(total_approved=0, trfs=[], ready_for_booking=0)
+                ).to_json()
+
+            trf_summaries = []
+            for trf in trfs:
+                # --- IMPROVEMENT: Status Clarity ---
+                status_label = ""
+                if trf.status == TRFStatus.PENDING_TRAVEL_DESK:
+                    status_label = "🆕 NEW REQUEST - Needs Acceptance"
+                elif trf.status == TRFStatus.APPROVED:
+                    # Check actual progress
+                    booking_count = len(trf.travel_bookings)
+                    if booking_count == 0:
+                        status_label = "⏳ IN PROGRESS - Accepted, No Bookings Yet"
+                    else:
+                        status_label = f"📝 IN PROGRESS - {booking_count} Booking(s) Made"
+                # -----------------------------------
+
+                summary = dict(
+                    trf_number=trf.trf_number,
+                    employee_id=trf.employee_id,
+                    employee_name=trf.employee_name,
+                    employee_email=trf.employee_email or "",
+                    origin_city=trf.origin_city,
+                    destination_city=trf.destination_city,
+                    departure_date=str(trf.departure_date),
+                    return_date=str(trf.return_date) if trf.return_date else None,
+                    purpose=f"[{status_label}] {trf.purpose}", # Inject status into purpose for visibility
+                    estimated_cost=trf.estimated_cost,
+                    travel_type=trf.travel_type.value if trf.travel_type else "domestic"
+                )
+                trf_summaries.append(summary)
 
-            summary = ApprovedTRFSummary(
-                trf_number=trf.trf_number,
-                employee_id=trf.employee_id,
-                employee_name=trf.employee_name,
-                employee_email=trf.employee_email or "",
-                origin_city=trf.origin_city,
-                destination_city=trf.destination_city,
-                departure_date=str(trf.departure_date),
-                return_date=str(trf.return_date) if trf.return_date else None,
-                purpose=f"[{status_label}] {trf.purpose}", # Inject status into purpose for visibility
-                estimated_cost=trf.estimated_cost,
-                travel_type=trf.travel_type.value if trf.travel_type else "domestic"
-            )
-            trf_summaries.append(summary)
-        
-        return GetApprovedTRFsOutput(
-            success=True,
-            message=f"Found {len(trf_summaries)} items. Check 'purpose' field for status details.",
-            data=ApprovedTRFsData(total_approved=len(trf_summaries), trfs=trf_summaries, ready_for_booking=len(trf_summaries))
-        ).model_dump_json()
+            return GetApprovedTRFsOutput.build_trusted(
+                success=True,
+                message=f"Found {len(trf_summaries)} items. Check 'purpose' field for status details.",
+                data=dict(total_approved=len(trf_summaries), trfs=trf_summaries, ready_for_booking=len(trf_summaries))
+            ).to_json()
 
-    except Exception as e:
-        return GetApprovedTRFsOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
+        except Exception as e:
+            return GetApprovedTRFsOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).to_json()
 
 
 @tool(args_schema=CompleteTravelPlanInput)
 def complete_travel_plan(
     trf_number: str,
     include_hotels: bool = True,
-    cabin_class: Optional[str] = "economy"
+    cabin_class: Optional[CabinClassValues] = CabinClassValues.ECONOMY,
+    _session: Optional[Session] = None
 ) -> str:
     """
     Create a complete travel plan with flights and hotels for an approved TRF.
@@ -1516,153 +2158,102 @@ def complete_travel_plan(
     
     Example: "Create complete travel plan for TRF202500001"
     """
-    session = get_session()
-    
-    try:
-        # Get TRF details
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf:
-            return CompleteTravelPlanOutput(
-                success=False,
-                message=f"TRF {trf_number} not found",
-                error=ErrorCodes.TRF_NOT_FOUND
-            ).model_dump_json()
-        
-        if trf.status != TRFStatus.APPROVED:
-            return CompleteTravelPlanOutput(
-                success=False,
-                message=f"TRF must be approved before planning. Current status: {trf.status.value}",
-                error=ErrorCodes.INVALID_STATUS
-            ).model_dump_json()
-        
-        # Get flights
-        flights_data = []
-        total_flight_cost = 0
-        
+    with session_scope(_session) as session:
         try:
-            flight_results = session.query(FlightInventory).filter(
-                FlightInventory.origin_city == trf.origin_city,
-                FlightInventory.destination_city == trf.destination_city,
-                FlightInventory.departure_date == trf.departure_date,
-                FlightInventory.is_available == True
-            ).limit(3).all()
-            
-            for flight in flight_results:
-                airline = session.query(Airline).get(flight.airline_id)
-                if airline:
-                    price_map = {
-                        "economy": flight.economy_price,
-                        "premium_economy": flight.premium_economy_price,
-                        "business": flight.business_price,
-                        "first": flight.first_price
-                    }
-                    price = price_map.get(cabin_class, flight.economy_price)
-                    discount = price * (airline.corporate_discount / 100)
-                    final_price = price - discount
-                    total_flight_cost = final_price
-                    
-                    flights_data.append(BookedFlightInfo(
-                        flight_id=flight.id,
-                        flight_number=flight.flight_number,
-                        airline=airline.name,
-                        airline_code=airline.code,
-                        origin_city=flight.origin_city,
-                        destination_city=flight.destination_city,
-                        departure_date=str(flight.departure_date),
-                        arrival_date=str(flight.arrival_date),
-                        departure_time=flight.departure_time.strftime("%H:%M"),
-                        arrival_time=flight.arrival_time.strftime("%H:%M"),
-                        duration=f"{flight.duration_minutes // 60}h {flight.duration_minutes % 60}m",
-                        price=round(final_price, 2),
-                        cabin_class=cabin_class or "economy",
-                        is_direct=flight.is_direct
-                    ))
-        except:
-            flights_data = []
-        
-        # Get hotels if requested
-        hotels_data = []
-        total_hotel_cost = 0
-        
-        if include_hotels:
-            try:
+            # Get TRF details
+            trf = _get_trf(session, trf_number)
+            if not trf:
+                return CompleteTravelPlanOutput(
+                    success=False,
+                    message=f"TRF {trf_number} not found",
+                    error=ErrorCodes.TRF_NOT_FOUND
+                ).to_json()
+
+            if trf.status != TRFStatus.APPROVED:
+                return CompleteTravelPlanOutput(
+                    success=False,
+                    message=f"TRF must be approved before planning. Current status: {trf.status.value}",
+                    error=ErrorCodes.INVALID_STATUS
+                ).to_json()
+
+            # Start the hotel search on its own connection while this one runs
+            # the flight search; a shared caller session stays sequential
+            hotels_future = None
+            if include_hotels:
                 checkin = trf.departure_date
                 checkout = trf.return_date or (trf.departure_date + timedelta(days=1))
-                
-                hotels = session.query(Hotel).filter(
-                    Hotel.city == trf.destination_city
-                ).limit(3).all()
-                
-                for hotel in hotels:
-                    rooms = session.query(HotelRoomInventory).filter(
-                        HotelRoomInventory.hotel_id == hotel.id,
-                        HotelRoomInventory.date >= checkin,
-                        HotelRoomInventory.date < checkout,
-                        HotelRoomInventory.is_available == True
-                    ).all()
-                    
-                    if rooms:
-                        nights = (checkout - checkin).days
-                        total_cost = sum(r.discounted_price for r in rooms)
-                        total_hotel_cost = total_cost
-                        
-                        hotels_data.append(BookedHotelInfo(
-                                hotel_id=hotel.id,
-                            hotel_name=hotel.name,
-                            city=hotel.city,
-                            rating=hotel.rating,
-                                room_type=rooms[0].room_type if rooms else None,
-                            per_night_rate=round(rooms[0].discounted_price, 2),
-                            total_nights=nights,
-                            total_cost=round(total_cost, 2),
-                                amenities=hotel.amenities or [],
-                                inventory_ids=[r.id for r in rooms]
-                        ))
+                if _session is None:
+                    hotels_future = _SEARCH_POOL.submit(
+                        _plan_hotels_isolated, trf.destination_city, checkin, checkout
+                    )
+
+            # Get flights
+            flights_data = []
+            total_flight_cost = 0
+
+            try:
+                flight_query = session.query(FlightInventory).filter(
+                    FlightInventory.origin_city == trf.origin_city,
+                    FlightInventory.destination_city == trf.destination_city,
+                    FlightInventory.departure_date == trf.departure_date,
+                    FlightInventory.is_available == True
+                ).limit(3)
+
+                flights_data = list(_iter_flight_rows(session, flight_query, cabin_class or CabinClassValues.ECONOMY))
+                total_flight_cost = flights_data[-1]["price"] if flights_data else 0
             except:
-                hotels_data = []
-        
-        total_cost = total_flight_cost + total_hotel_cost
-        
-        booking_summary = TravelBookingSummary(
-            trf_number=trf_number,
-            employee_name=trf.employee_name,
-            origin=trf.origin_city,
-            destination=trf.destination_city,
-            departure_date=str(trf.departure_date),
-            return_date=str(trf.return_date) if trf.return_date else None,
-            flights_booked=f"Flight {flights_data[0].flight_number}" if flights_data else None,
-            hotels_booked=f"Hotel {hotels_data[0].hotel_name}" if hotels_data else None,
-            total_estimated_cost=round(total_cost, 2),
-            booking_status="planned"
-        )
-        
-        data = CompleteTravelPlanData(
-            booking_summary=booking_summary,
-            flights=flights_data,
-            hotels=hotels_data,
-            total_cost=round(total_cost, 2),
-            next_steps=[
-                "Review the travel plan above",
-                "Confirm flights and hotels selection",
-                "Proceed with booking confirmation"
-            ]
-        )
-        
-        return CompleteTravelPlanOutput(
-            success=True,
-            message=f"Complete travel plan created for {trf.employee_name}",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return CompleteTravelPlanOutput(
-            success=False,
-            message="Error creating travel plan",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+                flights_data = []
+
+            # Get hotels if requested
+            hotels_data = []
+            total_hotel_cost = 0
+
+            if include_hotels:
+                try:
+                    if hotels_future is not None:
+                        hotels_data = hotels_future.result()
+                    else:
+                        hotels_data = _plan_hotels(session, trf.destination_city, checkin, checkout)
+                    total_hotel_cost = hotels_data[-1]["total_cost"] if hotels_data else 0
+                except:
+                    hotels_data = []
+
+            total_cost = total_flight_cost + total_hotel_cost
+
+            booking_summary = {
+                "trf_number": trf_number,
+                "employee_name": trf.employee_name,
+                "origin": trf.origin_city,
+                "destination": trf.destination_city,
+                "departure_date": str(trf.departure_date),
+                "return_date": str(trf.return_date) if trf.return_date else None,
+                "flights_booked": f"Flight {flights_data[0]['flight_number']}" if flights_data else None,
+                "hotels_booked": f"Hotel {hotels_data[0]['hotel_name']}" if hotels_data else None,
+                "total_estimated_cost": round(total_cost, 2),
+                "booking_status": "planned",
+            }
+
+            data = {
+                "booking_summary": booking_summary,
+                "flights": _FLIGHTS_ADAPTER.validate_python(flights_data),
+                "hotels": _HOTELS_ADAPTER.validate_python(hotels_data),
+                "total_cost": round(total_cost, 2),
+                "next_steps": _TRAVEL_PLAN_NEXT_STEPS,
+            }
+
+            return CompleteTravelPlanOutput.build_trusted(
+                success=True,
+                message=f"Complete travel plan created for {trf.employee_name}",
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            return CompleteTravelPlanOutput(
+                success=False,
+                message="Error creating travel plan",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 # ============================================================================
@@ -1675,8 +2266,9 @@ def search_flights(
     origin_city: str,
     destination_city: str,
     departure_date: str,
-    cabin_class: Optional[str] = "economy",
-    max_results: int = 5
+    cabin_class: Optional[CabinClassValues] = CabinClassValues.ECONOMY,
+    max_results: int = 5,
+    _session: Optional[Session] = None
 ) -> str:
     """
     Search available flights for an approved TRF. Returns flight options with IDs 
@@ -1688,143 +2280,106 @@ def search_flights(
     
     Example: "Search flights for TRF202500004"
     """
-    session = get_session()
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf:
-            return BookFlightOutput(
-                success=False,
-                message=f"TRF {trf_number} not found",
-                error=ErrorCodes.TRF_NOT_FOUND
-            ).model_dump_json()
-        
-        if trf.status not in (TRFStatus.APPROVED, TRFStatus.PROCESSING):
-            return BookFlightOutput(
-                success=False,
-                message=f"TRF must be approved. Current status: {trf.status.value}",
-                error=ErrorCodes.INVALID_STATUS
-            ).model_dump_json()
-        
+    with session_scope(_session) as session:
         try:
-            dep_date = datetime.strptime(departure_date, "%Y-%m-%d").date()
-        except ValueError:
+            trf = _get_trf(session, trf_number)
+            if not trf:
+                return BookFlightOutput(
+                    success=False,
+                    message=f"TRF {trf_number} not found",
+                    error=ErrorCodes.TRF_NOT_FOUND
+                ).to_json()
+
+            if trf.status not in (TRFStatus.APPROVED, TRFStatus.PROCESSING):
+                return BookFlightOutput(
+                    success=False,
+                    message=f"TRF must be approved. Current status: {trf.status.value}",
+                    error=ErrorCodes.INVALID_STATUS
+                ).to_json()
+
+            try:
+                dep_date = _as_date(departure_date)
+            except ValueError:
+                return BookFlightOutput(
+                    success=False,
+                    message="Invalid date format. Use YYYY-MM-DD",
+                    error=ErrorCodes.INVALID_DATE_FORMAT
+                ).to_json()
+
+            base_cabin = cabin_class or CabinClassValues.ECONOMY
+            flight_results = _flight_search_rows(
+                session, origin_city, destination_city, dep_date, base_cabin, max_results,
+                use_cache=_session is None
+            )
+
+            if not flight_results:
+                return BookFlightOutput(
+                    success=True,
+                    message=f"No flights available",
+                    data=BookFlightData(
+                        trf_number=trf_number,
+                        employee_name=trf.employee_name,
+                        route=f"{origin_city} to {destination_city}",
+                        available_flights=[],
+                        booking_status="no_flights_available"
+                    )
+                ).to_json()
+
+            data = {
+                "trf_number": trf_number,
+                "employee_name": trf.employee_name,
+                "route": f"{origin_city} to {destination_city}",
+                "available_flights": _FLIGHTS_ADAPTER.validate_python(flight_results),
+                "booking_status": "available",
+            }
+
+            return BookFlightOutput.build_trusted(
+                success=True,
+                message=f"Found {len(flight_results)} flights. Use flight_id with confirm_flight_booking to book.",
+                data=data
+            ).to_json()
+
+        except Exception as e:
             return BookFlightOutput(
                 success=False,
-                message="Invalid date format. Use YYYY-MM-DD",
-                error=ErrorCodes.INVALID_DATE_FORMAT
-            ).model_dump_json()
-        
-        base_cabin = (cabin_class or "economy").lower()
-        flights = session.query(FlightInventory).filter(
-            FlightInventory.origin_city == origin_city,
-            FlightInventory.destination_city == destination_city,
-            FlightInventory.departure_date == dep_date,
-            FlightInventory.is_available == True
-        ).limit(max_results).all()
-        
-        if not flights:
-            return BookFlightOutput(
-                success=True,
-                message=f"No flights available",
-                data=BookFlightData(
-                    trf_number=trf_number,
-                    employee_name=trf.employee_name,
-                    route=f"{origin_city} to {destination_city}",
-                    available_flights=[],
-                    booking_status="no_flights_available"
-                )
-            ).model_dump_json()
-        
-        flight_results = []
-        for flight in flights:
-            airline = session.query(Airline).get(flight.airline_id)
-            if not airline:
-                continue
-            
-            price_map = {
-                "economy": flight.economy_price,
-                "premium_economy": flight.premium_economy_price,
-                "business": flight.business_price,
-                "first": flight.first_price
-            }
-            price = price_map.get(base_cabin, flight.economy_price) or flight.economy_price
-            discount = price * (airline.corporate_discount / 100)
-            final_price = price - discount
-            
-            flight_results.append(BookedFlightInfo(
-                flight_id=flight.id,
-                flight_number=flight.flight_number,
-                airline=airline.name,
-                airline_code=airline.code,
-                origin_city=flight.origin_city,
-                destination_city=flight.destination_city,
-                departure_date=str(flight.departure_date),
-                arrival_date=str(flight.arrival_date),
-                departure_time=flight.departure_time.strftime("%H:%M"),
-                arrival_time=flight.arrival_time.strftime("%H:%M"),
-                duration=f"{flight.duration_minutes // 60}h {flight.duration_minutes % 60}m",
-                price=round(final_price, 2),
-                cabin_class=base_cabin,
-                is_direct=flight.is_direct
-            ))
-        
-        data = BookFlightData(
-            trf_number=trf_number,
-            employee_name=trf.employee_name,
-            route=f"{origin_city} to {destination_city}",
-            available_flights=flight_results,
-            booking_status="available"
-        )
-        
-        return BookFlightOutput(
-            success=True,
-            message=f"Found {len(flight_results)} flights. Use flight_id with confirm_flight_booking to book.",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return BookFlightOutput(
-            success=False,
-            message="Error searching flights",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+                message="Error searching flights",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 @tool(args_schema=ConfirmFlightBookingInput)
-def confirm_flight_booking(trf_number: str, flight_id: int, number_of_passengers: int = 1) -> str:
-    session = get_session()
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
+def confirm_flight_booking(trf_number: str, flight_id: int, number_of_passengers: int = 1, _session: Optional[Session] = None) -> str:
+    with session_scope(_session) as session:
+        trf = _get_trf(session, trf_number)
         if not trf or trf.status != TRFStatus.APPROVED: 
-            return BookFlightOutput(success=False, message="TRF must be APPROVED", error=ErrorCodes.INVALID_STATUS).model_dump_json()
-        
+            return BookFlightOutput(success=False, message="TRF must be APPROVED", error=ErrorCodes.INVALID_STATUS).to_json()
+
         flight = session.query(FlightInventory).get(flight_id)
         if not flight or not flight.is_available: 
-            return BookFlightOutput(success=False, message="Unavailable").model_dump_json()
-        
+            return BookFlightOutput(success=False, message="Unavailable").to_json()
+
         # Generate IDs (Ensuring they are under 20 chars)
         # TB + 14 chars = 16 chars (Safe)
-        booking_num = f"TB{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
+        now = _utcnow()
+        booking_num = f"TB{now.strftime('%Y%m%d%H%M%S')}"
+
         booking = TravelBooking(
             booking_number=booking_num, 
             trf_id=trf.id, 
             traveler_name=trf.employee_name, 
             traveler_email=trf.employee_email, 
             status=BookingStatus.CONFIRMED, 
-            booking_date=datetime.now(), 
-            confirmation_date=datetime.now(), 
+            booking_date=now, 
+            confirmation_date=now, 
             total_flight_cost=flight.economy_price, 
             total_cost=flight.economy_price
         )
         session.add(booking)
         session.flush()
-        
+
         # FIX: Shorten PNR to PNR + FlightID (5) + Time (6) = ~14-15 chars
-        short_pnr = f"PNR{flight.id}-{datetime.now().strftime('%H%M%S')}"
-        
+        short_pnr = f"PNR{flight.id}-{now.strftime('%H%M%S')}"
+
         fb = FlightBooking(
             pnr=short_pnr, 
             travel_booking_id=booking.id, 
@@ -1838,16 +2393,18 @@ def confirm_flight_booking(trf_number: str, flight_id: int, number_of_passengers
             status=BookingStatus.CONFIRMED
         )
         session.add(fb)
-        
+
         flight.is_available = False
-        trf.travel_desk_approved_at = datetime.now()
+        trf.travel_desk_approved_at = now
         trf.travel_desk_comments = f"Flight booked: {flight.flight_number}"
-        
-        session.commit()
-        return BookFlightOutput(
+
+        _mark_stale(session, trf.employee_id, trf_number)
+        _mark_inventory_stale(session)
+        _commit_tool(session)
+        return BookFlightOutput.build_trusted(
             success=True, 
             message="Booked", 
-            data=BookFlightData(
+            data=dict(
                 trf_number=trf_number, 
                 employee_name=trf.employee_name, 
                 route=f"{flight.origin_city}-{flight.destination_city}", 
@@ -1855,9 +2412,7 @@ def confirm_flight_booking(trf_number: str, flight_id: int, number_of_passengers
                 pnr=fb.pnr, 
                 total_cost=fb.final_fare
             )
-        ).model_dump_json()
-    finally:
-        session.close()
+        ).to_json()
 
 @tool(args_schema=SearchHotelsInput)
 def search_hotels(
@@ -1866,7 +2421,8 @@ def search_hotels(
     check_in_date: str,
     check_out_date: str,
     min_rating: Optional[int] = 3,
-    max_results: int = 5
+    max_results: int = 5,
+    _session: Optional[Session] = None
 ) -> str:
     """
     Search available hotels for an approved TRF. Returns hotel options with IDs 
@@ -1878,245 +2434,215 @@ def search_hotels(
     
     Example: "Search hotels for TRF202500004"
     """
-    session = get_session()
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf:
-            return BookHotelOutput(
-                success=False,
-                message=f"TRF {trf_number} not found",
-                error=ErrorCodes.TRF_NOT_FOUND
-            ).model_dump_json()
-        
-        if trf.status not in (TRFStatus.APPROVED, TRFStatus.PROCESSING):
-            return BookHotelOutput(
-                success=False,
-                message=f"TRF must be approved. Current status: {trf.status.value}",
-                error=ErrorCodes.INVALID_STATUS
-            ).model_dump_json()
-        
+    with session_scope(_session) as session:
         try:
-            checkin = datetime.strptime(check_in_date, "%Y-%m-%d").date()
-            checkout = datetime.strptime(check_out_date, "%Y-%m-%d").date()
-        except ValueError:
-            return BookHotelOutput(
-                success=False,
-                message="Invalid date format. Use YYYY-MM-DD",
-                error=ErrorCodes.INVALID_DATE_FORMAT
-            ).model_dump_json()
-        
-        if checkout <= checkin:
+            trf = _get_trf(session, trf_number)
+            if not trf:
+                return BookHotelOutput(
+                    success=False,
+                    message=f"TRF {trf_number} not found",
+                    error=ErrorCodes.TRF_NOT_FOUND
+                ).to_json()
+
+            if trf.status not in (TRFStatus.APPROVED, TRFStatus.PROCESSING):
+                return BookHotelOutput(
+                    success=False,
+                    message=f"TRF must be approved. Current status: {trf.status.value}",
+                    error=ErrorCodes.INVALID_STATUS
+                ).to_json()
+
+            try:
+                checkin = _as_date(check_in_date)
+                checkout = _as_date(check_out_date)
+            except ValueError:
+                return BookHotelOutput(
+                    success=False,
+                    message="Invalid date format. Use YYYY-MM-DD",
+                    error=ErrorCodes.INVALID_DATE_FORMAT
+                ).to_json()
+
+            if checkout <= checkin:
+                return BookHotelOutput(
+                    success=False,
+                    message="Check-out date must be after check-in date",
+                    error=ErrorCodes.INVALID_DATE_RANGE
+                ).to_json()
+
+            hotel_results = _hotel_search_rows(
+                session, city, checkin, checkout, min_rating, max_results,
+                use_cache=_session is None
+            )
+
+            if not hotel_results:
+                return BookHotelOutput(
+                    success=True,
+                    message=f"No hotels found in {city}",
+                    data=BookHotelData(
+                        trf_number=trf_number,
+                        employee_name=trf.employee_name,
+                        available_hotels=[],
+                        booking_status="no_hotels_available"
+                    )
+                ).to_json()
+
+            data = {
+                "trf_number": trf_number,
+                "employee_name": trf.employee_name,
+                "available_hotels": _HOTELS_ADAPTER.validate_python(hotel_results),
+                "booking_status": "available",
+            }
+
+            return BookHotelOutput.build_trusted(
+                success=True,
+                message=f"Found {len(hotel_results)} hotels. Use hotel_id with confirm_hotel_booking to book.",
+                data=data
+            ).to_json()
+
+        except Exception as e:
             return BookHotelOutput(
                 success=False,
-                message="Check-out date must be after check-in date",
-                error=ErrorCodes.INVALID_DATE_RANGE
-            ).model_dump_json()
-        
-        nights = (checkout - checkin).days
-        
-        query = session.query(Hotel).filter(Hotel.city == city)
-        if min_rating:
-            query = query.filter(Hotel.rating >= min_rating)
-        
-        hotels = query.limit(max_results).all()
-        
-        if not hotels:
-            return BookHotelOutput(
-                success=True,
-                message=f"No hotels found in {city}",
-                data=BookHotelData(
-                    trf_number=trf_number,
-                    employee_name=trf.employee_name,
-                    available_hotels=[],
-                    booking_status="no_hotels_available"
-                )
-            ).model_dump_json()
-        
-        hotel_results = []
-        for hotel in hotels:
-            rooms = session.query(HotelRoomInventory).filter(
-                HotelRoomInventory.hotel_id == hotel.id,
-                HotelRoomInventory.date >= checkin,
-                HotelRoomInventory.date < checkout,
-                HotelRoomInventory.is_available == True
-            ).order_by(HotelRoomInventory.date.asc()).all()
-            
-            if rooms:
-                total_cost = sum(r.discounted_price for r in rooms)
-                per_night = rooms[0].discounted_price if rooms else 0
-                
-                hotel_results.append(BookedHotelInfo(
-                    hotel_id=hotel.id,
-                    hotel_name=hotel.name,
-                    city=hotel.city,
-                    rating=hotel.rating,
-                    room_type=rooms[0].room_type,
-                    per_night_rate=round(per_night, 2),
-                    total_nights=nights,
-                    total_cost=round(total_cost, 2),
-                    amenities=hotel.amenities or [],
-                    inventory_ids=[r.id for r in rooms]
-                ))
-        
-        data = BookHotelData(
-            trf_number=trf_number,
-            employee_name=trf.employee_name,
-            available_hotels=hotel_results,
-            booking_status="available"
-        )
-        
-        return BookHotelOutput(
-            success=True,
-            message=f"Found {len(hotel_results)} hotels. Use hotel_id with confirm_hotel_booking to book.",
-            data=data
-        ).model_dump_json()
-        
-    except Exception as e:
-        return BookHotelOutput(
-            success=False,
-            message="Error searching hotels",
-            error=ErrorCodes.SYSTEM_ERROR,
-            error_details=str(e)
-        ).model_dump_json()
-    finally:
-        session.close()
+                message="Error searching hotels",
+                error=ErrorCodes.SYSTEM_ERROR,
+                error_details=str(e)
+            ).to_json()
 
 
 @tool(args_schema=ConfirmHotelBookingInput)
-def confirm_hotel_booking(trf_number: str, hotel_id: int, check_in_date: str, check_out_date: str, number_of_guests: int = 1, special_requests: Optional[str] = None) -> str:
+def confirm_hotel_booking(trf_number: str, hotel_id: int, check_in_date: str, check_out_date: str, number_of_guests: int = 1, special_requests: Optional[str] = None, _session: Optional[Session] = None) -> str:
     """Confirm and book a specific hotel."""
-    session = get_session()
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf or trf.status != TRFStatus.APPROVED:
-            return BookHotelOutput(success=False, message="TRF must be in APPROVED status.", error=ErrorCodes.INVALID_STATUS).model_dump_json()
-        
-        if trf.status not in (TRFStatus.APPROVED, TRFStatus.PROCESSING):
-            return BookHotelOutput(
-                success=False,
-                message=f"TRF must be approved. Current status: {trf.status.value}",
-                error=ErrorCodes.INVALID_STATUS
-            ).model_dump_json()
-        
+    with session_scope(_session) as session:
         try:
-            checkin = datetime.strptime(check_in_date, "%Y-%m-%d").date()
-            checkout = datetime.strptime(check_out_date, "%Y-%m-%d").date()
-        except ValueError:
-            return BookHotelOutput(
-                success=False,
-                message="Invalid date format. Use YYYY-MM-DD",
-                error=ErrorCodes.INVALID_DATE_FORMAT
-            ).model_dump_json()
-        
-        if checkout <= checkin:
-            return BookHotelOutput(
-                success=False,
-                message="Check-out date must be after check-in date",
-                error=ErrorCodes.INVALID_DATE_RANGE
-            ).model_dump_json()
-        
-        nights = (checkout - checkin).days
-        
-        hotel = session.query(Hotel).filter_by(id=hotel_id).first()
-        if not hotel:
-            return BookHotelOutput(
-                success=False,
-                message=f"Hotel {hotel_id} not found",
-                error=ErrorCodes.NO_HOTELS
-            ).model_dump_json()
-        
-        selected_rooms = []
-        current_date = checkin
-        while current_date < checkout:
-            room = (
-                session.query(HotelRoomInventory)
-                .filter(
-                    HotelRoomInventory.hotel_id == hotel_id,
-                    HotelRoomInventory.date == current_date,
-                    HotelRoomInventory.is_available == True
-                )
-                .order_by(HotelRoomInventory.discounted_price.asc())
-                .first()
-            )
-            if not room:
+            trf = _get_trf(session, trf_number)
+            if not trf or trf.status != TRFStatus.APPROVED:
+                return BookHotelOutput(success=False, message="TRF must be in APPROVED status.", error=ErrorCodes.INVALID_STATUS).to_json()
+
+            if trf.status not in (TRFStatus.APPROVED, TRFStatus.PROCESSING):
                 return BookHotelOutput(
                     success=False,
-                    message=f"Hotel no longer has availability for all dates",
-                    error=ErrorCodes.NO_ROOMS
-                ).model_dump_json()
-            selected_rooms.append(room)
-            current_date += timedelta(days=1)
-        
-        total_cost = sum(room.discounted_price for room in selected_rooms)
-        per_night = round(total_cost / nights, 2)
-        
-        travel_booking = (
-            session.query(TravelBooking)
-            .filter(TravelBooking.trf_id == trf.id)
-            .order_by(TravelBooking.booking_date.desc())
-            .first()
-        )
-        
-        if not travel_booking:
-            booking_number = f"TB{datetime.utcnow().strftime('%Y%m%d%H%M%S')}{trf.id}"
-            travel_booking = TravelBooking(
-                booking_number=booking_number,
-                trf_id=trf.id,
-                traveler_name=trf.employee_name,
-                traveler_email=trf.employee_email,
-                traveler_phone=trf.employee_phone,
-                traveler_employee_id=trf.employee_id,
-                status=BookingStatus.PENDING
+                    message=f"TRF must be approved. Current status: {trf.status.value}",
+                    error=ErrorCodes.INVALID_STATUS
+                ).to_json()
+
+            try:
+                checkin = _as_date(check_in_date)
+                checkout = _as_date(check_out_date)
+            except ValueError:
+                return BookHotelOutput(
+                    success=False,
+                    message="Invalid date format. Use YYYY-MM-DD",
+                    error=ErrorCodes.INVALID_DATE_FORMAT
+                ).to_json()
+
+            if checkout <= checkin:
+                return BookHotelOutput(
+                    success=False,
+                    message="Check-out date must be after check-in date",
+                    error=ErrorCodes.INVALID_DATE_RANGE
+                ).to_json()
+
+            nights = (checkout - checkin).days
+
+            hotel = session.query(Hotel).filter_by(id=hotel_id).first()
+            if not hotel:
+                return BookHotelOutput(
+                    success=False,
+                    message=f"Hotel {hotel_id} not found",
+                    error=ErrorCodes.NO_HOTELS
+                ).to_json()
+
+            selected_rooms = []
+            current_date = checkin
+            while current_date < checkout:
+                room = (
+                    session.query(HotelRoomInventory)
+                    .filter(
+                        HotelRoomInventory.hotel_id == hotel_id,
+                        HotelRoomInventory.date == current_date,
+                        HotelRoomInventory.is_available == True
+                    )
+                    .order_by(HotelRoomInventory.discounted_price.asc())
+                    .first()
+                )
+                if not room:
+                    return BookHotelOutput(
+                        success=False,
+                        message=f"Hotel no longer has availability for all dates",
+                        error=ErrorCodes.NO_ROOMS
+                    ).to_json()
+                selected_rooms.append(room)
+                current_date += timedelta(days=1)
+
+            total_cost = sum(room.discounted_price for room in selected_rooms)
+            per_night = round(total_cost / nights, 2)
+
+            travel_booking = (
+                session.query(TravelBooking)
+                .filter(TravelBooking.trf_id == trf.id)
+                .order_by(TravelBooking.booking_date.desc())
+                .first()
             )
-            session.add(travel_booking)
-            session.flush()
-        
-        confirmation_number = f"HB{datetime.utcnow().strftime('%Y%m%d%H%M%S')}{hotel_id}"
-        hotel_booking = HotelBooking(
-            confirmation_number=confirmation_number,
-            travel_booking_id=travel_booking.id,
-            room_id=selected_rooms[0].id,
-            guest_name=trf.employee_name,
-            check_in_date=checkin,
-            check_out_date=checkout,
-            number_of_nights=nights,
-            number_of_guests=number_of_guests or 1,
-            per_night_rate=per_night,
-            total_room_cost=round(total_cost, 2),
-            discount_applied=0.0,
-            taxes=0.0,
-            final_cost=round(total_cost, 2),
-            status=BookingStatus.CONFIRMED,
-            special_requests=special_requests
-        )
-        session.add(hotel_booking)
-        
-        for room in selected_rooms:
-            room.is_available = False
-        
-        travel_booking.total_hotel_cost = (travel_booking.total_hotel_cost or 0) + round(total_cost, 2)
-        travel_booking.total_cost = (travel_booking.total_cost or 0) + round(total_cost, 2)
-        travel_booking.status = BookingStatus.CONFIRMED
-        travel_booking.confirmation_date = datetime.utcnow()
-        
-        trf.travel_desk_approved_at = datetime.utcnow()
-        
-        session.commit()
-        
-        return BookHotelOutput(
-            success=True, 
-            message="Hotel booked successfully. Status remains APPROVED.", 
-            data=BookHotelData(
-                trf_number=trf_number, employee_name=trf.employee_name, available_hotels=[], 
-                booking_status="booked", hotel_confirmation_number="HB12345"
+
+            now = _utcnow()
+            if not travel_booking:
+                booking_number = f"TB{now.strftime('%Y%m%d%H%M%S')}{trf.id}"
+                travel_booking = TravelBooking(
+                    booking_number=booking_number,
+                    trf_id=trf.id,
+                    traveler_name=trf.employee_name,
+                    traveler_email=trf.employee_email,
+                    traveler_phone=trf.employee_phone,
+                    traveler_employee_id=trf.employee_id,
+                    status=BookingStatus.PENDING
+                )
+                session.add(travel_booking)
+                session.flush()
+
+            confirmation_number = f"HB{now.strftime('%Y%m%d%H%M%S')}{hotel_id}"
+            hotel_booking = HotelBooking(
+                confirmation_number=confirmation_number,
+                travel_booking_id=travel_booking.id,
+                room_id=selected_rooms[0].id,
+                guest_name=trf.employee_name,
+                check_in_date=checkin,
+                check_out_date=checkout,
+                number_of_nights=nights,
+                number_of_guests=number_of_guests or 1,
+                per_night_rate=per_night,
+                total_room_cost=round(total_cost, 2),
+                discount_applied=0.0,
+                taxes=0.0,
+                final_cost=round(total_cost, 2),
+                status=BookingStatus.CONFIRMED,
+                special_requests=special_requests
             )
-        ).model_dump_json()
-        
-    except Exception as e:
-        session.rollback()
-        return BookHotelOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
+            session.add(hotel_booking)
+
+            for room in selected_rooms:
+                room.is_available = False
+
+            travel_booking.total_hotel_cost = (travel_booking.total_hotel_cost or 0) + round(total_cost, 2)
+            travel_booking.total_cost = (travel_booking.total_cost or 0) + round(total_cost, 2)
+            travel_booking.status = BookingStatus.CONFIRMED
+            travel_booking.confirmation_date = now
+
+            trf.travel_desk_approved_at = now
+
+            _mark_stale(session, trf.employee_id, trf_number)
+            _mark_inventory_stale(session)
+            _commit_tool(session)
+
+            return BookHotelOutput.build_trusted(
+                success=True, 
+                message="Hotel booked successfully. Status remains APPROVED.", 
+                data=dict(
+                    trf_number=trf_number, employee_name=trf.employee_name, available_hotels=[], 
+                    booking_status="booked", hotel_confirmation_number="HB12345"
+                )
+            ).to_json()
+
+        except Exception as e:
+            _rollback_tool(session)
+            return BookHotelOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).to_json()
 
 
 # ============================================================================
@@ -2140,182 +2666,178 @@ def policy_qa(question: str) -> str:
     Example: "What are the international travel policy guidelines?"
     """
     try:
-        qa_system = get_policy_qa()
-        result = qa_system.query(question, use_context=True)
+        # Routed through the batcher so concurrent tool calls share one RAG round-trip
+        result = get_policy_batcher().query(question)
         
         # Format response with sources
         answer = result.get("answer", "Unable to find answer")
         sources = result.get("sources", [])
         
-        response = f"{answer}"
-        
-        if sources:
-            response += "\n\nSources found:"
-            for i, source in enumerate(sources, 1):
-                response += f"\n{i}. {source.get('metadata', 'Unknown')} (Relevance: {source.get('score', 'N/A')})"
+        if not sources:
+            return f"{answer}"
         
-        return response
+        parts = [f"{answer}\n\nSources found:"]
+        parts.extend(
+            f"{i}. {source.get('metadata', 'Unknown')} (Relevance: {source.get('score', 'N/A')})"
+            for i, source in enumerate(sources, 1)
+        )
+        return "\n".join(parts)
         
     except Exception as e:
         return f"Error querying policy: {str(e)}"
 
 
-
-
 @tool(args_schema=SearchAlternateFlightsInput)
-def search_alternate_flights(trf_number: str, origin_city: str, destination_city: str, start_date: str, end_date: str, cabin_class: str = "economy") -> str:
+def search_alternate_flights(trf_number: str, origin_city: str, destination_city: str, start_date: str, end_date: str, cabin_class: CabinClassValues = CabinClassValues.ECONOMY, _session: Optional[Session] = None) -> str:
     """
     Search for flight availability across a date range.
     Returns a calendar view of available flights and prices.
     Use this when exact date searches fail.
     """
-    session = get_session()
-    try:
-        # Validate TRF
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf or trf.status not in [TRFStatus.APPROVED, TRFStatus.PROCESSING]:
-            return SearchAlternateFlightsOutput(success=False, message="TRF must be APPROVED", error=ErrorCodes.INVALID_STATUS).model_dump_json()
-
+    with session_scope(_session) as session:
         try:
-            s_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            e_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            return SearchAlternateFlightsOutput(success=False, message="Invalid date format", error=ErrorCodes.INVALID_DATE_FORMAT).model_dump_json()
+            # Validate TRF
+            trf = _get_trf(session, trf_number)
+            if not trf or trf.status not in [TRFStatus.APPROVED, TRFStatus.PROCESSING]:
+                return SearchAlternateFlightsOutput(success=False, message="TRF must be APPROVED", error=ErrorCodes.INVALID_STATUS).to_json()
 
-        # Limit range to avoid massive queries (e.g., max 14 days)
-        if (e_date - s_date).days > 14:
-            return SearchAlternateFlightsOutput(success=False, message="Date range too large (max 14 days)", error=ErrorCodes.INVALID_DATE_RANGE).model_dump_json()
+            try:
+                s_date = _as_date(start_date)
+                e_date = _as_date(end_date)
+            except ValueError:
+                return SearchAlternateFlightsOutput(success=False, message="Invalid date format", error=ErrorCodes.INVALID_DATE_FORMAT).to_json()
+
+            # Limit range to avoid massive queries (e.g., max 14 days)
+            if (e_date - s_date).days > 14:
+                return SearchAlternateFlightsOutput(success=False, message="Date range too large (max 14 days)", error=ErrorCodes.INVALID_DATE_RANGE).to_json()
+
+            calendar = []
+            current = s_date
+
+            while current <= e_date:
+                flights = session.query(FlightInventory).filter(
+                    FlightInventory.origin_city == origin_city,
+                    FlightInventory.destination_city == destination_city,
+                    FlightInventory.departure_date == current,
+                    FlightInventory.is_available == True
+                ).all()
+
+                if flights:
+                    # Find lowest price for the day
+                    prices = [f.economy_price for f in flights] # Simplified to economy for summary
+                    lowest = min(prices) if prices else 0
+                    calendar.append(dict(date=str(current), available=True, lowest_price=lowest, flight_count=len(flights)))
+                else:
+                    calendar.append(dict(date=str(current), available=False, lowest_price=None, flight_count=0))
 
-        calendar = []
-        current = s_date
-        
-        while current <= e_date:
-            flights = session.query(FlightInventory).filter(
-                FlightInventory.origin_city == origin_city,
-                FlightInventory.destination_city == destination_city,
-                FlightInventory.departure_date == current,
-                FlightInventory.is_available == True
-            ).all()
-            
-            if flights:
-                # Find lowest price for the day
-                prices = [f.economy_price for f in flights] # Simplified to economy for summary
-                lowest = min(prices) if prices else 0
-                calendar.append(FlightAvailability(date=str(current), available=True, lowest_price=lowest, flight_count=len(flights)))
-            else:
-                calendar.append(FlightAvailability(date=str(current), available=False, lowest_price=None, flight_count=0))
-            
-            current += timedelta(days=1)
-
-        # Generate recommendation
-        available_dates = [c for c in calendar if c.available]
-        rec = f"Best option: {available_dates[0].date} starting at {available_dates[0].lowest_price}" if available_dates else "No flights found in range."
-
-        data = SearchAlternateFlightsData(
-            route=f"{origin_city} to {destination_city}",
-            range_start=start_date,
-            range_end=end_date,
-            calendar=calendar,
-            recommendation=rec
-        )
+                current += timedelta(days=1)
 
-        return SearchAlternateFlightsOutput(
-            success=True, 
-            message=f"Scanned dates from {start_date} to {end_date}. {len(available_dates)} days have flights.",
-            data=data
-        ).model_dump_json()
+            # Generate recommendation
+            available_dates = [c for c in calendar if c["available"]]
+            rec = f"Best option: {available_dates[0]['date']} starting at {available_dates[0]['lowest_price']}" if available_dates else "No flights found in range."
 
-    except Exception as e:
-        return SearchAlternateFlightsOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
+            data = dict(
+                route=f"{origin_city} to {destination_city}",
+                range_start=start_date,
+                range_end=end_date,
+                calendar=calendar,
+                recommendation=rec
+            )
+
+            return SearchAlternateFlightsOutput.build_trusted(
+                success=True, 
+                message=f"Scanned dates from {start_date} to {end_date}. {len(available_dates)} days have flights.",
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            return SearchAlternateFlightsOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).to_json()
 
 
 @tool(args_schema=SearchAlternateHotelsInput)
-def search_alternate_hotels(trf_number: str, city: str, start_date: str, end_date: str, duration_nights: int = 1, min_rating: int = 3) -> str:
+def search_alternate_hotels(trf_number: str, city: str, start_date: str, end_date: str, duration_nights: int = 1, min_rating: int = 3, _session: Optional[Session] = None) -> str:
     """
     Search for hotel availability across a date range.
     Checks if check-in is possible for the specified duration on each day.
     """
-    session = get_session()
-    try:
-        trf = session.query(TravelRequisitionForm).filter_by(trf_number=trf_number).first()
-        if not trf or trf.status not in [TRFStatus.APPROVED, TRFStatus.PROCESSING]:
-            return SearchAlternateHotelsOutput(success=False, message="TRF must be APPROVED", error=ErrorCodes.INVALID_STATUS).model_dump_json()
-
+    with session_scope(_session) as session:
         try:
-            s_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            e_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            return SearchAlternateHotelsOutput(success=False, message="Invalid date format", error=ErrorCodes.INVALID_DATE_FORMAT).model_dump_json()
+            trf = _get_trf(session, trf_number)
+            if not trf or trf.status not in [TRFStatus.APPROVED, TRFStatus.PROCESSING]:
+                return SearchAlternateHotelsOutput(success=False, message="TRF must be APPROVED", error=ErrorCodes.INVALID_STATUS).to_json()
 
-        if (e_date - s_date).days > 14:
-            return SearchAlternateHotelsOutput(success=False, message="Date range too large (max 14 days)", error=ErrorCodes.INVALID_DATE_RANGE).model_dump_json()
+            try:
+                s_date = _as_date(start_date)
+                e_date = _as_date(end_date)
+            except ValueError:
+                return SearchAlternateHotelsOutput(success=False, message="Invalid date format", error=ErrorCodes.INVALID_DATE_FORMAT).to_json()
 
-        calendar = []
-        current = s_date
-        
-        # Get hotels in city once
-        hotels = session.query(Hotel).filter(Hotel.city == city, Hotel.rating >= min_rating).all()
-        hotel_ids = [h.id for h in hotels]
-
-        if not hotels:
-             return SearchAlternateHotelsOutput(success=True, message="No hotels found in city", data=SearchAlternateHotelsData(city=city, range_start=start_date, range_end=end_date, calendar=[], recommendation="No hotels in city")).model_dump_json()
-
-        while current <= e_date:
-            # Check if ANY hotel has room for 'duration_nights' starting from 'current'
-            # This is a simplified check: strictly checking if inventory exists for start date
-            # A more complex check would verify contiguous availability for duration
-            
-            available_count = 0
-            lowest_price = float('inf')
-            
-            # Check availability for this specific check-in date across hotels
-            # We just check if the start date has rooms for now to keep it fast
-            rooms = session.query(HotelRoomInventory).filter(
-                HotelRoomInventory.hotel_id.in_(hotel_ids),
-                HotelRoomInventory.date == current,
-                HotelRoomInventory.is_available == True
-            ).all()
-            
-            if rooms:
-                available_count = len(set(r.hotel_id for r in rooms))
-                lowest_price = min(r.discounted_price for r in rooms)
-                calendar.append(HotelAvailability(date=str(current), available=True, lowest_price=lowest_price, hotel_count=available_count))
-            else:
-                calendar.append(HotelAvailability(date=str(current), available=False, lowest_price=None, hotel_count=0))
-            
-            current += timedelta(days=1)
-
-        available_dates = [c for c in calendar if c.available]
-        rec = f"Best check-in: {available_dates[0].date} starting at {available_dates[0].lowest_price}" if available_dates else "No availability found."
-
-        data = SearchAlternateHotelsData(
-            city=city,
-            range_start=start_date,
-            range_end=end_date,
-            calendar=calendar,
-            recommendation=rec
-        )
+            if (e_date - s_date).days > 14:
+                return SearchAlternateHotelsOutput(success=False, message="Date range too large (max 14 days)", error=ErrorCodes.INVALID_DATE_RANGE).to_json()
 
-        return SearchAlternateHotelsOutput(
-            success=True, 
-            message=f"Scanned dates from {start_date} to {end_date}.",
-            data=data
-        ).model_dump_json()
+            calendar = []
+            current = s_date
 
-    except Exception as e:
-        return SearchAlternateHotelsOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).model_dump_json()
-    finally:
-        session.close()
+            # Get hotels in city once
+            hotels = session.query(Hotel).filter(Hotel.city == city, Hotel.rating >= min_rating).all()
+            hotel_ids = [h.id for h in hotels]
+
+            if not hotels:
+                 return SearchAlternateHotelsOutput.build_trusted(success=True, message="No hotels found in city", data=dict(city=city, range_start=start_date, range_end=end_date, calendar=[], recommendation="No hotels in city")).to_json()
+
+            while current <= e_date:
+                # Check if ANY hotel has room for 'duration_nights' starting from 'current'
+                # This is a simplified check: strictly checking if inventory exists for start date
+                # A more complex check would verify contiguous availability for duration
+
+                available_count = 0
+                lowest_price = float('inf')
+
+                # Check availability for this specific check-in date across hotels
+                # We just check if the start date has rooms for now to keep it fast
+                rooms = session.query(HotelRoomInventory).filter(
+                    HotelRoomInventory.hotel_id.in_(hotel_ids),
+                    HotelRoomInventory.date == current,
+                    HotelRoomInventory.is_available == True
+                ).all()
+
+                if rooms:
+                    available_count = len(set(r.hotel_id for r in rooms))
+                    lowest_price = min(r.discounted_price for r in rooms)
+                    calendar.append(dict(date=str(current), available=True, lowest_price=lowest_price, hotel_count=available_count))
+                else:
+                    calendar.append(dict(date=str(current), available=False, lowest_price=None, hotel_count=0))
+
+                current += timedelta(days=1)
+
+            available_dates = [c for c in calendar if c["available"]]
+            rec = f"Best check-in: {available_dates[0]['date']} starting at {available_dates[0]['lowest_price']}" if available_dates else "No availability found."
+
+            data = dict(
+                city=city,
+                range_start=start_date,
+                range_end=end_date,
+                calendar=calendar,
+                recommendation=rec
+            )
+
+            return SearchAlternateHotelsOutput.build_trusted(
+                success=True, 
+                message=f"Scanned dates from {start_date} to {end_date}.",
+                data=data
+            ).to_json()
+
+        except Exception as e:
+            return SearchAlternateHotelsOutput(success=False, message=str(e), error=ErrorCodes.SYSTEM_ERROR).to_json()
 
 # ... [Update ALL_TOOLS list] ...
 
 ALL_TOOLS = [
-    create_trf_draft, submit_trf, list_employee_drafts, get_trf_approval_details, get_trf_status, list_employee_trfs,
-    approve_trf, reject_trf,
+    create_trf_draft, create_trf_drafts_bulk, submit_trf, list_employee_drafts, get_trf_approval_details, get_trf_status, list_employee_trfs,
+    approve_trf, bulk_approve_trf, reject_trf,
     get_pending_irm_applications, get_pending_srm_applications, get_pending_buh_applications, get_pending_ssuh_applications,
     get_pending_bgh_applications, get_pending_ssgh_applications, get_pending_cfo_applications,
+    get_all_pending_applications,
     get_approved_for_travel_desk, mark_trf_completed, track_all_applications,
     search_flights, confirm_flight_booking, 
     search_alternate_flights, # NEW
@@ -18,19 +18,20 @@ Includes conversation memory management with session support for multi-turn conv
 
 import asyncio
 import json
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
-from langchain_litellm import ChatLiteLLM
 from langchain_core.tools import Tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage, BaseMessage
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import StateGraph, START, END
 from typing_extensions import TypedDict
 
+from agent.llm import create_llm
 from agent.tools import ALL_TOOLS
 from agent.schema import *
-from src.config.settings import settings
 
 
 # ============================================================================
@@ -40,6 +41,7 @@ from src.config.settings import settings
 ROLE_TOOLS_MAP = {
     "employee": [
         "create_trf_draft",
+        "create_trf_drafts_bulk",
         "submit_trf",
         "list_employee_drafts",
         "get_trf_approval_details",
@@ -52,6 +54,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_approval_details",
         "get_trf_status",
         "approve_trf",
+        "bulk_approve_trf",
         "policy_qa",
         "reject_trf",
     ],
@@ -60,6 +63,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_approval_details",
         "get_trf_status",
         "approve_trf",
+        "bulk_approve_trf",
         "policy_qa",
         "reject_trf",
         "list_employee_trfs",
@@ -70,6 +74,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_status",
         "policy_qa",
         "approve_trf",
+        "bulk_approve_trf",
         "reject_trf",
     ],
     "ssuh": [
@@ -78,6 +83,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_status",
         "policy_qa",
         "approve_trf",
+        "bulk_approve_trf",
         "reject_trf",
     ],
     "bgh": [
@@ -86,6 +92,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_status",
         "policy_qa",
         "approve_trf",
+        "bulk_approve_trf",
         "reject_trf",
     ],
     "ssgh": [
@@ -94,6 +101,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_status",
         "policy_qa",
         "approve_trf",
+        "bulk_approve_trf",
         "reject_trf",
     ],
     "cfo": [
@@ -101,6 +109,7 @@ ROLE_TOOLS_MAP = {
         "get_trf_approval_details",
         "get_trf_status",
         "approve_trf",
+        "bulk_approve_trf",
         "reject_trf",
         "policy_qa",
         "list_employee_trfs",
@@ -108,6 +117,7 @@ ROLE_TOOLS_MAP = {
   "travel_desk": [
         "get_approved_for_travel_desk",
         "track_all_applications",
+        "get_all_pending_applications",
         "approve_trf",
         "complete_travel_plan",
         "search_flights",
@@ -136,6 +146,19 @@ APPROVER_ROLE_MAP = {
 }
 
 
+@lru_cache(maxsize=None)
+def _role_tool_specs(role: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    OpenAI tool specs for a role's tools, built once per process.
+
+    Converting a tool walks its args_schema through model_json_schema(), which
+    Pydantic regenerates on every call; agents are created per request, so the
+    converted specs are cached and handed to bind_tools() as-is.
+    """
+    allowed = ROLE_TOOLS_MAP[role]
+    return tuple(convert_to_openai_tool(tool) for tool in ALL_TOOLS if tool.name in allowed)
+
+
 # ============================================================================
 # CONVERSATION STATE AND MEMORY
 # ============================================================================
@@ -272,16 +295,12 @@ class RoleBasedTravelAgent:
         )
         
         # Initialize LLM using ChatLiteLLM with configured Azure OpenAI
-        self.llm = ChatLiteLLM(
-            model=settings.AZURE_MODEL,
-            temperature=0.7,
-            verbose=settings.LLM_VERBOSE,
-        )
+        self.llm = create_llm(temperature=0.7)
         
         # Get allowed tools for this role
         self.allowed_tool_names = ROLE_TOOLS_MAP[self.user_role]
         self.tools = self._get_role_tools()
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
+        self.llm_with_tools = self.llm.bind_tools(list(_role_tool_specs(self.user_role)))
         
         # Create tool dict for easy access
         self.named_tools = {tool.name: tool for tool in self.tools}
@@ -305,6 +324,7 @@ MISSION: Help employees create, save, and submit travel requisition forms (TRFs)
 WORKFLOW:
 1. Gather travel details: destination, departure/return dates, purpose, estimated cost
 2. Call create_trf_draft with all information; confirm next steps with the employee
+   (for a multi-leg trip, create all legs at once with create_trf_drafts_bulk)
 3. When ready, offer to submit using submit_trf
 4. Use list_employee_drafts or list_employee_trfs to show history when asked
 5. Use get_trf_status or get_trf_approval_details to explain where a TRF stands in the approval chain
@@ -321,7 +341,7 @@ travel policies, ensuring employees understand entitlements before submitting tr
 TONE: Friendly, clear, and action-oriented. Assume users are non-technical.
 ERRORS: If draft creation fails, ask for clarification on dates or cost. If submission fails, explain the error and suggest retrying or saving as draft.
 
-Available tools: create_trf_draft, submit_trf, list_employee_drafts, list_employee_trfs, get_trf_status, get_trf_approval_details, policy_qa.""",
+Available tools: create_trf_draft, create_trf_drafts_bulk, submit_trf, list_employee_drafts, list_employee_trfs, get_trf_status, get_trf_approval_details, policy_qa.""",
 
             "irm": """You are a travel approver assistant for IRMs (Immediate Reporting Managers).
 
@@ -336,6 +356,7 @@ APPROVAL WORKFLOW (when user says "approve TRF###"):
 
 OTHER ACTIONS:
 - View pending: Use get_pending_irm_applications to see your approval queue
+- Approve several: Use bulk_approve_trf(trf_numbers, "irm", comments) when asked to approve multiple TRFs at once
 - Reject: Use reject_trf with a specific business reason (min 10 chars)
 - Status: Use get_trf_status to check any TRF's progress
 
@@ -356,6 +377,7 @@ APPROVAL WORKFLOW (when user says "approve TRF###"):
 
 OTHER ACTIONS:
 - View pending: Use get_pending_srm_applications to see your queue
+- Approve several: Use bulk_approve_trf(trf_numbers, "srm", comments) when asked to approve multiple TRFs at once
 - Reject: Use reject_trf with business reason
 - Status/history: Use get_trf_status or list_employee_trfs
 
@@ -378,7 +400,7 @@ CONSIDERATIONS:
 - Review employee's travel frequency and purpose
 - Provide clear business justification in approval comments
 
-Available tools: get_pending_buh_applications, get_trf_approval_details, get_trf_status, approve_trf, reject_trf.
+Available tools: get_pending_buh_applications, get_trf_approval_details, get_trf_status, approve_trf, bulk_approve_trf, reject_trf.
 Approval level: BUH → routes to SSUH when approved.""",
 
             "ssuh": """You are a travel approver assistant for SSUHs (Senior/Secondary Unit Heads).
@@ -393,7 +415,7 @@ APPROVAL WORKFLOW:
 
 TONE: Professional, focused on business impact and alignment.
 
-Available tools: get_pending_ssuh_applications, get_trf_approval_details, get_trf_status, approve_trf, reject_trf.
+Available tools: get_pending_ssuh_applications, get_trf_approval_details, get_trf_status, approve_trf, bulk_approve_trf, reject_trf.
 Approval level: SSUH → routes to BGH when approved.""",
 
             "bgh": """You are a travel approver assistant for BGHs (Business Group Heads).
@@ -409,7 +431,7 @@ APPROVAL WORKFLOW:
 
 FOCUS: Group-wide compliance, strategic fit, total cost impact.
 
-Available tools: get_pending_bgh_applications, get_trf_approval_details, get_trf_status, approve_trf, reject_trf.
+Available tools: get_pending_bgh_applications, get_trf_approval_details, get_trf_status, approve_trf, bulk_approve_trf, reject_trf.
 Approval level: BGH → routes to SSGH when approved.""",
 
             "ssgh": """You are a travel approver assistant for SSGHs (Senior/Secondary Group Heads).
@@ -425,7 +447,7 @@ APPROVAL WORKFLOW:
 
 TONE: Strategic and concise. Focus on big-picture alignment.
 
-Available tools: get_pending_ssgh_applications, get_trf_approval_details, get_trf_status, approve_trf, reject_trf.
+Available tools: get_pending_ssgh_applications, get_trf_approval_details, get_trf_status, approve_trf, bulk_approve_trf, reject_trf.
 Approval level: SSGH → routes to CFO when approved.""",
 
             "cfo": """You are a travel approver assistant for the CFO (Chief Financial Officer).
@@ -443,6 +465,7 @@ CRITICAL: If user says "approve", they have already decided. Execute approval in
 
 OTHER ACTIONS:
 - View pending: Use get_pending_cfo_applications to see your approval queue
+- Approve several: Use bulk_approve_trf(trf_numbers, "cfo", comments) when asked to approve multiple TRFs at once
 - Reject: Use reject_trf with financial reason
 - Status: Use get_trf_status or list_employee_trfs
 
@@ -465,6 +488,7 @@ WORKFLOW:
 
 TOOL USAGE:
 - `get_approved_for_travel_desk()`: Dashboard for Pending/Active requests.
+- `get_all_pending_applications()`: Every approver queue (IRM to CFO) in one call; use it instead of checking roles one by one.
 - `get_trf_status(trf_number)`: **ALWAYS use this to get flight/hotel parameters (cities, dates) if unknown.**
 - `search_flights(...)`: Requires origin, destination, date. Fetch these from TRF status first.
 - `mark_trf_completed()`: Use only after bookings are done.
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import jwt
 from fastapi import (
@@ -24,11 +26,38 @@ from fastapi import (
 )
 from pydantic import BaseModel, Field
 
+from agent.llm import preload_llm_imports
+from agent.policy_batcher import get_policy_batcher
 from agent.workflow import RoleBasedTravelAgent
 from src.config.settings import settings
 from scripts.ingest_policies import ingest_files as ingest_policy_files
+from src.rag.retrieval.policy_qa import preload_policy_qa
+from src.rag.retrieval.semantic_cache import get_semantic_cache
 
-app = FastAPI(title="Corporate Travel Agent", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the tool executor and start the background warm-ups.
+
+    ``tool.ainvoke`` runs sync DB tools on the loop's default executor, whose
+    stock size (cpu count + 4) would cap concurrent tool calls below what the
+    connection pool can serve, so it gets one worker per pool connection.
+    LiteLLM imports and the policy RAG pipeline then load on daemon threads
+    so the first chat request doesn't pay for them.
+    """
+
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+            thread_name_prefix="tool",
+        )
+    )
+    preload_llm_imports()
+    preload_policy_qa()
+    yield
+
+
+app = FastAPI(title="Corporate Travel Agent", version="1.0.0", lifespan=lifespan)
 
 UPLOAD_DIR = Path(settings.UPLOAD_STORAGE_DIR).resolve()
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -111,6 +140,10 @@ def _ingest_uploaded_files(file_paths: List[str]) -> None:
         except Exception as exc:
             print(f"❌ Background ingestion failed for {path}: {exc}")
 
+    # Cached policy answers may no longer reflect the indexed documents
+    get_policy_batcher().clear_cache()
+    get_semantic_cache().clear()
+
 
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest, identity: IdentityPayload = Depends(get_identity)) -> ChatResponse:
@@ -176,7 +209,6 @@ async def healthcheck() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-
 @app.post("/documents/upload", response_model=UploadResponse, summary="Upload policy/reference files")
 async def upload_documents(
     background_tasks: BackgroundTasks,
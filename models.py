@@ -4,7 +4,7 @@
 
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Boolean, 
-    ForeignKey, Text, Date, Time, Enum as SQLEnum, JSON
+    ForeignKey, Text, Date, Time, Enum as SQLEnum, JSON, Sequence, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -23,7 +23,8 @@ class TravelType(enum.Enum):
     INTERNATIONAL = "international"
 
 
-class TRFStatus(enum.Enum):
+# str-mixin so a member already is its wire value wherever a string is expected
+class TRFStatus(str, enum.Enum):
     DRAFT = "draft"
     PENDING_IRM = "pending_irm"
     PENDING_SRM = "pending_srm"
@@ -57,6 +58,12 @@ class CabinClass(enum.Enum):
 # TRAVEL REQUISITION FORM (TRF) - Independent Table
 # ============================================================================
 
+# Draft numbers come from a sequence instead of COUNT(*) so minting one is O(1)
+# and concurrent drafts can never be handed the same number. Existing databases
+# create and advance it once (TECHNICAL.md, "Upgrading an Existing Database").
+TRF_DRAFT_SEQ = Sequence("trf_draft_seq", metadata=Base.metadata)
+
+
 class TravelRequisitionForm(Base):
     __tablename__ = "travel_requisition_forms"
     
@@ -135,6 +142,22 @@ class TravelRequisitionForm(Base):
     
     # Relationships
     travel_bookings = relationship("TravelBooking", back_populates="trf")
+    
+    # Composite indexes backing the employee list tools, so the filter and the
+    # ORDER BY are both served by an index range scan (no sort node)
+    __table_args__ = (
+        Index("trf_emp_status_updated_idx", employee_id, status, updated_at.desc()),
+        Index("trf_emp_created_idx", employee_id, created_at.desc()),
+        # Approver queues: one status, newest first
+        Index("trf_status_created_idx", status, created_at.desc()),
+        # Drafts are a small fraction of rows; keep a partial index just for them
+        Index(
+            "trf_draft_emp_idx",
+            employee_id,
+            updated_at.desc(),
+            postgresql_where=(status == TRFStatus.DRAFT),
+        ),
+    )
 
 
 
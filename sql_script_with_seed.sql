@@ -22,6 +22,8 @@ DROP TABLE IF EXISTS "cities" CASCADE;
 DROP TABLE IF EXISTS "travel_requisition_forms" CASCADE;
 DROP TABLE IF EXISTS "employee_directory" CASCADE;
 
+DROP SEQUENCE IF EXISTS "trf_draft_seq";
+
 DROP TYPE IF EXISTS "traveltype" CASCADE;
 DROP TYPE IF EXISTS "trfstatus" CASCADE;
 DROP TYPE IF EXISTS "bookingstatus" CASCADE;
@@ -38,6 +40,9 @@ CREATE TYPE "bookingstatus" AS ENUM('PENDING', 'CONFIRMED', 'CANCELLED', 'COMPLE
 CREATE TYPE "cabinclass" AS ENUM('ECONOMY', 'PREMIUM_ECONOMY', 'BUSINESS', 'FIRST');
 CREATE TYPE "reimbursementstatus" AS ENUM('SUBMITTED', 'UNDER_REVIEW', 'APPROVED', 'REJECTED', 'PAID');
 
+-- Draft TRF numbering (DRAFT-TRF{year}{nextval:05d})
+CREATE SEQUENCE "trf_draft_seq";
+
 CREATE TABLE "airlines" (
 	"id" serial PRIMARY KEY,
 	"code" varchar(10) NOT NULL,
@@ -283,6 +288,11 @@ CREATE UNIQUE INDEX "ix_reimbursements_reimbursement_number" ON "reimbursements"
 CREATE UNIQUE INDEX "ix_travel_bookings_booking_number" ON "travel_bookings" ("booking_number");
 CREATE INDEX "ix_travel_requisition_forms_employee_id" ON "travel_requisition_forms" ("employee_id");
 CREATE UNIQUE INDEX "ix_travel_requisition_forms_trf_number" ON "travel_requisition_forms" ("trf_number");
+CREATE INDEX "trf_emp_status_updated_idx" ON "travel_requisition_forms" ("employee_id", "status", "updated_at" DESC);
+CREATE INDEX "trf_emp_created_idx" ON "travel_requisition_forms" ("employee_id", "created_at" DESC);
+CREATE INDEX "trf_draft_emp_idx" ON "travel_requisition_forms" ("employee_id", "updated_at" DESC) WHERE "status" = 'DRAFT';
+-- On a live database add with CREATE INDEX CONCURRENTLY to avoid locking writes
+CREATE INDEX "trf_status_created_idx" ON "travel_requisition_forms" ("status", "created_at" DESC);
 
 
 -- ============================================================================
@@ -40,6 +40,28 @@ class Settings(BaseModel):
     JWT_SECRET: str = Field(default="your-super-secret-key")
     JWT_ALGORITHM: str = Field(default="HS256")
 
+    POLICY_MAX_CONCURRENCY: int = Field(
+        default=4,
+        description="Maximum policy-QA batches allowed in flight against the vector DB / LLM at once",
+    )
+
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        description="Persistent connections kept in the tool database pool",
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=20,
+        description="Extra connections the tool database pool may open under burst load",
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=300,
+        description="Seconds before a pooled connection is replaced (keep below the server idle timeout)",
+    )
+    DB_RAISELOAD: bool = Field(
+        default=False,
+        description="Raise on lazy relationship loads in list tools (dev/test N+1 guard)",
+    )
+
     UPLOAD_STORAGE_DIR: str = Field(
         default="docs/uploads",
         description="Directory where uploaded policy/reference documents are stored",
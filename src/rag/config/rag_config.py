@@ -57,6 +57,17 @@ class RAGSettings(BaseModel):
         description="Temperature for RAG LLM responses (lower = more deterministic, higher = more creative)"
     )
 
+    # Semantic Cache Configuration
+    SEMANTIC_CACHE_SIZE: int = Field(
+        default=256, description="Maximum answered queries kept in the embedding-similarity cache (0 disables it)"
+    )
+    SEMANTIC_CACHE_MIN_SIMILARITY: float = Field(
+        default=0.95, description="Cosine similarity a cached query needs to be reused as an answer"
+    )
+    SEMANTIC_CACHE_MAX_HAMMING: int = Field(
+        default=4, description="Max LSH signature bits that may differ before a cached query is skipped"
+    )
+
     class Config:
         frozen = True
 
@@ -70,6 +70,31 @@ class GeminiEmbedder:
         """
         return self.embed_text(query, task_type="RETRIEVAL_QUERY")
 
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several query texts in a single API call.
+
+        Args:
+            queries: Query texts to embed
+
+        Returns:
+            Embedding vectors in the same order as ``queries``
+        """
+        if not queries:
+            return []
+        try:
+            response = self.client.models.embed_content(
+                model=self.model,
+                contents=list(queries),
+                config=types.EmbedContentConfig(
+                    task_type="RETRIEVAL_QUERY",
+                    output_dimensionality=self.embed_dim,
+                ),
+            )
+            return [embedding.values for embedding in response.embeddings]
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate embeddings: {str(e)}") from e
+
     def embed_document(self, document: str) -> list[float]:
         """
         Generate embedding for a document text.
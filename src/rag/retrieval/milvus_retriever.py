@@ -160,6 +160,22 @@ class MilvusRetriever:
         Returns:
             List of dictionaries with 'text', 'metadata', and 'distance'
         """
+        return self.search_batch([query_embedding], limit)[0]
+
+    def search_batch(self, query_embeddings: List[List[float]], limit: Optional[int] = None) -> List[List[dict]]:
+        """
+        Search for several query embeddings in one Milvus request.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            limit: Number of results to return per query (uses default if not specified)
+
+        Returns:
+            One result list per query embedding, in input order
+        """
+        if not query_embeddings:
+            return []
+
         self._ensure_collection_exists()
 
         limit = limit or self.search_limit
@@ -172,34 +188,37 @@ class MilvusRetriever:
                 output_fields.append(self.metadata_field)
 
             results = self.collection.search(
-                data=[query_embedding],
+                data=list(query_embeddings),
                 anns_field=self.embedding_field,
                 param=search_params,
                 limit=limit,
                 output_fields=output_fields,
             )
 
-            hits = results[0]
-            search_results = []
+            return [self._hits_to_results(hits) for hits in results]
+        except Exception as e:
+            raise RuntimeError(f"Failed to search in Milvus: {str(e)}") from e
 
-            for hit in hits:
-                text_value = hit.entity.get(self.text_field, "")
-                raw_metadata = (
-                    hit.entity.get(self.metadata_field, "") if self._has_metadata_field else ""
-                )
+    def _hits_to_results(self, hits) -> List[dict]:
+        """Convert one query's Milvus hits into result dictionaries."""
+        search_results = []
 
-                parsed_metadata = self._parse_metadata(raw_metadata)
+        for hit in hits:
+            text_value = hit.entity.get(self.text_field, "")
+            raw_metadata = (
+                hit.entity.get(self.metadata_field, "") if self._has_metadata_field else ""
+            )
 
-                search_results.append({
-                    "text": text_value,
-                    "metadata": parsed_metadata,
-                    "distance": hit.distance,
-                    "score": 1 - hit.distance,  # Convert distance to similarity score
-                })
+            parsed_metadata = self._parse_metadata(raw_metadata)
 
-            return search_results
-        except Exception as e:
-            raise RuntimeError(f"Failed to search in Milvus: {str(e)}") from e
+            search_results.append({
+                "text": text_value,
+                "metadata": parsed_metadata,
+                "distance": hit.distance,
+                "score": 1 - hit.distance,  # Convert distance to similarity score
+            })
+
+        return search_results
 
     def reset_collection(self) -> None:
         """Drop and recreate collection."""
@@ -6,12 +6,14 @@
 
 from __future__ import annotations
 
-from typing import Optional, Union, Dict, Any
+import threading
+from typing import Optional, Union, Dict, Any, List, Tuple
 
 from langchain_core.messages import HumanMessage
 from agent.llm import get_llm
 from src.rag.embeddings.gemini_embedder import get_embedder
 from src.rag.retrieval.milvus_retriever import get_retriever
+from src.rag.retrieval.semantic_cache import get_semantic_cache
 from src.rag.config.rag_config import rag_settings
 
 
@@ -26,6 +28,7 @@ class PolicyQA:
         """Initialize QA system with embedder and retriever."""
         self.embedder = get_embedder()
         self.retriever = get_retriever()
+        self.cache = get_semantic_cache()
 
     def query(self, question: str, use_context: bool = True) -> dict:
         """
@@ -44,67 +47,150 @@ class PolicyQA:
             # Step 1: Generate query embedding
             query_embedding = self.embedder.embed_query(question)
 
+            # Near-duplicate questions reuse an earlier answer
+            if use_context:
+                cached = self._cached_answer(question, query_embedding)
+                if cached is not None:
+                    return cached
+
             # Step 2: Retrieve relevant documents
             search_results = self.retriever.search(query_embedding)
 
-            if not search_results:
-                print("❌ No relevant documents found in database.")
-                context_text = "No matching policy information found."
-                sources = []
-            else:
-                context_text = "\n\n".join(
-                    [
-                        f"[{self._format_metadata_reference(r['metadata'])}] {r['text']}"
-                        for r in search_results
-                    ]
-                )
-                sources = [
-                    {
-                        "text": r["text"][:100] + "...",
-                        "metadata": r["metadata"],
-                        "reference": self._format_metadata_reference(r["metadata"]),
-                        "score": r["score"],
-                    }
-                    for r in search_results
-                ]
-                print(f"🔎 Found {len(search_results)} relevant context chunks.")
-
             # Step 3: Generate answer using LLM
-            answer = self._generate_answer(question, context_text, use_context)
-
-            return {
-                "answer": answer,
-                "sources": sources,
-                "raw_results": search_results,
-                "question": question,
-                "used_context": use_context,
-            }
+            result = self._answer_from_results(question, search_results, use_context)
+            if use_context:
+                self._remember(query_embedding, result)
+            return result
 
         except Exception as e:
             print(f"❌ Error during query: {str(e)}")
-            return {
-                "answer": f"Error processing question: {str(e)}",
-                "sources": [],
-                "raw_results": [],
-                "question": question,
-                "used_context": use_context,
-                "error": str(e),
-            }
+            return self._error_result(question, use_context, e)
 
-    def _generate_answer(self, question: str, context: str, use_rag: bool = True) -> str:
+    def query_batch(self, questions: List[str], use_context: bool = True) -> List[dict]:
         """
-        Generate answer using ChatLiteLLM (configured LLM) with RAG-specific temperature.
+        Answer several policy questions, sharing one embedding call and one
+        vector search across the whole batch.
 
         Args:
-            question: User question
-            context: Retrieved context from RAG
-            use_rag: Whether to use RAG context
+            questions: User questions about policies
+            use_context: Whether to use RAG context (True) or direct LLM (False)
 
         Returns:
-            Generated answer
+            One result dictionary per question, in input order (same shape as ``query``)
         """
+        if not questions:
+            return []
+
+        answers: List[Optional[dict]] = [None] * len(questions)
+        try:
+            print(f"❓ Batch of {len(questions)} questions")
+            query_embeddings = self.embedder.embed_queries(questions)
+
+            # Only questions without a near-duplicate cached answer hit Milvus
+            misses = []
+            for i, (question, embedding) in enumerate(zip(questions, query_embeddings)):
+                cached = self._cached_answer(question, embedding) if use_context else None
+                if cached is None:
+                    misses.append(i)
+                else:
+                    answers[i] = cached
+
+            batch_results = self.retriever.search_batch([query_embeddings[i] for i in misses])
+        except Exception as e:
+            print(f"❌ Error during batch query: {str(e)}")
+            return [self._error_result(question, use_context, e) for question in questions]
+
+        # Build every miss's context first, then generate the answers in one
+        # parallel LLM batch instead of back-to-back invokes
+        try:
+            contexts = [self._context_from_results(search_results) for search_results in batch_results]
+            generated = self._generate_answers(
+                [questions[i] for i in misses],
+                [context_text for context_text, _ in contexts],
+                use_context,
+            )
+            for i, search_results, (_, sources), answer in zip(misses, batch_results, contexts, generated):
+                answers[i] = self._result(questions[i], answer, sources, search_results, use_context)
+                if use_context:
+                    self._remember(query_embeddings[i], answers[i])
+        except Exception as e:
+            print(f"❌ Error during batch query: {str(e)}")
+            for i in misses:
+                if answers[i] is None:
+                    answers[i] = self._error_result(questions[i], use_context, e)
+        return answers
+
+    def _cached_answer(self, question: str, query_embedding: List[float]) -> Optional[dict]:
+        """Return a semantically cached answer re-labelled for *question*."""
+        cached = self.cache.get(query_embedding)
+        if cached is None:
+            return None
+        print("♻️ Reusing cached answer for a similar question.")
+        return {**cached, "question": question}
+
+    def _remember(self, query_embedding: List[float], result: dict) -> None:
+        """Cache a generated answer unless the pipeline reported an error."""
+        if "error" not in result and not result["answer"].startswith("Error generating answer"):
+            self.cache.put(query_embedding, result)
+
+    def _answer_from_results(self, question: str, search_results: List[dict], use_context: bool) -> dict:
+        """Build context from retrieved chunks and generate the final answer."""
+        context_text, sources = self._context_from_results(search_results)
+        answer = self._generate_answer(question, context_text, use_context)
+        return self._result(question, answer, sources, search_results, use_context)
+
+    def _context_from_results(self, search_results: List[dict]) -> Tuple[str, List[dict]]:
+        """Return the prompt context and the source list for retrieved chunks."""
+        if not search_results:
+            print("❌ No relevant documents found in database.")
+            return "No matching policy information found.", []
+
+        context_text = "\n\n".join(
+            [
+                f"[{self._format_metadata_reference(r['metadata'])}] {r['text']}"
+                for r in search_results
+            ]
+        )
+        sources = [
+            {
+                "text": r["text"][:100] + "...",
+                "metadata": r["metadata"],
+                "reference": self._format_metadata_reference(r["metadata"]),
+                "score": r["score"],
+            }
+            for r in search_results
+        ]
+        print(f"🔎 Found {len(search_results)} relevant context chunks.")
+        return context_text, sources
+
+    @staticmethod
+    def _result(question: str, answer: str, sources: List[dict], search_results: List[dict], use_context: bool) -> dict:
+        """Result dictionary returned for an answered question."""
+        return {
+            "answer": answer,
+            "sources": sources,
+            "raw_results": search_results,
+            "question": question,
+            "used_context": use_context,
+        }
+
+    @staticmethod
+    def _error_result(question: str, use_context: bool, error: Exception) -> dict:
+        """Result dictionary returned when the pipeline fails for a question."""
+        return {
+            "answer": f"Error processing question: {str(error)}",
+            "sources": [],
+            "raw_results": [],
+            "question": question,
+            "used_context": use_context,
+            "error": str(error),
+        }
+
+    @staticmethod
+    def _build_prompt(question: str, context: str, use_rag: bool = True) -> str:
+        """Prompt for one question, with or without the RAG context."""
         if use_rag:
-            prompt = f"""You are a helpful travel policy assistant. Use ONLY the context below to answer the user's question.
+            return f"""You are a helpful travel policy assistant. Use ONLY the context below to answer the user's question.
 If the answer is not in the context, politely say "I don't have that information in the policy documents."
 
 CONTEXT FROM POLICY:
@@ -114,34 +200,67 @@ USER QUESTION:
 {question}
 
 ANSWER:"""
-        else:
-            prompt = f"""You are a helpful travel policy assistant.
+        return f"""You are a helpful travel policy assistant.
 
 USER QUESTION:
 {question}
 
 ANSWER:"""
 
+    def _generate_answer(self, question: str, context: str, use_rag: bool = True) -> str:
+        """
+        Generate answer using ChatLiteLLM (configured LLM) with RAG-specific temperature.
+
+        Args:
+            question: User question
+            context: Retrieved context from RAG
+            use_rag: Whether to use RAG context
+
+        Returns:
+            Generated answer
+        """
+        return self._generate_answers([question], [context], use_rag)[0]
+
+    def _generate_answers(self, questions: List[str], contexts: List[str], use_rag: bool = True) -> List[str]:
+        """
+        Generate one answer per (question, context) pair.
+
+        Several prompts go out through ``llm.batch``, which runs the requests
+        concurrently; a failed request yields an error string for that
+        question only.
+        """
+        prompts = [
+            [HumanMessage(content=self._build_prompt(question, context, use_rag))]
+            for question, context in zip(questions, contexts)
+        ]
+        if not prompts:
+            return []
+
         try:
             llm = get_llm()
-            
+
             # Override temperature for RAG queries with lower value for more factual responses
-            if use_rag and hasattr(llm, 'temperature'):
+            override = use_rag and hasattr(llm, 'temperature')
+            if override:
                 original_temp = llm.temperature
                 llm.temperature = rag_settings.RAG_TEMPERATURE
-            
-            message = HumanMessage(content=prompt)
-            response = llm.invoke([message])
-            answer = response.content
-            
-            # Restore original temperature
-            if use_rag and hasattr(llm, 'temperature'):
-                llm.temperature = original_temp
-            
-            return answer
+            try:
+                if len(prompts) == 1:
+                    responses = [llm.invoke(prompts[0])]
+                else:
+                    responses = llm.batch(prompts, return_exceptions=True)
+            finally:
+                # Restore original temperature
+                if override:
+                    llm.temperature = original_temp
 
         except Exception as e:
-            return f"Error generating answer: {str(e)}"
+            return [f"Error generating answer: {str(e)}"] * len(prompts)
+
+        return [
+            f"Error generating answer: {str(response)}" if isinstance(response, Exception) else response.content
+            for response in responses
+        ]
 
     def query_without_rag(self, question: str) -> dict:
         """
@@ -185,14 +304,36 @@ ANSWER:"""
 
 # Global QA instance (lazy loaded)
 _qa_instance: Optional[PolicyQA] = None
+_qa_lock = threading.Lock()
 
 
 def get_policy_qa() -> PolicyQA:
-    """Get or create global PolicyQA instance."""
+    """Get or create global PolicyQA instance.
+
+    Building it connects to Milvus and loads the collection, so concurrent
+    first callers (batcher executor threads) must not each build their own.
+    """
     global _qa_instance
     if _qa_instance is None:
-        _qa_instance = PolicyQA()
+        with _qa_lock:
+            if _qa_instance is None:
+                _qa_instance = PolicyQA()
     return _qa_instance
 
 
-__all__ = ["PolicyQA", "get_policy_qa"]
+def _warm_policy_qa() -> None:
+    try:
+        get_policy_qa()
+    except Exception as e:
+        # Not fatal: the first policy question will retry and report the error
+        print(f"⚠️  Policy QA warm-up failed: {str(e)}")
+
+
+def preload_policy_qa() -> threading.Thread:
+    """Build the PolicyQA pipeline on a daemon thread so the first question skips it."""
+    thread = threading.Thread(target=_warm_policy_qa, name="policy-qa-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+__all__ = ["PolicyQA", "get_policy_qa", "preload_policy_qa"]
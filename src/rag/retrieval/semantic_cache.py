@@ -0,0 +1,164 @@
+# File: /src/rag/retrieval/semantic_cache.py
+# Location: src/rag/retrieval/
+# Description: Semantic Cache - Reuse answers for near-duplicate policy questions
+
+"""Semantic Cache - Reuse answers for near-duplicate policy questions."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.rag.config.rag_config import rag_settings
+
+
+class SemanticCache:
+    """
+    LRU cache of policy answers keyed by query embedding.
+
+    Each embedding is reduced to a random-projection LSH signature (one sign
+    bit per hyperplane) and stored in that signature's bucket, so different
+    questions that share a signature sit side by side. A lookup walks the
+    buckets, skips those beyond a small Hamming distance without touching
+    their vectors, and confirms candidates with an exact cosine check before
+    reusing them. ``maxsize`` counts entries, not buckets.
+    """
+
+    __slots__ = (
+        "_planes",
+        "_scores",
+        "_bits",
+        "maxsize",
+        "min_similarity",
+        "max_hamming",
+        "_entries",
+        "_size",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        dim: int,
+        maxsize: int = 256,
+        min_similarity: float = 0.95,
+        max_hamming: int = 4,
+        num_planes: int = 64,
+        seed: int = 0,
+    ):
+        """Initialize the cache with a fixed set of random hyperplanes."""
+        rng = np.random.default_rng(seed)
+        self._planes = np.ascontiguousarray(
+            rng.standard_normal((num_planes, dim)), dtype=np.float32
+        )
+        # Reused projection buffers; only touched while holding ``_lock``
+        self._scores = np.empty(num_planes, dtype=np.float32)
+        self._bits = np.empty(num_planes, dtype=np.bool_)
+        self.maxsize = maxsize
+        self.min_similarity = min_similarity
+        self.max_hamming = max_hamming
+        self._entries: "OrderedDict[int, List[Tuple[np.ndarray, dict]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        # Warm up the BLAS/ufunc dispatch so the first real query isn't penalised
+        with self._lock:
+            self._signature(np.zeros(dim, dtype=np.float32))
+
+    def _signature(self, vector: np.ndarray) -> int:
+        """Pack the sign bits of the hyperplane projections into an int.
+
+        Writes into the preallocated buffers, so callers must hold ``_lock``.
+        """
+        np.dot(self._planes, vector, out=self._scores)
+        np.greater(self._scores, 0.0, out=self._bits)
+        return int.from_bytes(np.packbits(self._bits).tobytes(), "big")
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.ascontiguousarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if not norm:
+            return None
+        return vector / norm
+
+    def get(self, embedding: Sequence[float]) -> Optional[dict]:
+        """Return the cached result for a near-identical query, if any."""
+        if self.maxsize <= 0:
+            return None
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+        with self._lock:
+            signature = self._signature(vector)
+            for key, bucket in reversed(self._entries.items()):
+                if (key ^ signature).bit_count() > self.max_hamming:
+                    continue
+                for index in range(len(bucket) - 1, -1, -1):
+                    stored, result = bucket[index]
+                    if float(stored @ vector) >= self.min_similarity:
+                        bucket.append(bucket.pop(index))
+                        self._entries.move_to_end(key)
+                        return result
+        return None
+
+    def put(self, embedding: Sequence[float], result: dict) -> None:
+        """Store a successful result, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        with self._lock:
+            signature = self._signature(vector)
+            bucket = self._entries.setdefault(signature, [])
+            self._entries.move_to_end(signature)
+            # A near-identical question already in the bucket is replaced
+            for index, (stored, _) in enumerate(bucket):
+                if float(stored @ vector) >= self.min_similarity:
+                    del bucket[index]
+                    self._size -= 1
+                    break
+            bucket.append((vector, result))
+            self._size += 1
+            while self._size > self.maxsize:
+                oldest_key, oldest = next(iter(self._entries.items()))
+                oldest.pop(0)
+                self._size -= 1
+                if not oldest:
+                    del self._entries[oldest_key]
+
+    def clear(self) -> None:
+        """Drop every cached entry (e.g. after re-indexing policy documents)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Global cache instance (lazy loaded)
+_cache_instance: Optional[SemanticCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create global semantic cache instance.
+
+    Batcher executor threads may ask for it concurrently; a second instance
+    would silently drop whatever the first one stored.
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = SemanticCache(
+                    dim=rag_settings.EMBED_DIM,
+                    maxsize=rag_settings.SEMANTIC_CACHE_SIZE,
+                    min_similarity=rag_settings.SEMANTIC_CACHE_MIN_SIMILARITY,
+                    max_hamming=rag_settings.SEMANTIC_CACHE_MAX_HAMMING,
+                )
+    return _cache_instance
+
+
+__all__ = ["SemanticCache", "get_semantic_cache"]